@@ -0,0 +1,64 @@
+import threading
+from qgis.core import (QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsCsException, QgsRectangle)
+from .shp_header import read_prj
+
+
+class ExtentFilter:
+    """관심 영역(AOI)과 겹치지 않는 시트를 OGR로 열기 전에 걸러냅니다.
+
+    시트 범위는 .shp 헤더에서 읽은 값을 사용하고, 시트 좌표계는 .prj 파일에서
+    읽습니다. AOI는 좌표계마다 한 번만 변환하여 캐시합니다. .prj가 없는 시트는
+    AOI와 같은 좌표계로 간주합니다.
+    """
+
+    def __init__(self, rectangle, crs, transform_context):
+        """
+        Args:
+            rectangle: 관심 영역 (QgsRectangle)
+            crs: 관심 영역의 좌표계
+            transform_context: 좌표 변환 컨텍스트 (QgsProject.transformContext())
+        """
+        self.rectangle = QgsRectangle(rectangle)
+        self.crs = crs
+        self.transform_context = transform_context
+        self._lock = threading.Lock()
+        self._crs_by_prj = {}
+        self._aoi_by_crs = {}
+
+    def sheet_crs(self, match):
+        """시트의 .prj에서 좌표계를 읽습니다. .prj가 없거나 해석할 수 없으면 None."""
+        wkt = read_prj(match)
+        if wkt is None:
+            return None
+
+        with self._lock:
+            if wkt not in self._crs_by_prj:
+                crs = QgsCoordinateReferenceSystem.fromWkt(wkt)
+                self._crs_by_prj[wkt] = crs if crs.isValid() else None
+            return self._crs_by_prj[wkt]
+
+    def aoi_in(self, crs):
+        """관심 영역을 주어진 좌표계로 변환한 범위를 반환합니다. 변환할 수 없으면 None."""
+        if crs is None or crs == self.crs:
+            return self.rectangle
+
+        key = crs.toWkt()
+        with self._lock:
+            if key not in self._aoi_by_crs:
+                transform = QgsCoordinateTransform(self.crs, crs, self.transform_context)
+                try:
+                    self._aoi_by_crs[key] = transform.transformBoundingBox(self.rectangle)
+                except QgsCsException:
+                    self._aoi_by_crs[key] = None
+            return self._aoi_by_crs[key]
+
+    def intersects(self, match, header):
+        """시트 헤더 범위가 관심 영역과 겹치면 True를 반환합니다.
+
+        좌표 변환에 실패하면 시트를 제외하지 않습니다.
+        """
+        aoi = self.aoi_in(self.sheet_crs(match))
+        if aoi is None:
+            return True
+        return aoi.intersects(QgsRectangle(*header.bbox))
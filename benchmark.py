@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+로드 성능 벤치마크 스크립트
+
+Vworld 형식의 합성 도엽 폴더 트리(하위 폴더 N개, 폴더마다 Shapefile)를 만들고
+플러그인의 스캔, 헤더 검사, 레이어 열기, 프로젝트 등록 처리량을 측정합니다.
+QGIS Python 바인딩이 있으면 실제 OGR 레이어를 만들고, 없으면 헤더만 읽는
+스텁 레이어 팩토리로 측정합니다 (등록 단계는 건너뜀).
+
+결과를 기준값(baseline)으로 저장해 두고 다른 버전의 결과와 비교할 수 있습니다.
+
+사용법:
+    python benchmark.py                           # 10/100/1000/5000 시트 측정
+    python benchmark.py --sizes 10,100 --features 50
+    python benchmark.py --stub                    # QGIS 없이 측정
+    python benchmark.py --save-baseline           # benchmarks/baseline-{버전}.json 저장
+    python benchmark.py --compare benchmarks/baseline-0.1.0.json
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import platform
+import shutil
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+
+PLUGIN_DIR = Path(__file__).resolve().parent
+PACKAGE_NAME = 'gis_shp_loader'
+BASELINE_DIR = PLUGIN_DIR / 'benchmarks'
+
+DEFAULT_SIZES = [10, 100, 1000, 5000]
+
+# 합성 시트에 만드는 지형지물 종류 (파일 코드 → Shapefile 도형 유형)
+LAYER_TYPES = {
+    'A0010000': 5,  # 면
+    'A0020000': 3,  # 선
+    'A0030000': 1,  # 점
+}
+
+# EPSG:5186 (Korea 2000 / Central Belt 2010)
+PRJ_WKT = (
+    'PROJCS["Korea_2000_Korea_Central_Belt_2010",GEOGCS["GCS_Korea_2000",'
+    'DATUM["D_Korea_2000",SPHEROID["GRS_1980",6378137.0,298.257222101]],'
+    'PRIMEM["Greenwich",0.0],UNIT["Degree",0.0174532925199433]],'
+    'PROJECTION["Transverse_Mercator"],PARAMETER["False_Easting",200000.0],'
+    'PARAMETER["False_Northing",600000.0],PARAMETER["Central_Meridian",127.0],'
+    'PARAMETER["Scale_Factor",1.0],PARAMETER["Latitude_Of_Origin",38.0],UNIT["Meter",1.0]]'
+)
+
+SHEET_SIZE = 1000.0
+GRID_COLUMNS = 100
+
+
+# ---------------------------------------------------------------------------
+# 합성 Shapefile 생성
+# ---------------------------------------------------------------------------
+
+def shape_parts(shape_type, x, y, size):
+    """객체 하나의 좌표 목록 [(x, y)]를 만듭니다."""
+    if shape_type == 1:
+        return [(x + size / 2, y + size / 2)]
+    if shape_type == 3:
+        return [(x, y), (x + size, y + size)]
+    # 면은 시계 방향으로 닫힌 외곽선
+    return [(x, y), (x, y + size), (x + size, y + size), (x + size, y), (x, y)]
+
+
+def shape_record(shape_type, points):
+    """.shp 레코드 내용 (도형 유형 + 도형)을 만듭니다."""
+    if shape_type == 1:
+        return struct.pack('<idd', shape_type, *points[0])
+    xs = [point[0] for point in points]
+    ys = [point[1] for point in points]
+    content = struct.pack('<i4dii', shape_type, min(xs), min(ys), max(xs), max(ys), 1, len(points))
+    content += struct.pack('<i', 0)
+    for point in points:
+        content += struct.pack('<2d', *point)
+    return content
+
+
+def shp_header(file_length, shape_type, bbox):
+    """.shp/.shx 공통 100바이트 헤더를 만듭니다. file_length는 바이트 단위입니다."""
+    return (struct.pack('>7i', 9994, 0, 0, 0, 0, 0, file_length // 2)
+            + struct.pack('<2i', 1000, shape_type)
+            + struct.pack('<4d', *bbox)
+            + struct.pack('<4d', 0.0, 0.0, 0.0, 0.0))
+
+
+def dbf_bytes(records, encoding):
+    """ID(N,10), NAME(C,40) 필드를 가진 .dbf 내용을 만듭니다."""
+    fields = [(b'ID', b'N', 10), (b'NAME', b'C', 40)]
+    record_length = 1 + sum(length for _, _, length in fields)
+    header_length = 32 + 32 * len(fields) + 1
+    today = date.today()
+
+    data = struct.pack('<BBBBIHH20x', 0x03, today.year - 1900, today.month, today.day,
+                       len(records), header_length, record_length)
+    for name, field_type, length in fields:
+        data += struct.pack('<11sc4xBB14x', name, field_type, length, 0)
+    data += b'\r'
+    for feature_id, name in records:
+        encoded = name.encode(encoding)[:40]
+        data += b' ' + str(feature_id).rjust(10).encode('ascii') + encoded.ljust(40, b' ')
+    return data + b'\x1a'
+
+
+def write_shapefile(path, shape_type, origin, feature_count, encoding='cp949', write_cpg=True):
+    """순수 Python으로 .shp/.shx/.dbf/.prj(/.cpg)를 기록합니다."""
+    x0, y0 = origin
+    columns = max(1, int(feature_count ** 0.5 + 0.999))
+    size = SHEET_SIZE / columns
+    geometries = []
+    for index in range(feature_count):
+        x = x0 + (index % columns) * size
+        y = y0 + (index // columns) * size
+        geometries.append(shape_parts(shape_type, x, y, size * 0.8))
+
+    xs = [point[0] for points in geometries for point in points] or [x0]
+    ys = [point[1] for points in geometries for point in points] or [y0]
+    bbox = (min(xs), min(ys), max(xs), max(ys))
+
+    records = b''
+    index_entries = []
+    offset = 100
+    for number, points in enumerate(geometries, start=1):
+        content = shape_record(shape_type, points)
+        index_entries.append((offset // 2, len(content) // 2))
+        records += struct.pack('>2i', number, len(content) // 2) + content
+        offset += 8 + len(content)
+
+    base = os.path.splitext(path)[0]
+    with open(base + '.shp', 'wb') as f:
+        f.write(shp_header(100 + len(records), shape_type, bbox) + records)
+    with open(base + '.shx', 'wb') as f:
+        f.write(shp_header(100 + 8 * len(index_entries), shape_type, bbox))
+        for entry in index_entries:
+            f.write(struct.pack('>2i', *entry))
+    with open(base + '.dbf', 'wb') as f:
+        f.write(dbf_bytes([(i + 1, f"합성객체_{i + 1}") for i in range(feature_count)], encoding))
+    with open(base + '.prj', 'w', encoding='ascii') as f:
+        f.write(PRJ_WKT)
+    if write_cpg:
+        with open(base + '.cpg', 'w', encoding='ascii') as f:
+            f.write(encoding.upper())
+
+
+def generate_tree(root, sheet_count, feature_count, layer_codes):
+    """상위 폴더 아래에 시트(하위 폴더) sheet_count개를 만듭니다.
+
+    이미 같은 설정으로 만든 트리가 있으면 다시 만들지 않습니다.
+    """
+    marker = Path(root) / '.benchmark.json'
+    settings = {'sheets': sheet_count, 'features': feature_count, 'layers': layer_codes}
+    if marker.exists() and json.loads(marker.read_text(encoding='utf-8')) == settings:
+        return
+    if Path(root).exists():
+        shutil.rmtree(root)
+
+    for sheet in range(sheet_count):
+        sheet_name = f"3570{sheet:04d}"
+        folder = Path(root) / sheet_name
+        folder.mkdir(parents=True)
+        origin = (200000.0 + (sheet % GRID_COLUMNS) * SHEET_SIZE,
+                  500000.0 + (sheet // GRID_COLUMNS) * SHEET_SIZE)
+        for code in layer_codes:
+            # 절반은 .cpg 없이 만들어 인코딩 추정 경로도 측정합니다.
+            write_shapefile(folder / f"N3_{code}.shp", LAYER_TYPES[code], origin, feature_count,
+                            write_cpg=sheet % 2 == 0)
+    marker.write_text(json.dumps(settings), encoding='utf-8')
+
+
+# ---------------------------------------------------------------------------
+# 플러그인 모듈과 레이어 팩토리
+# ---------------------------------------------------------------------------
+
+def load_plugin_package():
+    """플러그인 폴더를 gis_shp_loader 패키지로 가져옵니다 (설치 없이 상대 import 사용)."""
+    if PACKAGE_NAME not in sys.modules:
+        spec = importlib.util.spec_from_file_location(
+            PACKAGE_NAME, PLUGIN_DIR / '__init__.py',
+            submodule_search_locations=[str(PLUGIN_DIR)])
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[PACKAGE_NAME] = module
+        spec.loader.exec_module(module)
+    return sys.modules[PACKAGE_NAME]
+
+
+def plugin_module(name):
+    """플러그인 하위 모듈을 가져옵니다."""
+    load_plugin_package()
+    return importlib.import_module(f"{PACKAGE_NAME}.{name}")
+
+
+class StubLayerFactory(plugin_module('loader_core').LayerFactory):
+    """QGIS 없이 검사한 헤더를 레이어 대신 반환하는 팩토리입니다. 등록 단계는 없습니다."""
+
+    name = 'stub'
+
+    def create(self, match, header, encoding):
+        return header
+
+    def register(self, layers):
+        return False
+
+
+class QgisLayerFactory(plugin_module('loader_core').LayerFactory):
+    """QGIS 바인딩으로 실제 OGR 레이어를 만들고 프로젝트에 등록하는 팩토리입니다."""
+
+    name = 'qgis'
+
+    def __init__(self):
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+        from qgis.core import Qgis, QgsApplication, QgsProject
+        self.app = QgsApplication([], False)
+        self.app.initQgis()
+        self.project = QgsProject.instance()
+        self.open_layer = plugin_module('load_task').open_layer
+        self.name = f"qgis {Qgis.QGIS_VERSION}"
+
+    def create(self, match, header, encoding):
+        return self.open_layer(match.path, match.name, encoding)
+
+    def register(self, layers):
+        # 플러그인의 일괄 등록과 같은 방식 (addMapLayers 한 번)
+        self.project.addMapLayers(layers, False)
+        self.project.removeAllMapLayers()
+        return True
+
+
+def create_factory(use_stub):
+    """QGIS를 사용할 수 있으면 QGIS 팩토리를, 아니면 스텁 팩토리를 반환합니다."""
+    if not use_stub:
+        try:
+            return QgisLayerFactory()
+        except ImportError:
+            print("⚠  QGIS Python 바인딩을 찾을 수 없어 스텁 레이어 팩토리로 측정합니다.")
+    return StubLayerFactory()
+
+
+# ---------------------------------------------------------------------------
+# 측정
+# ---------------------------------------------------------------------------
+
+def timed(function, *args):
+    """함수를 실행하여 (결과, 소요 시간)을 반환합니다."""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(root, pattern, factory, workers):
+    """한 트리에 대해 단계별 소요 시간과 처리량을 측정합니다.
+
+    scan/check/open은 단계를 나눠 차례로, stream은 플러그인처럼 스캔하는 동안
+    검사와 레이어 생성을 겹쳐 실행한 전체 시간입니다.
+    """
+    scanner_module = plugin_module('shp_scanner')
+    SheetLoader = plugin_module('loader_core').SheetLoader
+
+    def create_loader():
+        scanner = scanner_module.ShpScanner(
+            scanner_module.split_patterns(pattern), max_depth=1, max_workers=workers)
+        return SheetLoader(scanner, factory, workers)
+
+    loader = create_loader()
+    matches, scan_seconds = timed(lambda: list(loader.scanner.scan(str(root))))
+
+    def check_all():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            checks = list(executor.map(loader.check, matches))
+            encodings = list(executor.map(loader.detect_encoding, matches))
+        return [(match, header, encoding)
+                for match, (header, reason), encoding in zip(matches, checks, encodings)
+                if reason is None]
+
+    checked, check_seconds = timed(check_all)
+
+    def open_all():
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            created = executor.map(lambda args: factory.create(*args), checked)
+            return [layer for layer in created if layer is not None]
+
+    layers, open_seconds = timed(open_all)
+    registered, register_seconds = timed(factory.register, layers)
+
+    streamed = create_loader()
+    _, stream_seconds = timed(lambda: list(streamed.stream(str(root))))
+
+    phases = {'scan': scan_seconds, 'check': check_seconds, 'open': open_seconds,
+              'stream': stream_seconds}
+    if registered:
+        phases['register'] = register_seconds
+    return {
+        'sheets': len(matches),
+        'layers': len(layers),
+        'phases': {
+            name: {'seconds': seconds, 'per_second': len(matches) / seconds if seconds else None}
+            for name, seconds in phases.items()
+        },
+    }
+
+
+def read_version():
+    """metadata.txt에서 플러그인 버전을 읽습니다."""
+    metadata = (PLUGIN_DIR / 'metadata.txt').read_text(encoding='utf-8')
+    for line in metadata.splitlines():
+        if line.startswith('version='):
+            return line.split('=', 1)[1].strip()
+    return 'unknown'
+
+
+def print_results(results, baseline=None):
+    """측정 결과 표를 출력합니다. 기준값이 있으면 변화율을 함께 출력합니다."""
+    print(f"\n{'시트 수':>8}  {'단계':<10}{'시간(초)':>10}{'시트/초':>12}{'기준 대비':>12}")
+    print("-" * 56)
+    for size, result in results.items():
+        for phase, value in result['phases'].items():
+            change = ''
+            if baseline is not None:
+                base = baseline.get('results', {}).get(size, {}).get('phases', {}).get(phase)
+                if base and base['seconds']:
+                    change = f"{(value['seconds'] / base['seconds'] - 1) * 100:+.1f}%"
+            per_second = f"{value['per_second']:,.0f}" if value['per_second'] else '-'
+            print(f"{size:>8}  {phase:<10}{value['seconds']:>10.3f}{per_second:>12}{change:>12}")
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="GIS SHP Loader 로드 성능 벤치마크")
+    parser.add_argument('--sizes', default=','.join(map(str, DEFAULT_SIZES)),
+                        help="측정할 시트 수 (쉼표 구분)")
+    parser.add_argument('--features', type=int, default=100, help="Shapefile 하나의 객체 수")
+    parser.add_argument('--layers', default=','.join(LAYER_TYPES),
+                        help=f"시트마다 만들 지형지물 코드 (사용 가능: {', '.join(LAYER_TYPES)})")
+    parser.add_argument('--pattern', default='*_A0010000.shp', help="로드할 파일 이름 패턴")
+    parser.add_argument('--workers', type=int, default=8, help="동시 작업 수")
+    parser.add_argument('--workdir', help="합성 트리를 만들 폴더 (지정하면 다음 실행에 재사용)")
+    parser.add_argument('--stub', action='store_true', help="QGIS 없이 스텁 레이어 팩토리로 측정")
+    parser.add_argument('--save-baseline', nargs='?', const='', metavar='PATH',
+                        help="결과를 기준값으로 저장 (기본: benchmarks/baseline-{버전}.json)")
+    parser.add_argument('--compare', metavar='PATH', help="비교할 기준값 JSON 파일")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',') if size.strip()]
+    layer_codes = [code.strip() for code in args.layers.split(',') if code.strip()]
+    unknown = [code for code in layer_codes if code not in LAYER_TYPES]
+    if unknown:
+        print(f"❌ 알 수 없는 지형지물 코드: {', '.join(unknown)}")
+        return 1
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+
+    workdir = Path(args.workdir) if args.workdir else Path(tempfile.mkdtemp(prefix='shp_benchmark_'))
+    factory = create_factory(args.stub)
+    version = read_version()
+
+    print("\n" + "=" * 60)
+    print("  GIS SHP Loader 벤치마크")
+    print("=" * 60)
+    print(f"\n버전:       {version}")
+    print(f"팩토리:     {factory.name}")
+    print(f"시트당 객체: {args.features}개 × {len(layer_codes)}종")
+    print(f"작업 폴더:  {workdir}")
+
+    results = {}
+    try:
+        for size in sizes:
+            root = workdir / f"sheets_{size}_{args.features}"
+            _, generate_seconds = timed(generate_tree, root, size, args.features, layer_codes)
+            print(f"  ✓ 시트 {size:,}개 준비 ({generate_seconds:.1f}초)")
+            results[str(size)] = measure(root, args.pattern, factory, args.workers)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print_results(results, baseline)
+
+    if args.save_baseline is not None:
+        path = Path(args.save_baseline) if args.save_baseline else BASELINE_DIR / f"baseline-{version}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            'version': version,
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'factory': factory.name,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'features': args.features,
+            'layers': layer_codes,
+            'pattern': args.pattern,
+            'workers': args.workers,
+            'results': results,
+        }
+        path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+        print(f"\n기준값 저장: {path}")
+    return 0
+
+
+if __name__ == '__main__':
+    exit(main())
@@ -0,0 +1,103 @@
+import codecs
+import os
+import threading
+import zipfile
+from .shp_header import DBF_HEADER_SIZE, read_bytes
+
+
+# .cpg에 흔히 쓰이는 이름 → GDAL ENCODING 열기 옵션 값
+CPG_ALIASES = {
+    '949': 'CP949', 'CP949': 'CP949', 'MS949': 'CP949', 'UHC': 'CP949',
+    'EUC-KR': 'CP949', 'EUCKR': 'CP949', 'KS_C_5601-1987': 'CP949',
+    '65001': 'UTF-8', 'UTF8': 'UTF-8', 'UTF-8': 'UTF-8',
+}
+
+# 인코딩 추정에 읽는 .dbf 앞부분 크기 (바이트)
+DBF_SAMPLE_SIZE = 64 * 1024
+
+
+def normalize_encoding(name):
+    """.cpg 내용을 GDAL이 이해하는 인코딩 이름으로 바꿉니다. 비어 있으면 None."""
+    name = name.strip().upper()
+    if not name:
+        return None
+    if name in CPG_ALIASES:
+        return CPG_ALIASES[name]
+    # 숫자만 있으면 Windows 코드 페이지 번호입니다.
+    return f"CP{name}" if name.isdigit() else name
+
+
+def read_cpg(match):
+    """시트의 .cpg 파일에서 인코딩을 읽습니다. 없거나 읽을 수 없으면 None."""
+    cpg_path = match.sidecars.get('.cpg')
+    if cpg_path is None:
+        return None
+    try:
+        return normalize_encoding(read_bytes(cpg_path).decode('ascii', errors='ignore'))
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+
+
+def sniff_dbf(match):
+    """.dbf 앞부분을 읽어 UTF-8인지 CP949인지 추정합니다.
+
+    한글 등 비ASCII 바이트가 없으면 판단할 수 없으므로 None을 반환합니다.
+    """
+    dbf_path = match.sidecars.get('.dbf')
+    if dbf_path is None:
+        return None
+    try:
+        sample = read_bytes(dbf_path, DBF_SAMPLE_SIZE)[DBF_HEADER_SIZE:]
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    if max(sample, default=0) < 0x80:
+        return None
+
+    # 표본 끝에서 잘린 멀티바이트 문자는 오류로 보지 않습니다.
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return 'CP949'
+    return 'UTF-8'
+
+
+def layer_uri(path, encoding, subset=None):
+    """인코딩을 OGR 열기 옵션으로 붙인 레이어 URI를 반환합니다.
+
+    subset(하위 집합 문자열)은 '|'를 포함할 수 있으므로 항상 마지막에 붙입니다.
+    """
+    uri = path
+    if encoding:
+        uri += f"|option:ENCODING={encoding}"
+    if subset:
+        uri += f"|subset={subset}"
+    return uri
+
+
+class EncodingDetector:
+    """시트의 .dbf 인코딩을 레이어를 만들기 전에 결정합니다.
+
+    .cpg가 있으면 그 값을 쓰고, 없으면 같은 폴더에서 이미 정한 값을 쓰며,
+    폴더에서 처음 만난 시트만 .dbf 표본을 읽어 추정합니다. 결과를 열기 옵션으로
+    넘기면 QGIS가 인코딩을 잘못 추측하여 다시 읽는 일이 없습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_dir = {}
+
+    def detect(self, match):
+        """시트의 인코딩을 반환합니다. 정할 수 없으면 None."""
+        directory = os.path.dirname(match.path)
+        encoding = read_cpg(match)
+        if encoding is None:
+            with self._lock:
+                if directory in self._by_dir:
+                    return self._by_dir[directory]
+            encoding = sniff_dbf(match)
+            if encoding is None:
+                return None
+
+        with self._lock:
+            self._by_dir.setdefault(directory, encoding)
+        return encoding
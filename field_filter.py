@@ -0,0 +1,126 @@
+import codecs
+import os
+import re
+import struct
+import threading
+import zipfile
+from collections import Counter
+from .shp_header import DBF_HEADER_SIZE, read_bytes
+
+# .dbf 필드 설명자 크기와 설명자 목록 끝 표시
+DBF_FIELD_SIZE = 32
+DBF_FIELD_TERMINATOR = 0x0D
+
+
+def split_fields(text):
+    """쉼표나 공백으로 구분한 필드 이름을 중복 없이 입력 순서대로 반환합니다."""
+    fields = []
+    for name in re.split(r'[,\s]+', text or ''):
+        if name and name.lower() not in (field.lower() for field in fields):
+            fields.append(name)
+    return fields
+
+
+def read_dbf_fields(match, encoding=None):
+    """시트 .dbf 헤더의 필드 설명자에서 필드 이름 목록을 읽습니다. 읽을 수 없으면 None.
+
+    필드 이름은 encoding(.cpg나 .dbf 표본으로 정한 인코딩, 없으면 CP949)으로 읽습니다.
+    """
+    dbf_path = match.sidecars.get('.dbf')
+    if dbf_path is None:
+        return None
+    try:
+        head = read_bytes(dbf_path, DBF_HEADER_SIZE)
+        header_length, = struct.unpack('<H', head[8:10])
+        data = read_bytes(dbf_path, header_length)
+    except (OSError, KeyError, struct.error, zipfile.BadZipFile):
+        return None
+
+    try:
+        codec = codecs.lookup(encoding or 'cp949').name
+    except LookupError:
+        codec = 'cp949'
+    fields = []
+    for offset in range(DBF_HEADER_SIZE, len(data) - DBF_FIELD_SIZE + 1, DBF_FIELD_SIZE):
+        if data[offset] == DBF_FIELD_TERMINATOR:
+            break
+        name = data[offset:offset + 11].split(b'\0', 1)[0]
+        fields.append(name.decode(codec, errors='ignore').strip())
+    return fields
+
+
+def where_fields(where, names):
+    """OGR SQL WHERE 절에 쓰인 필드를 names에서 골라 반환합니다 (대소문자 구분 없음).
+
+    작은따옴표 문자열 안의 글자는 건너뛰고, 큰따옴표로 감싼 식별자와 따옴표 없는
+    단어를 필드 이름과 비교합니다. SetIgnoredFields로 읽지 않을 필드를 정할 때
+    조건에 쓰인 필드까지 빠지지 않도록 씁니다.
+    """
+    if not where:
+        return []
+    text = re.sub(r"'(?:[^']|'')*'", ' ', where)
+    used = {token.replace('""', '"').lower() for token in re.findall(r'"((?:[^"]|"")*)"', text)}
+    text = re.sub(r'"(?:[^"]|"")*"', ' ', text)
+    used.update(token.lower() for token in re.findall(r'\w+', text))
+    return [name for name in names if name.lower() in used]
+
+
+def quote_identifier(name):
+    """OGR SQL 식별자를 큰따옴표로 감쌉니다."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class FieldFilter:
+    """시트를 열 때 OGR에 넘길 필드 목록과 속성 조건(OGR SQL WHERE 절)입니다.
+
+    시트마다 .dbf 헤더에서 실제 필드 이름을 읽어 목록에 있는 필드만 고른
+    SELECT 문을 만듭니다. 이 문장을 레이어의 하위 집합 문자열(subset)이나 VRT의
+    SrcSQL로 넘기면 OGR이 쓰지 않는 필드를 읽지 않고 조건에 맞지 않는 객체를
+    QGIS로 넘기기 전에 걸러냅니다.
+
+    목록의 필드가 없는 시트 수는 missing({필드: 시트 수})에, 목록의 필드가 하나도
+    없어 모든 필드를 읽은 시트 수는 unmatched_count에 기록합니다.
+    """
+
+    def __init__(self, fields=None, where=None):
+        """
+        Args:
+            fields: 남길 필드 이름 목록 (대소문자 구분 없음, 비우면 모든 필드)
+            where: OGR SQL WHERE 절 (비우면 모든 객체)
+        """
+        self.fields = list(fields or [])
+        self.where = (where or '').strip() or None
+        self._lock = threading.Lock()
+        self.missing = Counter()
+        self.unmatched_count = 0
+
+    def fields_for(self, match, encoding=None):
+        """시트에서 남길 필드 이름을 .dbf에 적힌 대소문자 그대로 반환합니다.
+
+        필드 목록이 없거나 .dbf 헤더를 읽을 수 없거나 목록의 필드가 시트에 하나도
+        없으면 None(모든 필드)을 반환합니다. 작업 스레드에서 동시에 호출할 수 있습니다.
+        """
+        if not self.fields:
+            return None
+        dbf_fields = read_dbf_fields(match, encoding)
+        if dbf_fields is None:
+            return None
+        names = {name.lower(): name for name in dbf_fields}
+        selected = [names[field.lower()] for field in self.fields if field.lower() in names]
+        with self._lock:
+            for field in self.fields:
+                if field.lower() not in names:
+                    self.missing[field] += 1
+            if not selected:
+                self.unmatched_count += 1
+        return selected or None
+
+    def sql(self, match, encoding=None):
+        """시트 하나에 대한 OGR SQL SELECT 문을 반환합니다."""
+        fields = self.fields_for(match, encoding)
+        columns = ', '.join(quote_identifier(name) for name in fields) if fields else '*'
+        layer_name = os.path.splitext(os.path.basename(match.path))[0]
+        statement = f"SELECT {columns} FROM {quote_identifier(layer_name)}"
+        if self.where:
+            statement += f" WHERE {self.where}"
+        return statement
@@ -0,0 +1,122 @@
+import os
+from qgis.PyQt.QtCore import QVariant
+from qgis.core import (QgsCoordinateTransform, QgsCsException, QgsFeature, QgsField,
+                       QgsGeometry, QgsRectangle, QgsVectorFileWriter, QgsVectorLayer)
+from .lazy_layers import crs_from_wkt
+from .shp_scanner import split_vsizip
+
+# 도엽 색인 레이어 표시 (값은 시트를 등록할 그룹 이름)
+PROPERTY_FOOTPRINT = 'gis_shp_loader/footprint'
+
+# 로드된 시트의 상태 값 (건너뛴 시트는 건너뛴 사유의 표시 이름)
+STATUS_LOADED = "로드됨"
+
+# 도엽 색인 레이어 필드
+FOOTPRINT_FIELDS = [
+    ('folder', QVariant.String),
+    ('name', QVariant.String),
+    ('path', QVariant.String),
+    ('records', QVariant.Int),
+    ('size', QVariant.LongLong),
+    ('shape_type', QVariant.Int),
+    ('encoding', QVariant.String),
+    ('status', QVariant.String),
+]
+
+
+def sheet_folder(path):
+    """시트가 들어 있는 폴더 이름을 반환합니다. ZIP 내부 시트는 ZIP 안의 폴더나 ZIP 이름."""
+    zip_member = split_vsizip(path)
+    if zip_member is None:
+        return os.path.basename(os.path.dirname(path))
+    zip_path, member = zip_member
+    return os.path.basename(os.path.dirname(member)) or os.path.splitext(os.path.basename(zip_path))[0]
+
+
+def create_footprint_layer(name, entries, crs, transform_context):
+    """시트마다 .shp 헤더 범위 사각형 하나를 담은 도엽 색인 메모리 레이어를 만듭니다.
+
+    객체를 읽지 않고 헤더 범위만 쓰므로 시트 수천 개도 바로 만들어지며, 공간
+    인덱스를 만들어 두므로 클릭한 위치나 선택 영역의 시트를 빠르게 찾을 수 있습니다.
+    좌표계가 다른 시트의 범위는 crs로 변환합니다.
+
+    Args:
+        name: 레이어 이름
+        entries: [(ShpMatch, ShpHeader, .prj WKT, 인코딩, 상태)]
+        crs: 도엽 색인 레이어의 좌표계
+        transform_context: 좌표 변환 컨텍스트
+
+    Returns:
+        QgsVectorLayer: 도엽 색인 레이어
+    """
+    uri = "Polygon"
+    if crs.isValid():
+        uri += f"?crs={crs.authid()}" if crs.authid() else f"?crs=wkt:{crs.toWkt()}"
+    layer = QgsVectorLayer(uri, name, "memory")
+    provider = layer.dataProvider()
+    provider.addAttributes([QgsField(field_name, field_type) for field_name, field_type in FOOTPRINT_FIELDS])
+    layer.updateFields()
+
+    crs_cache = {}
+    transforms = {}
+    features = []
+    for match, header, wkt, encoding, status in entries:
+        geometry = QgsGeometry.fromRect(QgsRectangle(*header.bbox))
+        sheet_crs = crs_from_wkt(wkt, crs_cache)
+        if sheet_crs.isValid() and crs.isValid() and sheet_crs != crs:
+            if wkt not in transforms:
+                transforms[wkt] = QgsCoordinateTransform(sheet_crs, crs, transform_context)
+            try:
+                geometry.transform(transforms[wkt])
+            except QgsCsException:
+                continue
+
+        feature = QgsFeature(layer.fields())
+        feature.setGeometry(geometry)
+        feature.setAttributes([
+            sheet_folder(match.path), match.name, match.path, header.record_count,
+            match.size, header.shape_type, encoding or '', status,
+        ])
+        features.append(feature)
+
+    provider.addFeatures(features)
+    provider.createSpatialIndex()
+    layer.updateExtents()
+    layer.setCustomProperty(PROPERTY_FOOTPRINT, '')
+    return layer
+
+
+def save_footprint_layer(layer, path, transform_context):
+    """도엽 색인 메모리 레이어를 GeoPackage로 저장하고 저장한 테이블을 엽니다.
+
+    메모리 레이어는 프로젝트에 객체가 저장되지 않으므로, 다시 열어도 시트를
+    선택하거나 클릭하여 로드할 수 있도록 파일로 저장합니다. 상태 필드의 변경도
+    파일에 기록됩니다. 저장하거나 열지 못하면 None을 반환합니다.
+
+    Args:
+        layer: create_footprint_layer로 만든 레이어
+        path: GeoPackage 경로 (있으면 덮어씀)
+        transform_context: 좌표 변환 컨텍스트
+
+    Returns:
+        QgsVectorLayer: GeoPackage 테이블의 도엽 색인 레이어 또는 None
+    """
+    if hasattr(QgsVectorFileWriter, 'writeAsVectorFormatV2'):
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = 'GPKG'
+        options.fileEncoding = 'UTF-8'
+        options.layerName = layer.name()
+        result = QgsVectorFileWriter.writeAsVectorFormatV2(layer, path, transform_context, options)
+        table_name = layer.name()
+    else:
+        # QGIS 3.10 미만은 테이블 이름을 지정할 수 없어 파일 이름을 씁니다.
+        result = QgsVectorFileWriter.writeAsVectorFormat(layer, path, 'UTF-8', layer.crs(), 'GPKG')
+        table_name = os.path.splitext(os.path.basename(path))[0]
+    if result[0] != QgsVectorFileWriter.NoError:
+        return None
+
+    saved = QgsVectorLayer(f"{path}|layername={table_name}", layer.name(), "ogr")
+    if not saved.isValid():
+        return None
+    saved.setCustomProperty(PROPERTY_FOOTPRINT, '')
+    return saved
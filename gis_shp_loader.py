@@ -1,8 +1,29 @@
 import os
-from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox
+import time
+from collections import Counter
+from qgis.PyQt.QtCore import QEventLoop
+from qgis.PyQt.QtWidgets import QAction, QFileDialog, QMessageBox, QProgressBar, QPushButton
 from qgis.PyQt.QtGui import QIcon
-from qgis.core import QgsProject, QgsVectorLayer
+from qgis.core import (Qgis, QgsApplication, QgsCoordinateTransform, QgsCsException,
+                       QgsFeatureRequest, QgsMessageLog, QgsProject, QgsRectangle)
+from qgis.gui import QgsMapTool, QgsMapToolEmitPoint, QgsMapToolExtent
+from .aoi_filter import ExtentFilter
+from .field_filter import FieldFilter, split_fields
+from .footprint_layer import PROPERTY_FOOTPRINT, STATUS_LOADED
 from .gis_shp_loader_dialog import GisShpLoaderDialog
+from .layer_registry import register_layers
+from .lazy_layers import LazyLayerManager, create_placeholder, crs_from_wkt
+from .load_task import ShpLoadTask, open_layer
+from .processing_provider import GisShpLoaderProvider
+from .project_restore import (PROPERTY_ORIGIN, file_mtime, restore_layers, stamp_layer,
+                              trust_project, write_sources)
+from .reprojector import Reprojector
+from .run_report import write_report
+from .shared_style import SharedStyle, StyleFile, apply_shared_style
+from .scan_cache import ScanManifest
+from .shp_header import REASON_LABELS
+from .shp_scanner import ShpMatch, ShpScanner, safe_file_name, split_patterns
+from .watch_mode import SheetWatcher
 
 class GisShpLoader:
     def __init__(self, iface):
@@ -10,18 +31,76 @@ class GisShpLoader:
         self.plugin_dir = os.path.dirname(__file__)
         self.actions = []
         self.dialog = None
+        self.task = None
+        self.progress_item = None
+        self.group_name = None
+        self.lazy_manager = None
+        self.max_open_layers = 200
+        self.trust_statistics = False
+        self.provider = None
+        self.report_path = None
+        self.shared_style = None
+        self.overview_scale = None
+        # 감시 모드: (상위 폴더, 파일 이름, 설정값, 관심 영역, 공유 스타일), 로드한 시트
+        # {경로: (크기, 수정 시각, 레이어 ID)}
+        self.watcher = None
+        self.watch_args = None
+        self.watch_layers = {}
+        self.watch_pending = False
+        self.watch_item = None
+        # 도엽 색인에서 클릭한 시트를 로드하는 지도 도구
+        self.footprint_tool = None
+
+    def initProcessing(self):
+        """Processing 공급자를 등록합니다. qgis_process에서는 이 메서드만 호출됩니다."""
+        if self.provider is None:
+            self.provider = GisShpLoaderProvider()
+            QgsApplication.processingRegistry().addProvider(self.provider)
 
     def initGui(self):
         """QGIS 플러그인 인터페이스가 시작될 때 호출됩니다."""
+        self.initProcessing()
+        project = QgsProject.instance()
+        project.writeProject.connect(self.on_project_write)
+        project.readProject.connect(self.on_project_read)
         icon_path = os.path.join(self.plugin_dir, 'icon.png')
         self.add_action(
             icon_path,
             text="SHP 파일 로더",
             callback=self.run,
             parent=self.iface.mainWindow())
+        self.add_action(
+            icon_path,
+            text="선택한 도엽 로드",
+            callback=self.load_selected_footprints,
+            parent=self.iface.mainWindow())
+        click_action = self.add_action(
+            icon_path,
+            text="클릭한 도엽 로드",
+            callback=self.activate_footprint_tool,
+            parent=self.iface.mainWindow())
+        click_action.setCheckable(True)
+        self.footprint_tool = QgsMapToolEmitPoint(self.iface.mapCanvas())
+        self.footprint_tool.setAction(click_action)
+        self.footprint_tool.canvasClicked.connect(self.on_footprint_clicked)
 
     def unload(self):
         """플러그인이 제거될 때 호출됩니다."""
+        self.stop_watch()
+        if self.footprint_tool is not None:
+            self.iface.mapCanvas().unsetMapTool(self.footprint_tool)
+            self.footprint_tool = None
+        project = QgsProject.instance()
+        project.writeProject.disconnect(self.on_project_write)
+        project.readProject.disconnect(self.on_project_read)
+        if self.task is not None:
+            self.task.cancel()
+        if self.lazy_manager is not None:
+            self.lazy_manager.disconnect_signals()
+            self.lazy_manager = None
+        if self.provider is not None:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
+            self.provider = None
         for action in self.actions:
             self.iface.removePluginMenu("SHP 로더", action)
             self.iface.removeToolBarIcon(action)
@@ -40,6 +119,14 @@ class GisShpLoader:
 
     def run(self):
         """플러그인 기능이 실행될 때 호출됩니다."""
+        if self.task is not None:
+            QMessageBox.warning(
+                self.iface.mainWindow(),
+                "경고",
+                "이미 로드 작업이 진행 중입니다."
+            )
+            return
+
         # 대화상자 생성 및 표시
         self.dialog = GisShpLoaderDialog(self.iface.mainWindow())
         
@@ -48,13 +135,19 @@ class GisShpLoader:
         if os.path.exists(default_path):
             self.dialog.folder_edit.setText(default_path)
             
+        # 사각형 그리기를 요청하면 지도에서 범위를 받은 뒤 대화상자를 다시 엽니다.
+        result = self.dialog.exec_()
+        while result == GisShpLoaderDialog.DRAW_EXTENT:
+            self.draw_extent()
+            result = self.dialog.exec_()
+            
         # 대화상자가 확인(OK)으로 종료되면 처리 시작
-        if self.dialog.exec_():
+        if result:
             values = self.dialog.get_values()
             base_folder = values['folder']
             file_name = values['filename']
             
-            if not base_folder or not file_name:
+            if not base_folder or not split_patterns(file_name, values['regex']):
                 QMessageBox.warning(
                     self.iface.mainWindow(),
                     "경고",
@@ -69,54 +162,658 @@ class GisShpLoader:
                     f"지정한 경로가 존재하지 않습니다: {base_folder}"
                 )
                 return
-                
-            # 하위 폴더 목록 가져오기
-            try:
-                subfolders = [f for f in os.listdir(base_folder) 
-                              if os.path.isdir(os.path.join(base_folder, f))]
-            except Exception as e:
-                QMessageBox.critical(
+            
+            extent_filter = None
+            if values['aoi_mode'] != 'none':
+                extent_filter = self.create_extent_filter(values)
+                if extent_filter is None:
+                    return
+            
+            shared_style = None
+            if values['style_mode'] != 'none':
+                shared_style = self.create_shared_style(values)
+                if shared_style is None:
+                    return
+            
+            # 새로 로드하면 이전 감시는 멈춥니다.
+            self.stop_watch()
+            if values['watch']:
+                self.watch_args = (base_folder, file_name, values, extent_filter, shared_style)
+            
+            # 하위 폴더를 스캔하면서 SHP 파일을 백그라운드로 로드
+            self.start_load_task(base_folder, file_name, values, extent_filter, shared_style)
+
+    def draw_extent(self):
+        """지도에서 사각형을 그려 관심 영역으로 설정합니다."""
+        canvas = self.iface.mapCanvas()
+        previous_tool = canvas.mapTool()
+        tool = QgsMapToolExtent(canvas)
+        loop = QEventLoop()
+
+        def on_extent_changed(rectangle):
+            if not rectangle.isEmpty():
+                self.dialog.set_drawn_extent(rectangle, canvas.mapSettings().destinationCrs())
+            loop.quit()
+
+        tool.extentChanged.connect(on_extent_changed)
+        tool.deactivated.connect(loop.quit)
+        canvas.setMapTool(tool)
+        self.iface.messageBar().pushMessage(
+            "SHP 로더", "지도에서 관심 영역 사각형을 그려주세요.", level=Qgis.Info, duration=3)
+        loop.exec_()
+
+        tool.deactivated.disconnect(loop.quit)
+        if previous_tool is not None:
+            canvas.setMapTool(previous_tool)
+        else:
+            canvas.unsetMapTool(tool)
+
+    def create_shared_style(self, values):
+        """대화상자에서 고른 공유 스타일을 만듭니다. 실패하면 None.
+
+        기존 레이어에서 복사할 때는 지금 스타일을 복제해 두므로, 로드 중에 원본
+        레이어의 스타일을 바꾸거나 레이어를 지워도 영향이 없습니다.
+        """
+        if values['style_mode'] == 'file':
+            path = values['style_path']
+            if not path or not os.path.isfile(path) or \
+                    os.path.splitext(path)[1].lower() not in ('.qml', '.sld'):
+                QMessageBox.warning(
+                    self.iface.mainWindow(), "경고", "QML 또는 SLD 스타일 파일을 선택해주세요.")
+                return None
+            return StyleFile(path)
+
+        layer = values['style_layer']
+        shared_style = SharedStyle.from_layer(layer) if layer is not None else None
+        if shared_style is None:
+            QMessageBox.warning(
+                self.iface.mainWindow(), "경고", "스타일을 복사할 벡터 레이어를 선택해주세요.")
+        return shared_style
+
+    def create_extent_filter(self, values):
+        """대화상자에서 고른 관심 영역으로 ExtentFilter를 만듭니다. 실패하면 None."""
+        mode = values['aoi_mode']
+        if mode == 'canvas':
+            canvas = self.iface.mapCanvas()
+            rectangle = canvas.extent()
+            crs = canvas.mapSettings().destinationCrs()
+        elif mode == 'selection':
+            layer = values['aoi_layer']
+            if layer is None or layer.selectedFeatureCount() == 0:
+                QMessageBox.warning(
                     self.iface.mainWindow(),
-                    "오류",
-                    f"폴더 목록을 가져오는 중 오류가 발생했습니다: {str(e)}"
+                    "경고",
+                    "관심 영역으로 사용할 레이어에 선택된 객체가 없습니다."
                 )
-                return
-            
-            if not subfolders:
+                return None
+            rectangle = layer.boundingBoxOfSelected()
+            crs = layer.crs()
+        else:
+            if values['aoi_extent'] is None:
                 QMessageBox.warning(
                     self.iface.mainWindow(),
                     "경고",
-                    "선택한 경로에 하위 폴더가 없습니다."
+                    "지도에서 관심 영역 사각형을 먼저 그려주세요."
                 )
+                return None
+            rectangle, crs = values['aoi_extent']
+
+        return ExtentFilter(rectangle, crs, QgsProject.instance().transformContext())
+
+    def start_load_task(self, base_folder, file_name, values, extent_filter=None, shared_style=None,
+                        known=None):
+        """로드 작업을 작업 관리자에 등록하고 진행 표시줄을 띄웁니다.
+
+        known({경로: (크기, 수정 시각)})이 주어지면 감시 모드의 증분 로드로 보고
+        새 시트와 바뀐 시트만 진행 표시줄 없이 로드합니다.
+        """
+        manifest = None
+        if values['use_cache']:
+            manifest = ScanManifest(os.path.join(self.data_dir(), 'scan_cache.sqlite'), base_folder)
+
+        # 여러 파일 이름을 한 번의 스캔으로 찾습니다. 감시 모드와 좌표계 변환 캐시는
+        # 제자리에서 덮어쓴 시트를 알아봐야 하므로 파일 크기와 수정 시각을 캐시에서 가져오지 않습니다.
+        patterns = split_patterns(file_name, values['regex'])
+        scanner = ShpScanner(
+            patterns,
+            max_depth=values['max_depth'],
+            use_regex=values['regex'],
+            max_workers=values['workers'],
+            manifest=manifest,
+            scan_zips=values['scan_zips'],
+            stat_files=values['watch'] or values['reproject'])
+
+        # 필드 목록이나 속성 조건이 있으면 OGR에서 먼저 걸러냅니다.
+        field_filter = None
+        fields = split_fields(values['fields'])
+        if fields or values['where'].strip():
+            field_filter = FieldFilter(fields, values['where'])
+
+        # 출력 이름 설정 (상위폴더명_파일명, 파일이 여러 개면 상위폴더명)
+        folder_name = os.path.basename(os.path.normpath(base_folder))
+        if len(patterns) == 1:
+            output_name = f"{folder_name}_{os.path.splitext(patterns[0])[0]}"
+        else:
+            output_name = folder_name
+
+        output_path = values['output_path'] or None
+        if values['output_mode'] == 'vrt':
+            output_path = self.data_dir('vrt')
+        elif values['output_mode'] == 'gpkg' and not output_path:
+            output_path = os.path.join(self.data_dir('gpkg'), f"{safe_file_name(output_name)}.gpkg")
+
+        # 좌표계가 다른 시트는 대상 좌표계로 변환하여 캐시합니다.
+        reprojector = None
+        if values['reproject']:
+            target_crs = values['target_crs']
+            assumed_crs = values['assumed_crs']
+            reprojector = Reprojector(
+                target_crs.authid() or target_crs.toWkt(),
+                self.data_dir('reprojected'),
+                assumed=(assumed_crs.authid() or assumed_crs.toWkt()) if assumed_crs is not None else None)
+
+        # 개요 레이어는 첫 로드에서만 만들고, 감시 모드의 증분 로드는 축척 설정만 따릅니다.
+        overview_path = None
+        if values['overview'] and known is None:
+            overview_path = os.path.join(self.data_dir('overview'), f"{safe_file_name(output_name)}.gpkg")
+
+        # 도엽 색인도 첫 로드에서만 만듭니다.
+        footprint_name = None
+        footprint_path = None
+        if values['footprints'] and known is None:
+            footprint_name = f"{output_name}_도엽색인"
+            footprint_path = os.path.join(self.data_dir('footprints'), f"{safe_file_name(output_name)}.gpkg")
+
+        self.task = ShpLoadTask(
+            base_folder, scanner, values['workers'],
+            output_mode=values['output_mode'],
+            output_path=output_path,
+            output_name=folder_name,
+            build_indexes=values['build_indexes'],
+            extent_filter=extent_filter,
+            skip_duplicates=values['skip_duplicates'],
+            known=known,
+            field_filter=field_filter,
+            overview_path=overview_path,
+            overview_tolerance=values['overview_tolerance'],
+            reprojector=reprojector,
+            footprint_name=footprint_name,
+            footprint_path=footprint_path)
+        self.max_open_layers = values['max_open']
+        self.trust_statistics = values['trust_statistics']
+        self.overview_scale = values['overview_scale'] if values['overview'] else None
+        self.shared_style = shared_style
+        self.report_path = None
+        if values['write_report'] and known is None:
+            self.report_path = os.path.join(
+                self.data_dir('reports'), f"{folder_name}_{time.strftime('%Y%m%d_%H%M%S')}.json")
+        if values['group'] and values['output_mode'] in ('layers', 'lazy'):
+            self.group_name = output_name
+        else:
+            self.group_name = None
+        if known is not None:
+            self.task.taskCompleted.connect(self.on_watch_completed)
+            self.task.taskTerminated.connect(self.on_watch_terminated)
+            QgsApplication.taskManager().addTask(self.task)
+            return
+        self.task.taskCompleted.connect(self.on_load_completed)
+        self.task.taskTerminated.connect(self.on_load_terminated)
+        self.show_progress(self.task)
+        QgsApplication.taskManager().addTask(self.task)
+
+    def data_dir(self, *parts):
+        """플러그인이 생성하는 파일을 저장할 사용자 설정 폴더를 반환합니다."""
+        path = os.path.join(QgsApplication.qgisSettingsDirPath(), 'gis_shp_loader', *parts)
+        os.makedirs(path, exist_ok=True)
+        return path
+
+    def show_progress(self, task):
+        """메시지 바에 진행 표시줄과 취소 버튼을 표시합니다."""
+        message_bar = self.iface.messageBar()
+        widget = message_bar.createMessage("SHP 로더", "Shapefile을 로드하는 중...")
+
+        progress_bar = QProgressBar()
+        progress_bar.setRange(0, 100)
+        task.progressChanged.connect(lambda value: progress_bar.setValue(int(value)))
+
+        cancel_button = QPushButton("취소")
+        cancel_button.clicked.connect(task.cancel)
+
+        widget.layout().addWidget(progress_bar)
+        widget.layout().addWidget(cancel_button)
+        self.progress_item = message_bar.pushWidget(widget, Qgis.Info)
+
+    def clear_progress(self):
+        """진행 표시줄을 제거합니다."""
+        if self.progress_item is not None:
+            self.iface.messageBar().popWidget(self.progress_item)
+            self.progress_item = None
+
+    def on_load_completed(self):
+        """로드 작업이 끝나면 메인 스레드에서 레이어를 등록합니다."""
+        task = self.task
+        self.task = None
+        self.clear_progress()
+
+        if not task.scanner.top_folders:
+            # 하위 폴더가 아직 없어도 감시는 시작하여 들어오는 시트를 기다립니다.
+            if self.watch_args is not None:
+                self.start_watch(task)
+            QMessageBox.warning(
+                self.iface.mainWindow(),
+                "경고",
+                "선택한 경로에 하위 폴더가 없습니다."
+            )
+            return
+
+        styled_count = self.add_task_layers(task)
+
+        # 보고서 정보는 작업 객체가 정리되기 전에 모아 둡니다.
+        report_info = {
+            'root': task.base_folder,
+            'output_mode': task.output_mode,
+            'patterns': task.scanner.patterns,
+            'layer_count': len(task.layers),
+            'error_count': task.error_count,
+            'duplicates': [{'path': path, 'original': original} for path, original in task.loader.duplicates],
+        }
+        for path, original in task.loader.duplicates:
+            QgsMessageLog.logMessage(f"중복 시트 제외: {path} (같은 내용: {original})", "SHP 로더", Qgis.Info)
+        if task.layers:
+            self.watch_first_render(task.timer, task.matches, report_info, self.report_path)
+        else:
+            self.finish_report(task.timer, task.matches, report_info, self.report_path)
+        if self.watch_args is not None:
+            self.start_watch(task)
+
+        # 결과 메시지 표시
+        lines = self.summary_lines(task)
+        if styled_count:
+            lines.append(f"- {styled_count}개 레이어에 공유 스타일 적용")
+        if self.watcher is not None:
+            lines.append("- 감시 모드: 새로 들어오거나 바뀐 시트를 자동으로 로드합니다")
+        QMessageBox.information(
+            self.iface.mainWindow(),
+            "완료",
+            "작업 완료:\n" + "\n".join(lines)
+        )
+
+    def add_task_layers(self, task, reuse_group=False):
+        """작업 결과 레이어에 공유 스타일을 적용하고 프로젝트에 등록합니다.
+
+        Returns:
+            int: 공유 스타일을 적용한 레이어 수
+        """
+        if task.output_mode == 'lazy':
+            task.layers = self.create_placeholders(task)
+        # 파일 이름이 여러 개면 그룹 안에 지형지물 종류별 하위 그룹을 만듭니다.
+        subgroup_names = None
+        if len(task.scanner.patterns) > 1:
+            subgroup_names = [os.path.splitext(pattern)[0] for pattern in task.layer_patterns]
+        # 스타일은 등록 전에 적용하여 다시 그리기를 등록 후 한 번으로 줄입니다.
+        styled_count = 0
+        if self.shared_style is not None and task.layers:
+            with task.timer.phase('style'):
+                styled_count = apply_shared_style(task.layers, self.shared_style)
+            errors = self.shared_style.errors if isinstance(self.shared_style, StyleFile) else []
+            for message in errors:
+                self.iface.messageBar().pushMessage(
+                    "SHP 로더", f"스타일을 읽을 수 없습니다: {message}", level=Qgis.Warning)
+        # 프로젝트를 다시 열 때 바뀐 시트만 다시 계산하도록 이미 알고 있는 시트 정보를 레이어에 기록합니다.
+        if task.output_mode in ('layers', 'lazy') and task.layers:
+            for match, layer in zip(task.valid_matches, task.layers):
+                stamp_layer(layer, match, task.encodings.get(match.path))
+            if self.trust_statistics:
+                trust_project(QgsProject.instance())
+        if self.overview_scale is not None:
+            self.apply_overview_scales(task.layers, task.overview_layers, self.overview_scale)
+        with task.timer.phase('register'):
+            register_layers(self.iface, task.layers, self.group_name, subgroup_names, reuse_group)
+            # 개요와 도엽 색인 레이어는 시트 레이어와 같은 그룹에 넣습니다.
+            register_layers(self.iface, task.overview_layers, self.group_name, reuse_group=True)
+            if task.footprint_layer is not None:
+                task.footprint_layer.setCustomProperty(PROPERTY_FOOTPRINT, self.group_name or '')
+                register_layers(self.iface, [task.footprint_layer], self.group_name, reuse_group=True)
+        if task.output_mode == 'lazy' and task.layers:
+            self.adopt_lazy_layers(task.layers)
+        return styled_count
+
+    def adopt_lazy_layers(self, layers):
+        """자리표시자 레이어를 지연 로드 관리자에 맡깁니다."""
+        if self.lazy_manager is None:
+            self.lazy_manager = LazyLayerManager(self.iface)
+        self.lazy_manager.max_open = self.max_open_layers
+        self.lazy_manager.adopt(layers)
+
+    def on_project_write(self, doc):
+        """프로젝트를 저장할 때 지연 로드 자리표시자도 원본 데이터 원본으로 저장합니다."""
+        write_sources(doc, QgsProject.instance().mapLayers())
+
+    def on_project_read(self, doc):
+        """프로젝트를 연 뒤 바뀐 시트의 범위를 다시 계산하고 지연 로드 시트를 다시 관리합니다.
+
+        나머지 시트는 프로젝트에 저장된 범위를 그대로 씁니다.
+        """
+        layers, changed, missing = restore_layers(QgsProject.instance().mapLayers().values())
+        if layers:
+            self.adopt_lazy_layers(layers)
+            self.iface.messageBar().pushMessage(
+                "SHP 로더",
+                f"시트 레이어 {len(layers)}개를 지연 로드로 복원함 (바뀐 시트 {len(changed)}개 다시 검사)",
+                level=Qgis.Info)
+        elif changed:
+            self.iface.messageBar().pushMessage(
+                "SHP 로더", f"저장 후 바뀐 시트 {len(changed)}개의 범위를 다시 계산함", level=Qgis.Info)
+        for path in changed:
+            QgsMessageLog.logMessage(f"저장 후 바뀐 시트: {path}", "SHP 로더", Qgis.Info)
+        if missing:
+            for path in missing:
+                QgsMessageLog.logMessage(f"원본을 찾거나 읽을 수 없는 시트: {path}", "SHP 로더", Qgis.Warning)
+            self.iface.messageBar().pushMessage(
+                "SHP 로더",
+                f"원본을 찾을 수 없는 시트 {len(missing)}개 (목록은 로그 메시지 패널 참고)",
+                level=Qgis.Warning)
+
+    def apply_overview_scales(self, layers, overview_layers, scale):
+        """개요 레이어는 scale보다 축소했을 때만, 시트 레이어는 그보다 확대했을 때만 그립니다."""
+        for layer in layers:
+            layer.setScaleBasedVisibility(True)
+            layer.setMinimumScale(scale)
+        for layer in overview_layers:
+            layer.setScaleBasedVisibility(True)
+            layer.setMinimumScale(0)
+            layer.setMaximumScale(scale)
+
+    def create_placeholders(self, task):
+        """지연 로드 작업 결과로 자리표시자 레이어를 만듭니다."""
+        crs_cache = {}
+        layers = []
+        for match in task.valid_matches:
+            # 좌표계를 변환한 시트는 변환 결과를 원본으로 씁니다.
+            source = task.source_match(match)
+            layers.append(create_placeholder(
+                source, task.headers[match.path],
+                crs_from_wkt(task.prj_wkts.get(match.path), crs_cache),
+                task.encodings.get(source.path),
+                task.subsets.get(match.path)))
+        return layers
+
+    def summary_lines(self, task):
+        """로드 결과 요약 메시지의 각 줄을 반환합니다."""
+        if task.output_mode == 'vrt':
+            lines = [f"- {len(task.valid_matches)}개 파일을 VRT 통합 레이어 {len(task.layers)}개로 로드됨"]
+        elif task.output_mode == 'gpkg':
+            lines = [f"- {task.merged_count}개 파일의 객체 "
+                     f"{task.feature_count:,}개를 GeoPackage로 병합함"]
+        elif task.output_mode == 'lazy':
+            lines = [f"- {len(task.layers)}개 파일을 지연 로드 자리표시자로 등록함"]
+        else:
+            lines = [f"- {len(task.layers)}개 파일 로드됨"]
+
+        if len(task.scanner.patterns) > 1:
+            class_counts = Counter(match.pattern for match in task.valid_matches)
+            for pattern in task.scanner.patterns:
+                lines.append(f"    · {pattern}: {class_counts[pattern]}개")
+
+        lines.append(f"- {task.error_count}개 파일 로드 실패")
+        for reason, count in task.error_reasons.most_common():
+            lines.append(f"    · {REASON_LABELS.get(reason, reason)}: {count}개")
+        lines.append(f"- {task.not_found_count}개 파일 찾지 못함")
+        if task.extent_filter is not None:
+            lines.append(f"- {task.outside_count}개 파일 관심 영역 밖이라 건너뜀")
+        if task.field_filter is not None:
+            field_text = ', '.join(task.field_filter.fields) if task.field_filter.fields else "모든 필드"
+            lines.append(f"- 필드·속성 필터: {field_text}"
+                         + (f" / 조건: {task.field_filter.where}" if task.field_filter.where else ""))
+            for field, count in task.field_filter.missing.most_common():
+                lines.append(f"    · '{field}' 필드가 없는 시트: {count}개")
+            if task.field_filter.unmatched_count:
+                lines.append(f"    · 목록의 필드가 하나도 없어 모든 필드를 읽은 시트: "
+                             f"{task.field_filter.unmatched_count}개")
+        if task.reprojector is not None:
+            reprojector = task.reprojector
+            lines.append(f"- 좌표계 변환: {reprojector.converted_count}개 변환, "
+                         f"{reprojector.reused_count}개 이전 변환 결과 재사용")
+            for name, count in reprojector.crs_counts.most_common():
+                lines.append(f"    · {name}: {count}개")
+        if task.footprint_layer is not None:
+            lines.append(f"- 도엽 색인 레이어: 시트 {task.footprint_layer.featureCount()}개 "
+                         f"(선택하거나 클릭하여 시트를 로드할 수 있음)")
+            if task.footprint_layer.providerType() == 'memory':
+                lines.append("    · GeoPackage로 저장하지 못해 임시 레이어로 만듦 (프로젝트를 다시 열면 비어 있음)")
+        if task.overview_layers:
+            lines.append(f"- 개요 레이어 {len(task.overview_layers)}개 생성 "
+                         f"(1:{self.overview_scale:,}보다 축소하면 개요를 표시)")
+        if task.duplicate_count:
+            lines.append(f"- {task.duplicate_count}개 중복 시트 제외 (목록은 로그 메시지 패널 참고)")
+        if task.scanner.manifest is not None:
+            lines.append(f"- 스캔 캐시: 폴더 {task.scanner.manifest.hit_count}개 재사용, "
+                         f"{task.scanner.manifest.miss_count}개 새로 읽음")
+        if task.scanner.errors:
+            lines.append(f"- {len(task.scanner.errors)}개 폴더 읽기 실패")
+        if task.build_indexes:
+            lines.append(f"- 공간 인덱스(.qix) {task.index_built_count}개 생성, "
+                         f"{task.index_failed_count}개 실패")
+        lines.append(f"- 소요 시간: {task.timer.elapsed():.1f}초 (단계별 시간은 로그 메시지 패널 참고)")
+        return lines
+
+    def watch_first_render(self, timer, matches, report_info, report_path):
+        """등록 후 첫 지도 렌더링이 끝나면 시간을 기록하고 보고서를 마무리합니다."""
+        canvas = self.iface.mapCanvas()
+        start = time.perf_counter()
+
+        def on_rendered():
+            canvas.mapCanvasRefreshed.disconnect(on_rendered)
+            timer.add('render', time.perf_counter() - start, start=start)
+            self.finish_report(timer, matches, report_info, report_path)
+
+        canvas.mapCanvasRefreshed.connect(on_rendered)
+
+    def finish_report(self, timer, matches, report_info, report_path):
+        """단계별 시간을 로그 메시지 패널에 기록하고, 경로가 있으면 JSON 보고서를 저장합니다."""
+        for line in timer.summary_lines():
+            QgsMessageLog.logMessage(line, "SHP 로더", Qgis.Info)
+        if report_path is None:
+            return
+        try:
+            write_report(report_path, timer.report(matches, **report_info))
+        except OSError as e:
+            QgsMessageLog.logMessage(f"실행 보고서를 저장할 수 없습니다: {str(e)}", "SHP 로더", Qgis.Warning)
+            return
+        self.iface.messageBar().pushMessage(
+            "SHP 로더", f"실행 보고서 저장: {report_path}", level=Qgis.Info)
+
+    def start_watch(self, task):
+        """첫 로드가 끝나면 로드한 시트를 기록하고 상위 폴더 감시를 시작합니다."""
+        base_folder, _, values, _, _ = self.watch_args
+        self.watch_layers = {}
+        self.remember_layers(task)
+        self.watcher = SheetWatcher(base_folder, values['max_depth'])
+        self.watcher.changed.connect(self.on_watch_changed)
+
+        message_bar = self.iface.messageBar()
+        widget = message_bar.createMessage("SHP 로더", f"새 시트 감시 중: {base_folder}")
+        stop_button = QPushButton("감시 중지")
+        stop_button.clicked.connect(self.stop_watch)
+        widget.layout().addWidget(stop_button)
+        self.watch_item = message_bar.pushWidget(widget, Qgis.Info)
+
+    def stop_watch(self):
+        """상위 폴더 감시를 멈춥니다. 진행 중인 증분 로드는 끝까지 등록합니다."""
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher.deleteLater()
+            self.watcher = None
+        if self.watch_item is not None:
+            self.iface.messageBar().popWidget(self.watch_item)
+            self.watch_item = None
+        self.watch_args = None
+        self.watch_pending = False
+
+    def remember_layers(self, task):
+        """등록한 시트 레이어를 경로별로 기록합니다."""
+        for match, layer in zip(task.valid_matches, task.layers):
+            self.watch_layers[match.path] = (match.size, match.mtime_ns, layer.id())
+
+    def on_watch_changed(self):
+        """상위 폴더가 바뀌면 새 시트와 바뀐 시트만 로드하는 작업을 시작합니다."""
+        if self.watcher is None:
+            return
+        if self.task is not None:
+            # 진행 중인 작업이 끝나면 다시 확인합니다.
+            self.watch_pending = True
+            return
+        self.watch_pending = False
+
+        # 사용자가 프로젝트에서 지운 시트는 다시 로드합니다.
+        project = QgsProject.instance()
+        known = {
+            path: (size, mtime_ns)
+            for path, (size, mtime_ns, layer_id) in self.watch_layers.items()
+            if project.mapLayer(layer_id) is not None
+        }
+        base_folder, file_name, values, extent_filter, shared_style = self.watch_args
+        self.start_load_task(base_folder, file_name, values, extent_filter, shared_style, known=known)
+
+    def on_watch_completed(self):
+        """증분 로드가 끝나면 바뀐 시트의 이전 레이어를 교체하고 새 레이어를 같은 그룹에 등록합니다."""
+        task = self.task
+        self.task = None
+
+        if task.valid_matches:
+            project = QgsProject.instance()
+            replaced = [
+                self.watch_layers[match.path][2] for match in task.valid_matches
+                if match.path in self.watch_layers
+            ]
+            replaced = [layer_id for layer_id in replaced if project.mapLayer(layer_id) is not None]
+            if replaced:
+                project.removeMapLayers(replaced)
+            self.add_task_layers(task, reuse_group=True)
+            self.remember_layers(task)
+            self.iface.messageBar().pushMessage(
+                "SHP 로더",
+                f"새 시트 {len(task.layers) - len(replaced)}개 로드, 바뀐 시트 {len(replaced)}개 교체",
+                level=Qgis.Info)
+            self.finish_report(task.timer, task.matches, {}, None)
+        if task.error_count:
+            QgsMessageLog.logMessage(
+                f"감시 모드: {task.error_count}개 시트 로드 실패 (다음 확인 때 다시 시도합니다)",
+                "SHP 로더", Qgis.Warning)
+
+        if self.watch_pending:
+            self.on_watch_changed()
+
+    def on_watch_terminated(self):
+        """증분 로드가 취소되거나 실패했을 때 호출됩니다. 감시는 계속합니다."""
+        task = self.task
+        self.task = None
+        if task.exception is not None:
+            QgsMessageLog.logMessage(
+                f"감시 모드: 폴더를 읽을 수 없습니다: {str(task.exception)}", "SHP 로더", Qgis.Warning)
+        if self.watch_pending:
+            self.on_watch_changed()
+
+    def footprint_layer(self):
+        """활성 레이어가 도엽 색인이면 그것을, 아니면 프로젝트의 첫 도엽 색인 레이어를 반환합니다."""
+        layer = self.iface.activeLayer()
+        if layer is not None and layer.customProperty(PROPERTY_FOOTPRINT) is not None:
+            return layer
+        for layer in QgsProject.instance().mapLayers().values():
+            if layer.customProperty(PROPERTY_FOOTPRINT) is not None:
+                return layer
+        self.iface.messageBar().pushMessage(
+            "SHP 로더", "도엽 색인 레이어가 없습니다. 로드할 때 '도엽 색인 레이어 생성'을 선택하세요.",
+            level=Qgis.Warning)
+        return None
+
+    def load_selected_footprints(self):
+        """도엽 색인 레이어에서 선택한 시트를 로드합니다."""
+        layer = self.footprint_layer()
+        if layer is None:
+            return
+        if layer.selectedFeatureCount() == 0:
+            self.iface.messageBar().pushMessage(
+                "SHP 로더", "도엽 색인 레이어에서 로드할 시트를 선택해주세요.", level=Qgis.Info)
+            return
+        self.load_footprint_sheets(layer, layer.selectedFeatures())
+
+    def activate_footprint_tool(self):
+        """지도에서 클릭한 위치의 시트를 로드하는 도구를 켭니다."""
+        self.iface.mapCanvas().setMapTool(self.footprint_tool)
+
+    def on_footprint_clicked(self, point, button):
+        """클릭한 위치와 겹치는 도엽 색인 사각형을 공간 인덱스로 찾아 시트를 로드합니다."""
+        layer = self.footprint_layer()
+        if layer is None:
+            return
+        canvas = self.iface.mapCanvas()
+        radius = QgsMapTool.searchRadiusMU(canvas)
+        rectangle = QgsRectangle(point.x() - radius, point.y() - radius, point.x() + radius, point.y() + radius)
+        canvas_crs = canvas.mapSettings().destinationCrs()
+        if layer.crs().isValid() and canvas_crs.isValid() and layer.crs() != canvas_crs:
+            transform = QgsCoordinateTransform(canvas_crs, layer.crs(), QgsProject.instance().transformContext())
+            try:
+                rectangle = transform.transformBoundingBox(rectangle)
+            except QgsCsException:
                 return
-            
-            # 각 하위 폴더에서 SHP 파일 로드
-            loaded_count = 0
-            error_count = 0
-            not_found_count = 0
-            
-            for subfolder in subfolders:
-                full_path = os.path.join(base_folder, subfolder, file_name)
-                if os.path.exists(full_path):
-                    # 레이어 이름 설정 (폴더명_파일명)
-                    layer_name = f"{subfolder}_{os.path.splitext(file_name)[0]}"
-                    
-                    # 벡터 레이어 생성 및 추가
-                    layer = QgsVectorLayer(full_path, layer_name, "ogr")
-                    if layer.isValid():
-                        QgsProject.instance().addMapLayer(layer)
-                        loaded_count += 1
-                    else:
-                        error_count += 1
-                else:
-                    not_found_count += 1
-            
-            # 결과 메시지 표시
-            QMessageBox.information(
+        features = list(layer.getFeatures(QgsFeatureRequest().setFilterRect(rectangle)))
+        if features:
+            self.load_footprint_sheets(layer, features)
+
+    def load_footprint_sheets(self, layer, features):
+        """도엽 색인 객체의 시트를 열어 색인 레이어와 같은 그룹에 등록합니다.
+
+        이미 프로젝트에 있는 시트는 다시 열지 않으며, 로드한 시트는 색인의 상태를
+        '로드됨'으로 바꿉니다.
+        """
+        project = QgsProject.instance()
+        loaded = {other.customProperty(PROPERTY_ORIGIN) for other in project.mapLayers().values()}
+        status_index = layer.fields().indexOf('status')
+        sheets = []
+        changes = {}
+        failed = 0
+        for feature in features:
+            path = feature['path']
+            if path in loaded:
+                continue
+            encoding = feature['encoding'] or None
+            sheet = open_layer(path, feature['name'], encoding)
+            if sheet is None:
+                failed += 1
+                continue
+            stamp_layer(
+                sheet, ShpMatch(path, feature['name'], '', '', {}, feature['size'], file_mtime(path) or 0), encoding)
+            loaded.add(path)
+            sheets.append(sheet)
+            changes[feature.id()] = {status_index: STATUS_LOADED}
+
+        if sheets:
+            if self.shared_style is not None:
+                apply_shared_style(sheets, self.shared_style)
+            register_layers(self.iface, sheets, layer.customProperty(PROPERTY_FOOTPRINT) or None, reuse_group=True)
+            if self.trust_statistics:
+                trust_project(project)
+            layer.dataProvider().changeAttributeValues(changes)
+            layer.triggerRepaint()
+        message = f"도엽 색인에서 시트 {len(sheets)}개 로드"
+        if failed:
+            message += f", {failed}개 열기 실패"
+        self.iface.messageBar().pushMessage("SHP 로더", message, level=Qgis.Warning if failed else Qgis.Info)
+
+    def on_load_terminated(self):
+        """로드 작업이 취소되거나 실패했을 때 호출됩니다."""
+        task = self.task
+        self.task = None
+        self.clear_progress()
+        self.watch_args = None
+
+        if task.exception is not None:
+            QMessageBox.critical(
                 self.iface.mainWindow(),
-                "완료",
-                f"작업 완료:\n"
-                f"- {loaded_count}개 파일 로드됨\n"
-                f"- {error_count}개 파일 로드 실패\n"
-                f"- {not_found_count}개 파일 찾지 못함"
-            ) 
\ No newline at end of file
+                "오류",
+                f"시트를 불러오는 중 오류가 발생했습니다: {str(task.exception)}"
+            )
+            return
+        self.iface.messageBar().pushMessage(
+            "SHP 로더", "로드 작업이 취소되었습니다.", level=Qgis.Warning)
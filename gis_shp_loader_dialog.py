@@ -1,11 +1,66 @@
 import os
 from qgis.PyQt import QtWidgets, uic
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
+from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication, Qt
+from qgis.core import QgsMapLayerProxyModel
+from qgis.gui import QgsMapLayerComboBox, QgsProjectionSelectionWidget
+from .shp_scanner import count_file_names, split_patterns
+
+# 파일 이름 목록을 만들 때 확인할 최상위 하위 폴더 수
+PICK_SAMPLE_FOLDERS = 50
+
+
+class FileNamePickerDialog(QtWidgets.QDialog):
+    def __init__(self, counts, selected, parent=None):
+        """스캔에서 찾은 Shapefile 이름을 체크 목록으로 보여주는 대화상자
+        
+        Args:
+            counts: {파일 이름: 찾은 폴더 수}
+            selected: 처음부터 체크할 파일 이름 목록
+        """
+        super(FileNamePickerDialog, self).__init__(parent)
+        self.setWindowTitle("로드할 파일 선택")
+        self.resize(350, 400)
+        
+        layout = QtWidgets.QVBoxLayout()
+        layout.addWidget(QtWidgets.QLabel(
+            f"처음 {PICK_SAMPLE_FOLDERS}개 하위 폴더에서 찾은 파일 (괄호 안은 폴더 수)"))
+        
+        selected = {name.lower() for name in selected}
+        self.list_widget = QtWidgets.QListWidget()
+        for name, count in sorted(counts.items()):
+            item = QtWidgets.QListWidgetItem(f"{name} ({count})")
+            item.setData(Qt.UserRole, name)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if name.lower() in selected else Qt.Unchecked)
+            self.list_widget.addItem(item)
+        layout.addWidget(self.list_widget)
+        
+        button_box = QtWidgets.QDialogButtonBox(
+            QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
+        )
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        
+        self.setLayout(layout)
+        
+    def selected_names(self):
+        """체크된 파일 이름 목록을 반환합니다."""
+        return [
+            self.list_widget.item(row).data(Qt.UserRole)
+            for row in range(self.list_widget.count())
+            if self.list_widget.item(row).checkState() == Qt.Checked
+        ]
+
 
 class GisShpLoaderDialog(QtWidgets.QDialog):
+    # 지도에서 관심 영역을 그리기 위해 대화상자를 잠시 닫을 때의 결과 코드
+    DRAW_EXTENT = 2
+    
     def __init__(self, parent=None):
         """대화상자 초기화"""
         super(GisShpLoaderDialog, self).__init__(parent)
+        self.drawn_extent = None
         # UI 구성요소 설정
         self.setupUi()
         
@@ -33,12 +88,254 @@ class GisShpLoaderDialog(QtWidgets.QDialog):
         file_group = QtWidgets.QGroupBox("파일 설정")
         file_layout = QtWidgets.QHBoxLayout()
         
-        file_layout.addWidget(QtWidgets.QLabel("파일 이름:"))
+        file_layout.addWidget(QtWidgets.QLabel("파일 이름/패턴:"))
         self.filename_edit = QtWidgets.QLineEdit("A0010000.shp")
+        self.filename_edit.setToolTip("여러 파일은 쉼표로 구분합니다 (예: A0010000.shp, A0020000.shp).")
         
         file_layout.addWidget(self.filename_edit)
+        
+        self.pick_button = QtWidgets.QPushButton("목록에서 선택...")
+        self.pick_button.clicked.connect(self.pick_file_names)
+        file_layout.addWidget(self.pick_button)
+        
+        self.regex_check = QtWidgets.QCheckBox("정규식")
+        self.regex_check.setToolTip("체크하지 않으면 *_A0010000.shp 같은 와일드카드 패턴으로 해석합니다.")
+        file_layout.addWidget(self.regex_check)
+        
+        file_layout.addWidget(QtWidgets.QLabel("검색 깊이:"))
+        self.depth_spin = QtWidgets.QSpinBox()
+        self.depth_spin.setRange(1, 10)
+        self.depth_spin.setValue(1)
+        file_layout.addWidget(self.depth_spin)
+        
+        self.cache_check = QtWidgets.QCheckBox("스캔 캐시 사용")
+        self.cache_check.setChecked(True)
+        self.cache_check.setToolTip(
+            "수정 시각이 바뀌지 않은 폴더는 이전 스캔 결과를 재사용합니다.\n"
+            "폴더 안의 파일 내용만 교체한 경우에는 체크를 해제하세요.")
+        file_layout.addWidget(self.cache_check)
+        
+        self.zip_check = QtWidgets.QCheckBox("ZIP 내부 검색")
+        self.zip_check.setToolTip(
+            "하위 폴더의 .zip 파일을 압축을 풀지 않고 검색하여 /vsizip/ 경로로 엽니다.\n"
+            "ZIP 파일은 하위 폴더 한 단계로 취급합니다.")
+        file_layout.addWidget(self.zip_check)
         file_group.setLayout(file_layout)
         
+        # 로드 옵션 그룹
+        option_group = QtWidgets.QGroupBox("로드 옵션")
+        option_layout = QtWidgets.QHBoxLayout()
+        
+        option_layout.addWidget(QtWidgets.QLabel("동시 작업 수:"))
+        self.workers_spin = QtWidgets.QSpinBox()
+        self.workers_spin.setRange(1, 32)
+        self.workers_spin.setValue(min(8, (os.cpu_count() or 1) * 2))
+        
+        option_layout.addWidget(self.workers_spin)
+        option_layout.addStretch()
+        
+        self.group_check = QtWidgets.QCheckBox("그룹으로 일괄 등록")
+        self.group_check.setChecked(True)
+        self.group_check.setToolTip("캔버스를 고정한 채 모든 레이어를 하나의 그룹에 한 번에 추가합니다.")
+        option_layout.addWidget(self.group_check)
+        
+        self.index_check = QtWidgets.QCheckBox("공간 인덱스(.qix) 자동 생성")
+        self.index_check.setToolTip(".qix 파일이 없거나 오래된 시트에 공간 인덱스를 만들어 이후 화면 이동·확대를 빠르게 합니다.")
+        option_layout.addWidget(self.index_check)
+        
+        self.dedupe_check = QtWidgets.QCheckBox("중복 시트 제외")
+        self.dedupe_check.setChecked(False)
+        self.dedupe_check.setToolTip(
+            "크기, 범위, 객체 수, 파일 앞부분 해시가 같은 시트는 하나만 로드합니다.\n"
+            "같은 도엽을 다른 폴더에 두 번 받은 경우 중복 레이어를 막습니다.")
+        option_layout.addWidget(self.dedupe_check)
+        
+        self.footprint_check = QtWidgets.QCheckBox("도엽 색인 레이어 생성")
+        self.footprint_check.setToolTip(
+            "시트마다 .shp 헤더 범위 사각형 하나를 담은 가벼운 레이어를 만듭니다 (객체를 읽지 않음).\n"
+            "폴더, 경로, 객체 수, 파일 크기를 담으며, 선택하거나 클릭하여 시트를 로드할 수 있습니다.")
+        option_layout.addWidget(self.footprint_check)
+        
+        self.trust_check = QtWidgets.QCheckBox("프로젝트에 저장된 레이어 통계 신뢰")
+        self.trust_check.setToolTip(
+            "프로젝트를 열 때 모든 레이어의 범위와 객체 수를 데이터 원본에서 다시 계산하지 않습니다.\n"
+            "이 플러그인이 로드하지 않은 레이어에도 적용되는 프로젝트 설정입니다.")
+        option_layout.addWidget(self.trust_check)
+        
+        self.report_check = QtWidgets.QCheckBox("실행 보고서(JSON) 저장")
+        self.report_check.setToolTip(
+            "단계별 소요 시간, 시트별 시간, 가장 느린 시트, 파일 크기를 플러그인 설정 폴더에 저장합니다.\n"
+            "단계별 시간은 체크하지 않아도 로그 메시지 패널에 기록됩니다.")
+        option_layout.addWidget(self.report_check)
+        option_group.setLayout(option_layout)
+        
+        # 출력 설정 그룹
+        output_group = QtWidgets.QGroupBox("출력 설정")
+        output_layout = QtWidgets.QHBoxLayout()
+        
+        output_layout.addWidget(QtWidgets.QLabel("출력 방식:"))
+        self.output_combo = QtWidgets.QComboBox()
+        self.output_combo.addItem("개별 레이어", 'layers')
+        self.output_combo.addItem("VRT 통합 레이어", 'vrt')
+        self.output_combo.addItem("GeoPackage로 병합", 'gpkg')
+        self.output_combo.addItem("지연 로드 (보일 때 열기)", 'lazy')
+        self.output_combo.setToolTip(
+            "VRT 통합 레이어는 데이터를 복사하지 않고 모든 시트를 하나의 레이어로 묶습니다.\n"
+            "GeoPackage로 병합하면 공간 인덱스가 있는 하나의 테이블로 복사합니다.\n"
+            "지연 로드는 자리표시자만 등록하고 지도에 보일 때 실제 레이어를 엽니다.")
+        self.output_combo.currentIndexChanged.connect(self.update_output_widgets)
+        output_layout.addWidget(self.output_combo)
+        
+        self.output_edit = QtWidgets.QLineEdit()
+        self.output_edit.setPlaceholderText("비워두면 플러그인 설정 폴더에 저장")
+        self.output_button = QtWidgets.QPushButton("저장 위치...")
+        self.output_button.clicked.connect(self.select_output)
+        output_layout.addWidget(self.output_edit)
+        output_layout.addWidget(self.output_button)
+        
+        self.max_open_label = QtWidgets.QLabel("최대 열린 레이어:")
+        self.max_open_spin = QtWidgets.QSpinBox()
+        self.max_open_spin.setRange(10, 5000)
+        self.max_open_spin.setValue(200)
+        self.max_open_spin.setToolTip("이 수를 넘으면 보이지 않는 레이어부터 다시 닫습니다.")
+        output_layout.addWidget(self.max_open_label)
+        output_layout.addWidget(self.max_open_spin)
+        
+        self.watch_check = QtWidgets.QCheckBox("감시 모드 (새 시트 자동 로드)")
+        self.watch_check.setToolTip(
+            "로드한 뒤에도 상위 폴더를 계속 감시하여 새로 들어오거나 바뀐 시트만 추가로 로드합니다.\n"
+            "개별 레이어와 지연 로드 방식에서만 사용할 수 있습니다.")
+        output_layout.addWidget(self.watch_check)
+        output_group.setLayout(output_layout)
+        self.update_output_widgets()
+        
+        # 관심 영역 그룹
+        aoi_group = QtWidgets.QGroupBox("관심 영역")
+        aoi_layout = QtWidgets.QHBoxLayout()
+        
+        aoi_layout.addWidget(QtWidgets.QLabel("범위 제한:"))
+        self.aoi_combo = QtWidgets.QComboBox()
+        self.aoi_combo.addItem("없음", 'none')
+        self.aoi_combo.addItem("현재 지도 범위", 'canvas')
+        self.aoi_combo.addItem("레이어의 선택 객체", 'selection')
+        self.aoi_combo.addItem("사각형 그리기", 'rectangle')
+        self.aoi_combo.setToolTip("헤더 범위가 관심 영역과 겹치지 않는 시트는 열지 않고 건너뜁니다.")
+        self.aoi_combo.currentIndexChanged.connect(self.update_aoi_widgets)
+        aoi_layout.addWidget(self.aoi_combo)
+        
+        self.aoi_layer_combo = QgsMapLayerComboBox()
+        self.aoi_layer_combo.setFilters(QgsMapLayerProxyModel.VectorLayer)
+        aoi_layout.addWidget(self.aoi_layer_combo)
+        
+        self.draw_button = QtWidgets.QPushButton("지도에서 그리기...")
+        self.draw_button.clicked.connect(lambda: self.done(self.DRAW_EXTENT))
+        aoi_layout.addWidget(self.draw_button)
+        
+        self.aoi_label = QtWidgets.QLabel()
+        aoi_layout.addWidget(self.aoi_label)
+        aoi_layout.addStretch()
+        aoi_group.setLayout(aoi_layout)
+        self.update_aoi_widgets()
+        
+        # 좌표계 변환 그룹
+        reproject_group = QtWidgets.QGroupBox("좌표계 변환")
+        reproject_layout = QtWidgets.QHBoxLayout()
+        
+        self.reproject_check = QtWidgets.QCheckBox("대상 좌표계로 변환:")
+        self.reproject_check.setToolTip(
+            "좌표계(.prj)가 다른 시트를 병렬로 미리 변환하여 다시 그릴 때마다 실시간 변환하지 않게 합니다.\n"
+            "변환 결과는 원본 수정 시각별로 캐시되어 다음 로드에서 재사용됩니다.")
+        self.reproject_check.toggled.connect(self.update_reproject_widgets)
+        reproject_layout.addWidget(self.reproject_check)
+        self.target_crs_widget = QgsProjectionSelectionWidget()
+        reproject_layout.addWidget(self.target_crs_widget)
+        
+        self.assumed_check = QtWidgets.QCheckBox(".prj 없는 시트:")
+        self.assumed_check.setToolTip("체크하지 않으면 .prj가 없는 시트는 변환하지 않습니다.")
+        self.assumed_check.toggled.connect(self.update_reproject_widgets)
+        reproject_layout.addWidget(self.assumed_check)
+        self.assumed_crs_widget = QgsProjectionSelectionWidget()
+        reproject_layout.addWidget(self.assumed_crs_widget)
+        reproject_group.setLayout(reproject_layout)
+        self.update_reproject_widgets()
+        
+        # 개요 레이어 그룹
+        overview_group = QtWidgets.QGroupBox("개요 레이어")
+        overview_layout = QtWidgets.QHBoxLayout()
+        
+        self.overview_check = QtWidgets.QCheckBox("단순화한 개요 레이어 생성")
+        self.overview_check.setToolTip(
+            "모든 시트의 도형을 작업 프로세스에서 병렬로 단순화하여 하나의 개요 레이어로 만듭니다.\n"
+            "기준 축척보다 축소하면 개요만, 확대하면 원본 시트만 그립니다.")
+        self.overview_check.toggled.connect(self.update_overview_widgets)
+        overview_layout.addWidget(self.overview_check)
+        overview_layout.addStretch()
+        
+        overview_layout.addWidget(QtWidgets.QLabel("허용 오차:"))
+        self.tolerance_spin = QtWidgets.QDoubleSpinBox()
+        self.tolerance_spin.setRange(0.1, 10000.0)
+        self.tolerance_spin.setDecimals(1)
+        self.tolerance_spin.setValue(10.0)
+        self.tolerance_spin.setToolTip("단순화 허용 오차 (시트 좌표계 단위, 보통 m)")
+        overview_layout.addWidget(self.tolerance_spin)
+        
+        overview_layout.addWidget(QtWidgets.QLabel("기준 축척 1:"))
+        self.overview_scale_spin = QtWidgets.QSpinBox()
+        self.overview_scale_spin.setRange(1000, 10000000)
+        self.overview_scale_spin.setSingleStep(10000)
+        self.overview_scale_spin.setValue(100000)
+        overview_layout.addWidget(self.overview_scale_spin)
+        overview_group.setLayout(overview_layout)
+        self.update_overview_widgets()
+        
+        # 필드·속성 필터 그룹
+        filter_group = QtWidgets.QGroupBox("필드·속성 필터")
+        filter_layout = QtWidgets.QHBoxLayout()
+        
+        filter_layout.addWidget(QtWidgets.QLabel("필드:"))
+        self.fields_edit = QtWidgets.QLineEdit()
+        self.fields_edit.setPlaceholderText("비워두면 모든 필드 (예: UFID, NAME)")
+        self.fields_edit.setToolTip(
+            "쉼표로 구분한 필드만 읽습니다. 목록에 없는 .dbf 필드는 OGR이 읽지 않으므로\n"
+            "메모리 사용량과 속성 테이블 로드 시간이 줄어듭니다.")
+        filter_layout.addWidget(self.fields_edit)
+        
+        filter_layout.addWidget(QtWidgets.QLabel("조건:"))
+        self.where_edit = QtWidgets.QLineEdit()
+        self.where_edit.setPlaceholderText("OGR SQL WHERE 절 (예: ROAD_CLASS = '고속국도')")
+        self.where_edit.setToolTip(
+            "조건에 맞는 객체만 로드합니다. 시트를 열 때 OGR이 걸러내므로 QGIS로 넘어오지 않습니다.\n"
+            "조건에 없는 필드를 쓰면 해당 시트는 열기에 실패합니다.")
+        filter_layout.addWidget(self.where_edit)
+        filter_group.setLayout(filter_layout)
+        
+        # 스타일 그룹
+        style_group = QtWidgets.QGroupBox("공유 스타일")
+        style_layout = QtWidgets.QHBoxLayout()
+        
+        style_layout.addWidget(QtWidgets.QLabel("스타일:"))
+        self.style_combo = QtWidgets.QComboBox()
+        self.style_combo.addItem("적용 안 함", 'none')
+        self.style_combo.addItem("QML/SLD 파일", 'file')
+        self.style_combo.addItem("기존 레이어에서 복사", 'layer')
+        self.style_combo.setToolTip(
+            "스타일을 한 번만 읽어 새 레이어 모두에 등록 전에 적용합니다.\n"
+            "렌더러, 라벨, 축척에 따른 표시 설정이 함께 적용됩니다.")
+        self.style_combo.currentIndexChanged.connect(self.update_style_widgets)
+        style_layout.addWidget(self.style_combo)
+        
+        self.style_edit = QtWidgets.QLineEdit()
+        self.style_button = QtWidgets.QPushButton("찾아보기...")
+        self.style_button.clicked.connect(self.select_style)
+        style_layout.addWidget(self.style_edit)
+        style_layout.addWidget(self.style_button)
+        
+        self.style_layer_combo = QgsMapLayerComboBox()
+        self.style_layer_combo.setFilters(QgsMapLayerProxyModel.VectorLayer)
+        style_layout.addWidget(self.style_layer_combo)
+        style_group.setLayout(style_layout)
+        self.update_style_widgets()
+        
         # 버튼 영역
         button_box = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel
@@ -49,6 +346,13 @@ class GisShpLoaderDialog(QtWidgets.QDialog):
         # 전체 레이아웃 설정
         layout.addWidget(folder_group)
         layout.addWidget(file_group)
+        layout.addWidget(option_group)
+        layout.addWidget(output_group)
+        layout.addWidget(aoi_group)
+        layout.addWidget(filter_group)
+        layout.addWidget(reproject_group)
+        layout.addWidget(overview_group)
+        layout.addWidget(style_group)
         layout.addWidget(button_box)
         
         self.setLayout(layout)
@@ -63,9 +367,134 @@ class GisShpLoaderDialog(QtWidgets.QDialog):
         if folder:
             self.folder_edit.setText(folder)
             
+    def pick_file_names(self):
+        """하위 폴더를 스캔하여 실제로 있는 Shapefile 이름 중에서 고르게 합니다."""
+        folder = self.folder_edit.text()
+        if not folder or not os.path.isdir(folder):
+            QtWidgets.QMessageBox.warning(self, "경고", "먼저 상위 폴더를 선택해주세요.")
+            return
+        
+        QtWidgets.QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            counts = count_file_names(
+                folder, self.depth_spin.value(), PICK_SAMPLE_FOLDERS, self.workers_spin.value(),
+                self.zip_check.isChecked())
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(self, "경고", f"폴더를 읽을 수 없습니다: {str(e)}")
+            return
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+        
+        if not counts:
+            QtWidgets.QMessageBox.information(self, "알림", "하위 폴더에서 Shapefile을 찾지 못했습니다.")
+            return
+        
+        selected = [] if self.regex_check.isChecked() else split_patterns(self.filename_edit.text())
+        picker = FileNamePickerDialog(counts, selected, self)
+        if picker.exec_():
+            self.regex_check.setChecked(False)
+            self.filename_edit.setText(", ".join(picker.selected_names()))
+            
+    def select_output(self):
+        """GeoPackage 저장 위치 대화상자를 엽니다."""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self,
+            "GeoPackage 저장 위치",
+            self.output_edit.text() or os.path.expanduser("~"),
+            "GeoPackage (*.gpkg)"
+        )
+        if path:
+            self.output_edit.setText(path)
+            
+    def update_output_widgets(self):
+        """GeoPackage 병합일 때만 저장 위치를, 지연 로드일 때만 최대 열린 레이어 수를 입력받습니다.
+
+        감시 모드는 시트마다 레이어를 만드는 방식(개별 레이어, 지연 로드)에서만 켤 수 있습니다.
+        """
+        mode = self.output_combo.currentData()
+        self.output_edit.setEnabled(mode == 'gpkg')
+        self.output_button.setEnabled(mode == 'gpkg')
+        self.max_open_label.setVisible(mode == 'lazy')
+        self.max_open_spin.setVisible(mode == 'lazy')
+        self.watch_check.setEnabled(mode in ('layers', 'lazy'))
+            
+    def update_reproject_widgets(self):
+        """좌표계를 변환할 때만 대상 좌표계와 .prj 없는 시트의 좌표계를 입력받습니다."""
+        enabled = self.reproject_check.isChecked()
+        self.target_crs_widget.setEnabled(enabled)
+        self.assumed_check.setEnabled(enabled)
+        self.assumed_crs_widget.setEnabled(enabled and self.assumed_check.isChecked())
+            
+    def update_overview_widgets(self):
+        """개요 레이어를 만들 때만 허용 오차와 기준 축척을 입력받습니다."""
+        enabled = self.overview_check.isChecked()
+        self.tolerance_spin.setEnabled(enabled)
+        self.overview_scale_spin.setEnabled(enabled)
+            
+    def update_aoi_widgets(self):
+        """선택한 관심 영역 방식에 필요한 위젯만 표시합니다."""
+        mode = self.aoi_combo.currentData()
+        self.aoi_layer_combo.setVisible(mode == 'selection')
+        self.draw_button.setVisible(mode == 'rectangle')
+        self.aoi_label.setVisible(mode == 'rectangle')
+        
+    def select_style(self):
+        """스타일 파일 선택 대화상자를 엽니다."""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(
+            self,
+            "스타일 파일 선택",
+            self.style_edit.text() or os.path.expanduser("~"),
+            "QGIS 스타일 (*.qml);;SLD (*.sld)"
+        )
+        if path:
+            self.style_edit.setText(path)
+            
+    def update_style_widgets(self):
+        """선택한 스타일 방식에 필요한 위젯만 표시합니다."""
+        mode = self.style_combo.currentData()
+        self.style_edit.setVisible(mode == 'file')
+        self.style_button.setVisible(mode == 'file')
+        self.style_layer_combo.setVisible(mode == 'layer')
+        
+    def set_drawn_extent(self, rectangle, crs):
+        """지도에서 그린 사각형을 관심 영역으로 저장합니다."""
+        self.drawn_extent = (rectangle, crs)
+        self.aoi_label.setText(f"{rectangle.toString(1)} ({crs.authid()})")
+            
     def get_values(self):
         """사용자가 설정한 값을 반환합니다."""
         return {
             'folder': self.folder_edit.text(),
-            'filename': self.filename_edit.text()
+            'filename': self.filename_edit.text(),
+            'regex': self.regex_check.isChecked(),
+            'max_depth': self.depth_spin.value(),
+            'use_cache': self.cache_check.isChecked(),
+            'scan_zips': self.zip_check.isChecked(),
+            'workers': self.workers_spin.value(),
+            'group': self.group_check.isChecked(),
+            'build_indexes': self.index_check.isChecked(),
+            'skip_duplicates': self.dedupe_check.isChecked(),
+            'footprints': self.footprint_check.isChecked(),
+            'trust_statistics': self.trust_check.isChecked(),
+            'write_report': self.report_check.isChecked(),
+            'output_mode': self.output_combo.currentData(),
+            'output_path': self.output_edit.text(),
+            'max_open': self.max_open_spin.value(),
+            'watch': self.watch_check.isEnabled() and self.watch_check.isChecked(),
+            'aoi_mode': self.aoi_combo.currentData(),
+            'aoi_layer': self.aoi_layer_combo.currentLayer(),
+            'aoi_extent': self.drawn_extent,
+            'reproject': self.reproject_check.isChecked() and self.target_crs_widget.crs().isValid(),
+            'target_crs': self.target_crs_widget.crs(),
+            'assumed_crs': (self.assumed_crs_widget.crs()
+                            if self.assumed_check.isChecked() and self.assumed_crs_widget.crs().isValid()
+                            else None),
+            'overview': self.overview_check.isChecked(),
+            'overview_tolerance': self.tolerance_spin.value(),
+            'overview_scale': self.overview_scale_spin.value(),
+            'fields': self.fields_edit.text(),
+            'where': self.where_edit.text(),
+            'style_mode': self.style_combo.currentData(),
+            'style_path': self.style_edit.text(),
+            'style_layer': self.style_layer_combo.currentLayer()
         } 
\ No newline at end of file
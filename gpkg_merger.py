@@ -0,0 +1,214 @@
+import os
+from collections import namedtuple
+from osgeo import gdal, ogr, osr
+from .field_filter import where_fields
+from .reprojector import spatial_reference
+
+
+# 병합 결과
+#   sheets:   병합된 시트 수
+#   features: 기록된 객체 수
+#   failed:   열지 못한 시트 경로 목록
+MergeResult = namedtuple('MergeResult', ['sheets', 'features', 'failed'])
+
+
+def promote_geometry_type(geom_type):
+    """Shapefile의 선/면은 단일·멀티가 섞이므로 멀티 유형으로 올립니다."""
+    flat_type = ogr.GT_Flatten(geom_type)
+    if flat_type in (ogr.wkbLineString, ogr.wkbPolygon):
+        return ogr.GT_GetCollection(geom_type)
+    return geom_type
+
+
+def traditional_axis_order(srs):
+    """GDAL 3 이상에서 경도/위도 순서를 유지하도록 설정합니다."""
+    if srs is not None and hasattr(srs, 'SetAxisMappingStrategy'):
+        srs.SetAxisMappingStrategy(osr.OAMS_TRADITIONAL_GIS_ORDER)
+    return srs
+
+
+def open_output_gpkg(gpkg_path, layer_name, overwrite=True):
+    """기록할 GeoPackage를 열고 같은 이름의 테이블을 지웁니다.
+
+    overwrite가 True이면 기존 파일을 지우고 새로 만들며, False이면 기존 파일에
+    테이블을 추가합니다. 파일을 열거나 만들 수 없으면 OSError가 발생합니다.
+
+    Returns:
+        ogr.DataSource: 쓰기 가능한 GeoPackage
+    """
+    driver = ogr.GetDriverByName('GPKG')
+    if overwrite and os.path.exists(gpkg_path):
+        driver.DeleteDataSource(gpkg_path)
+    os.makedirs(os.path.dirname(gpkg_path), exist_ok=True)
+
+    if os.path.exists(gpkg_path):
+        out_ds = ogr.Open(gpkg_path, 1)
+        # 같은 이름의 테이블이 있으면 지우고 새로 만듭니다.
+        if out_ds is not None:
+            for index in range(out_ds.GetLayerCount()):
+                if out_ds.GetLayer(index).GetName() == layer_name:
+                    out_ds.DeleteLayer(index)
+                    break
+    else:
+        out_ds = driver.CreateDataSource(gpkg_path)
+    if out_ds is None:
+        raise OSError(f"GeoPackage를 만들 수 없습니다: {gpkg_path}")
+    return out_ds
+
+
+def merge_to_gpkg(gpkg_path, matches, layer_name, source_field='source_sheet',
+                  batch_size=50000, progress=None, is_canceled=None, overwrite=True,
+                  encodings=None, fields=None, where=None, target_srs=None, assumed_srs=None):
+    """검색된 Shapefile을 하나의 GeoPackage 테이블로 병합합니다.
+
+    시트를 하나씩 스트리밍으로 읽어 batch_size 개 단위의 트랜잭션으로 기록하므로
+    전체 데이터 크기와 관계없이 메모리 사용량이 일정합니다. 테이블에는 R-tree
+    공간 인덱스가 생성되며, 원본 시트 이름은 source_field 필드에 기록됩니다.
+    좌표계가 다른 시트는 target_srs(없으면 첫 번째 시트의 좌표계)로 변환합니다.
+
+    fields가 주어지면 목록에 있는 필드만 읽고(SetIgnoredFields), where가 주어지면
+    조건에 맞는 객체만 읽습니다(SetAttributeFilter).
+
+    Args:
+        gpkg_path: 생성할 .gpkg 파일 경로
+        matches: ShpMatch 목록
+        layer_name: 생성할 테이블 이름
+        source_field: 원본 시트 이름을 담을 필드 이름
+        batch_size: 트랜잭션 하나에 기록할 객체 수
+        progress: 진행률(0.0~1.0)을 받는 함수
+        is_canceled: 취소 여부를 반환하는 함수
+        overwrite: True이면 기존 파일을 지우고, False이면 기존 파일에 테이블을 추가합니다
+        encodings: 시트 경로별 .dbf 인코딩 {경로: 인코딩} (선택)
+        fields: 남길 필드 이름 목록 (대소문자 구분 없음, 선택)
+        where: OGR SQL WHERE 절 (선택)
+        target_srs: 출력 좌표계 ('EPSG:5186' 같은 코드 또는 WKT, 선택)
+        assumed_srs: .prj가 없는 시트의 좌표계 (선택)
+
+    Returns:
+        MergeResult: 병합 결과 (취소되면 None)
+    """
+    out_ds = open_output_gpkg(gpkg_path, layer_name, overwrite)
+
+    out_layer = None
+    out_srs = None
+    out_type = ogr.wkbUnknown
+    out_fields = {}
+    in_transaction = False
+    pending = 0
+    sheets = 0
+    features = 0
+    failed = []
+
+    try:
+        for index, match in enumerate(matches):
+            if is_canceled is not None and is_canceled():
+                return None
+
+            encoding = (encodings or {}).get(match.path)
+            src_ds = gdal.OpenEx(
+                match.path, gdal.OF_VECTOR,
+                open_options=[f'ENCODING={encoding}'] if encoding else [])
+            if src_ds is None or src_ds.GetLayerCount() == 0:
+                failed.append(match.path)
+                continue
+            src_layer = src_ds.GetLayer(0)
+            src_defn = src_layer.GetLayerDefn()
+            if where and src_layer.SetAttributeFilter(where) != ogr.OGRERR_NONE:
+                failed.append(match.path)
+                continue
+
+            # 목록에 없는 필드는 드라이버가 읽지 않도록 합니다. 조건에 쓰인 필드는
+            # 기록하지 않더라도 읽어야 속성 조건을 평가할 수 있습니다.
+            src_names = [src_defn.GetFieldDefn(i).GetName() for i in range(src_defn.GetFieldCount())]
+            kept = list(range(len(src_names)))
+            if fields:
+                keep = {name.lower() for name in fields}
+                kept = [i for i, name in enumerate(src_names) if name.lower() in keep]
+                filtered = set(where_fields(where, src_names))
+                src_layer.SetIgnoredFields([
+                    name for i, name in enumerate(src_names) if i not in kept and name not in filtered])
+
+            src_srs = traditional_axis_order(src_layer.GetSpatialRef())
+            if src_srs is None and assumed_srs:
+                src_srs = traditional_axis_order(spatial_reference(assumed_srs))
+
+            # 첫 번째 시트로 테이블 구조를 정합니다.
+            if out_layer is None:
+                out_srs = src_srs
+                if target_srs:
+                    out_srs = traditional_axis_order(spatial_reference(target_srs))
+                out_type = promote_geometry_type(src_layer.GetGeomType())
+                out_layer = out_ds.CreateLayer(
+                    layer_name, out_srs, out_type,
+                    options=['SPATIAL_INDEX=YES', 'GEOMETRY_NAME=geom'])
+                out_layer.CreateField(ogr.FieldDefn(source_field, ogr.OFTString))
+                out_fields[source_field.lower()] = 0
+
+            # 새 필드는 트랜잭션 밖에서 추가합니다.
+            new_fields = [
+                src_defn.GetFieldDefn(i) for i in kept
+                if src_names[i].lower() not in out_fields
+            ]
+            if new_fields:
+                if in_transaction:
+                    out_ds.CommitTransaction()
+                    in_transaction = False
+                    pending = 0
+                for field_defn in new_fields:
+                    out_layer.CreateField(field_defn)
+                    out_fields[field_defn.GetName().lower()] = out_layer.GetLayerDefn().GetFieldCount() - 1
+
+            field_map = [-1] * len(src_names)
+            for i in kept:
+                field_map[i] = out_fields[src_names[i].lower()]
+            source_index = out_fields[source_field.lower()]
+
+            transform = None
+            if out_srs is not None and src_srs is not None and not out_srs.IsSame(src_srs):
+                transform = osr.CoordinateTransformation(src_srs, out_srs)
+
+            out_defn = out_layer.GetLayerDefn()
+            src_layer.ResetReading()
+            src_feature = src_layer.GetNextFeature()
+            while src_feature is not None:
+                if not in_transaction:
+                    out_ds.StartTransaction()
+                    in_transaction = True
+
+                out_feature = ogr.Feature(out_defn)
+                out_feature.SetFromWithMap(src_feature, 1, field_map)
+                out_feature.SetField(source_index, match.name)
+
+                geometry = out_feature.GetGeometryRef()
+                if geometry is not None:
+                    if transform is not None:
+                        geometry.Transform(transform)
+                    if out_type != ogr.wkbUnknown and geometry.GetGeometryType() != out_type:
+                        out_feature.SetGeometry(ogr.ForceTo(geometry.Clone(), out_type))
+
+                out_layer.CreateFeature(out_feature)
+                features += 1
+                pending += 1
+                if pending >= batch_size:
+                    out_ds.CommitTransaction()
+                    in_transaction = False
+                    pending = 0
+                    if is_canceled is not None and is_canceled():
+                        return None
+
+                src_feature = src_layer.GetNextFeature()
+
+            src_ds = None
+            sheets += 1
+            if progress is not None:
+                progress((index + 1) / len(matches))
+
+        if in_transaction:
+            out_ds.CommitTransaction()
+            in_transaction = False
+    finally:
+        if in_transaction:
+            out_ds.RollbackTransaction()
+        out_ds = None
+
+    return MergeResult(sheets, features, failed)
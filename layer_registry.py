@@ -0,0 +1,52 @@
+from qgis.core import QgsLayerTreeLayer, QgsProject
+
+
+def register_layers(iface, layers, group_name=None, subgroup_names=None, reuse_group=False):
+    """레이어를 한 번에 프로젝트에 등록합니다.
+
+    group_name이 주어지면 캔버스를 고정한 상태에서 addMapLayers(..., False)로
+    일괄 추가한 뒤 하나의 그룹 아래에 삽입하여 다시 그리기를 한 번으로 줄입니다.
+    subgroup_names(레이어별 하위 그룹 이름 목록)가 주어지면 그룹 안에 하위 그룹을
+    만들어 나눠 넣습니다. group_name이 없으면 레이어마다 addMapLayer를 호출하는
+    기존 방식을 사용합니다.
+
+    reuse_group이 True이면 같은 이름의 그룹과 하위 그룹이 이미 있을 때 새로 만들지
+    않고 그 안에 추가합니다 (감시 모드의 증분 로드).
+
+    Returns:
+        QgsLayerTreeGroup: 레이어가 삽입된 그룹 (개별 등록 시 None)
+    """
+    project = QgsProject.instance()
+    if not layers:
+        return None
+
+    if not group_name:
+        for layer in layers:
+            project.addMapLayer(layer)
+        return None
+
+    canvas = iface.mapCanvas()
+    canvas.freeze(True)
+    try:
+        project.addMapLayers(layers, False)
+
+        root = project.layerTreeRoot()
+        group = root.findGroup(group_name) if reuse_group else None
+        if group is None:
+            group = root.insertGroup(0, group_name)
+        if subgroup_names is None:
+            # 노드를 한 번에 삽입하여 레이어 트리 신호를 한 번만 발생시킵니다.
+            group.insertChildNodes(0, [QgsLayerTreeLayer(layer) for layer in layers])
+        else:
+            members = {}
+            for layer, subgroup_name in zip(layers, subgroup_names):
+                members.setdefault(subgroup_name, []).append(layer)
+            for subgroup_name, subgroup_layers in members.items():
+                subgroup = group.findGroup(subgroup_name) if reuse_group else None
+                if subgroup is None:
+                    subgroup = group.addGroup(subgroup_name)
+                subgroup.insertChildNodes(0, [QgsLayerTreeLayer(layer) for layer in subgroup_layers])
+    finally:
+        canvas.freeze(False)
+    canvas.refresh()
+    return group
@@ -0,0 +1,191 @@
+import itertools
+from qgis.PyQt.QtCore import QObject, QTimer
+from qgis.core import (QgsCoordinateReferenceSystem, QgsCoordinateTransform,
+                       QgsCsException, QgsDataProvider, QgsProject, QgsRectangle,
+                       QgsVectorLayer)
+from .dbf_encoding import layer_uri
+
+
+# Shapefile 도형 유형 코드 → 메모리 레이어 도형 유형
+MEMORY_GEOMETRY_TYPES = {
+    1: 'Point', 3: 'MultiLineString', 5: 'MultiPolygon', 8: 'MultiPoint',
+    11: 'PointZ', 13: 'MultiLineStringZ', 15: 'MultiPolygonZ', 18: 'MultiPointZ',
+    21: 'PointM', 23: 'MultiLineStringM', 25: 'MultiPolygonM', 28: 'MultiPointM',
+    31: 'MultiPolygonZ',
+}
+
+# 지연 로드 레이어에 저장하는 사용자 속성
+PROPERTY_SOURCE = 'gis_shp_loader/source'
+PROPERTY_PLACEHOLDER = 'gis_shp_loader/placeholder'
+PROPERTY_BBOX = 'gis_shp_loader/bbox'
+
+
+def crs_from_wkt(wkt, cache):
+    """WKT로 좌표계를 만듭니다. 같은 WKT는 cache에서 재사용합니다."""
+    if wkt is None:
+        return QgsCoordinateReferenceSystem()
+    if wkt not in cache:
+        cache[wkt] = QgsCoordinateReferenceSystem.fromWkt(wkt)
+    return cache[wkt]
+
+
+def placeholder_uri(shape_type, crs):
+    """Shapefile 도형 유형과 좌표계로 피처가 없는 메모리 레이어 URI를 만듭니다."""
+    uri = MEMORY_GEOMETRY_TYPES.get(shape_type, 'Unknown')
+    if crs.isValid():
+        uri += f"?crs={crs.authid()}" if crs.authid() else f"?crs=wkt:{crs.toWkt()}"
+    return uri
+
+
+def create_placeholder(match, header, crs, encoding=None, subset=None):
+    """헤더 정보만으로 피처가 없는 메모리 자리표시자 레이어를 만듭니다.
+
+    실제 레이어로 전환할 때 쓸 수 있도록 인코딩 열기 옵션과 하위 집합 문자열을
+    붙인 URI를 저장합니다.
+    """
+    uri = placeholder_uri(header.shape_type, crs)
+    layer = QgsVectorLayer(uri, match.name, "memory")
+    layer.setCustomProperty(PROPERTY_SOURCE, layer_uri(match.path, encoding, subset))
+    layer.setCustomProperty(PROPERTY_PLACEHOLDER, uri)
+    layer.setCustomProperty(PROPERTY_BBOX, ','.join(repr(value) for value in header.bbox))
+    layer.setExtent(QgsRectangle(*header.bbox))
+    return layer
+
+
+class LazyLayerManager(QObject):
+    """자리표시자 레이어를 화면에 보일 때만 실제 OGR 레이어로 바꿉니다.
+
+    레이어 트리에서 체크되어 있고 범위가 현재 지도 범위와 겹치는 자리표시자는
+    setDataSource로 OGR 공급자로 전환하고, 열린 레이어가 max_open 개를 넘으면
+    보이지 않는 레이어 중 가장 오래 사용하지 않은 것부터 다시 자리표시자로
+    되돌립니다. 레이어 ID와 레이어 트리 위치는 바뀌지 않습니다.
+    """
+
+    def __init__(self, iface, max_open=200, parent=None):
+        super(LazyLayerManager, self).__init__(parent)
+        self.iface = iface
+        self.max_open = max_open
+        self.layers = {}
+        self.open_layers = set()
+        self.last_used = {}
+        self._canvas_extents = {}
+        self._clock = itertools.count()
+
+        # 화면 이동이 연속으로 일어날 때 한 번만 갱신합니다.
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(300)
+        self.timer.timeout.connect(self.update)
+
+        canvas = self.iface.mapCanvas()
+        project = QgsProject.instance()
+        canvas.extentsChanged.connect(self.timer.start)
+        canvas.destinationCrsChanged.connect(self.on_crs_changed)
+        project.layerTreeRoot().visibilityChanged.connect(self.timer.start)
+        project.layersWillBeRemoved.connect(self.forget)
+
+    def disconnect_signals(self):
+        """플러그인 제거 시 신호 연결을 해제합니다."""
+        canvas = self.iface.mapCanvas()
+        project = QgsProject.instance()
+        self.timer.stop()
+        canvas.extentsChanged.disconnect(self.timer.start)
+        canvas.destinationCrsChanged.disconnect(self.on_crs_changed)
+        project.layerTreeRoot().visibilityChanged.disconnect(self.timer.start)
+        project.layersWillBeRemoved.disconnect(self.forget)
+
+    def adopt(self, layers):
+        """자리표시자 레이어를 관리 대상으로 등록합니다.
+
+        프로젝트를 다시 열면 QGIS가 시트를 이미 OGR 공급자로 열어 두므로 열린
+        레이어로 셉니다. 열린 레이어가 max_open 개를 넘으면 보이지 않는 것부터
+        다시 자리표시자로 되돌립니다.
+        """
+        for layer in layers:
+            if layer.customProperty(PROPERTY_SOURCE) is None:
+                continue
+            self.layers[layer.id()] = layer
+            if layer.providerType() != 'memory':
+                self.open_layers.add(layer.id())
+        self.timer.start()
+
+    def forget(self, layer_ids):
+        """프로젝트에서 제거되는 레이어를 관리 대상에서 뺍니다."""
+        for layer_id in layer_ids:
+            self.layers.pop(layer_id, None)
+            self.open_layers.discard(layer_id)
+            self.last_used.pop(layer_id, None)
+            self._canvas_extents.pop(layer_id, None)
+
+    def on_crs_changed(self):
+        """지도 좌표계가 바뀌면 변환된 범위 캐시를 비웁니다."""
+        self._canvas_extents.clear()
+        self.timer.start()
+
+    def canvas_extent_of(self, layer):
+        """레이어의 헤더 범위를 지도 좌표계로 변환하여 반환합니다."""
+        layer_id = layer.id()
+        if layer_id not in self._canvas_extents:
+            bbox = [float(value) for value in layer.customProperty(PROPERTY_BBOX).split(',')]
+            rectangle = QgsRectangle(*bbox)
+            canvas_crs = self.iface.mapCanvas().mapSettings().destinationCrs()
+            if layer.crs().isValid() and canvas_crs.isValid() and layer.crs() != canvas_crs:
+                transform = QgsCoordinateTransform(
+                    layer.crs(), canvas_crs, QgsProject.instance().transformContext())
+                try:
+                    rectangle = transform.transformBoundingBox(rectangle)
+                except QgsCsException:
+                    pass
+            self._canvas_extents[layer_id] = rectangle
+        return self._canvas_extents[layer_id]
+
+    def is_visible(self, layer, canvas_extent):
+        """레이어가 체크되어 있고 현재 축척에서 보이며 지도 범위와 겹치면 True를 반환합니다."""
+        node = QgsProject.instance().layerTreeRoot().findLayer(layer.id())
+        if node is None or not node.isVisible():
+            return False
+        if not layer.isInScaleRange(self.iface.mapCanvas().scale()):
+            return False
+        return self.canvas_extent_of(layer).intersects(canvas_extent)
+
+    def materialize(self, layer):
+        """자리표시자를 실제 OGR 레이어로 전환합니다."""
+        layer.setDataSource(
+            layer.customProperty(PROPERTY_SOURCE), layer.name(), "ogr",
+            QgsDataProvider.ProviderOptions())
+        self.open_layers.add(layer.id())
+
+    def release(self, layer):
+        """OGR 레이어를 닫고 다시 자리표시자로 되돌립니다."""
+        layer.setDataSource(
+            layer.customProperty(PROPERTY_PLACEHOLDER), layer.name(), "memory",
+            QgsDataProvider.ProviderOptions())
+        self.open_layers.discard(layer.id())
+
+    def update(self):
+        """보이는 자리표시자를 열고, 열린 레이어 수를 max_open 이하로 유지합니다."""
+        canvas = self.iface.mapCanvas()
+        canvas_extent = canvas.extent()
+        visible = set()
+        for layer_id, layer in self.layers.items():
+            if self.is_visible(layer, canvas_extent):
+                visible.add(layer_id)
+                self.last_used[layer_id] = next(self._clock)
+
+        to_open = visible - self.open_layers
+        excess = len(self.open_layers) + len(to_open) - self.max_open
+        idle = sorted(self.open_layers - visible, key=lambda layer_id: self.last_used.get(layer_id, -1))
+        to_release = idle[:max(0, excess)]
+        if not to_open and not to_release:
+            return
+
+        # 여러 레이어를 전환해도 다시 그리기는 한 번만 합니다.
+        canvas.freeze(True)
+        try:
+            for layer_id in to_release:
+                self.release(self.layers[layer_id])
+            for layer_id in to_open:
+                self.materialize(self.layers[layer_id])
+        finally:
+            canvas.freeze(False)
+        canvas.refresh()
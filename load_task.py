@@ -0,0 +1,482 @@
+import os
+import sqlite3
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from qgis.PyQt.QtCore import QCoreApplication
+from qgis.core import QgsCoordinateReferenceSystem, QgsProject, QgsTask, QgsVectorLayer
+from .dbf_encoding import layer_uri
+from .footprint_layer import STATUS_LOADED, create_footprint_layer, save_footprint_layer
+from .gpkg_merger import merge_to_gpkg
+from .loader_core import (RESULT_LABELS, SKIPPED_DUPLICATE, SKIPPED_OUTSIDE, LayerFactory,
+                          SheetLoader)
+from .overview_builder import build_overview
+from .reprojector import converted_extent
+from .run_report import RunTimer
+from .shp_header import REASON_OPEN_FAILED, read_prj
+from .shp_scanner import safe_file_name
+from .spatial_index import build_missing_indexes, ensure_index
+from .vrt_builder import build_union_vrt
+
+
+def open_layer(path, name, encoding=None, subset=None):
+    """OGR 레이어를 만들고 유효하지 않으면 None을 반환합니다."""
+    layer = QgsVectorLayer(layer_uri(path, encoding, subset), name, "ogr")
+    if not layer.isValid():
+        return None
+
+    # 프로젝트에 등록할 수 있도록 메인 스레드로 소유권을 넘깁니다.
+    layer.moveToThread(QCoreApplication.instance().thread())
+    return layer
+
+
+class OgrLayerFactory(LayerFactory):
+    """시트마다 QGIS OGR 레이어를 만드는 팩토리입니다.
+
+    field_filter(FieldFilter)가 주어지면 시트별 SELECT 문을 하위 집합 문자열로
+    넘겨 OGR이 필드 선택과 속성 조건을 처리하게 합니다. reprojector(Reprojector)가
+    주어지면 좌표계가 다른 시트는 대상 좌표계로 변환한 결과를 엽니다.
+    """
+
+    def __init__(self, field_filter=None, reprojector=None):
+        self.field_filter = field_filter
+        self.reprojector = reprojector
+
+    def create(self, match, header, encoding):
+        # 필드 이름은 원본 .dbf에서 읽으므로 원본 인코딩을 씁니다.
+        subset = self.field_filter.sql(match, encoding) if self.field_filter is not None else None
+        path = match.path
+        if self.reprojector is not None:
+            path = self.reprojector.convert(match, encoding)
+            if path is None:
+                return None
+            if path != match.path:
+                # 변환 결과는 UTF-8 GeoPackage이므로 인코딩 옵션이 필요 없습니다.
+                encoding = None
+        return open_layer(path, match.name, encoding, subset)
+
+
+class ShpLoadTask(QgsTask):
+    """하위 폴더의 Shapefile을 백그라운드에서 병렬로 여는 작업입니다.
+
+    폴더 스캔 결과가 도착하는 대로 헤더 사전 검사, 레이어 생성과 유효성 검사를
+    작업 스레드에서 수행하고(SheetLoader), 프로젝트 등록은 taskCompleted 신호를
+    받은 메인 스레드에서 처리합니다.
+
+    extent_filter(ExtentFilter)가 주어지면 헤더 범위가 관심 영역과 겹치지 않는
+    시트는 열지 않고 건너뜁니다. skip_duplicates가 True이면 내용이 같은 시트는
+    하나만 엽니다.
+
+    단계별 소요 시간은 timer(RunTimer)에 기록합니다.
+
+    시트의 .dbf 인코딩은 .cpg 또는 .dbf 표본으로 미리 정해 열기 옵션으로 넘깁니다.
+
+    여러 파일 패턴을 한 번에 스캔하며, 통합 출력(VRT, GeoPackage)은 패턴(지형지물
+    종류)마다 하나씩 만듭니다. output_name은 출력 이름의 접두어(상위 폴더명)입니다.
+
+    출력 방식(output_mode):
+        'layers': 시트마다 레이어를 하나씩 만듭니다.
+        'vrt':    모든 시트를 참조하는 VRT 통합 레이어를 output_path 폴더에 만듭니다.
+        'gpkg':   모든 시트를 공간 인덱스가 있는 GeoPackage 테이블로 병합합니다.
+        'lazy':   OGR로 열지 않고 헤더 정보(범위, 도형 유형, .prj)만 모읍니다.
+                  자리표시자 레이어는 메인 스레드에서 만듭니다.
+
+    open_outputs가 False이면 통합 출력(VRT, GeoPackage)을 레이어로 열지 않고
+    output_sources에 경로만 기록합니다 (Processing 알고리즘용).
+
+    field_filter(FieldFilter)가 주어지면 쓰지 않는 필드는 읽지 않고 조건에 맞는
+    객체만 읽도록 OGR에 넘깁니다. 시트별 SELECT 문은 subsets에 기록합니다.
+
+    reprojector(Reprojector)가 주어지면 좌표계가 다른 시트를 대상 좌표계로 미리
+    변환하여 엽니다. 개별 레이어는 찾는 대로 작업 스레드에서 변환하고, 지연 로드와
+    VRT는 검사 후 병렬로 변환하여 sources({원본 경로: 변환 경로})에 기록하며,
+    GeoPackage 병합은 병합하면서 대상 좌표계로 변환합니다. 변환 결과의 범위를 읽은
+    시트는 headers의 범위를 대상 좌표계 범위로 바꾸고 target_bboxes에 기록합니다.
+
+    footprint_name이 주어지면 헤더를 읽은 모든 시트(관심 영역 밖과 중복 시트 포함)의
+    범위 사각형으로 도엽 색인 레이어(footprint_layer)를 만들어 footprint_path의
+    GeoPackage에 저장합니다. 저장하지 못하면 메모리 레이어로 남습니다.
+
+    overview_path가 주어지면 모든 시트의 도형을 overview_tolerance로 단순화한 작은
+    축척용 개요 테이블을 패턴마다 만들어 overview_layers에 엽니다.
+
+    known({경로: (크기, 수정 시각)})이 주어지면 이미 로드한 시트 중 바뀌지 않은
+    것은 건너뛰고 새 시트와 바뀐 시트만 엽니다 (감시 모드).
+    """
+
+    def __init__(self, base_folder, scanner, max_workers=4,
+                 output_mode='layers', output_path=None, output_name=None,
+                 build_indexes=False, extent_filter=None, open_outputs=True,
+                 skip_duplicates=False, known=None, field_filter=None,
+                 overview_path=None, overview_tolerance=0.0, reprojector=None,
+                 footprint_name=None, footprint_path=None):
+        super(ShpLoadTask, self).__init__("SHP 파일 로드", QgsTask.CanCancel)
+        self.base_folder = base_folder
+        self.scanner = scanner
+        self.max_workers = max(1, max_workers)
+        self.output_mode = output_mode
+        self.output_path = output_path
+        self.output_name = output_name
+        self.build_indexes = build_indexes
+        self.extent_filter = extent_filter
+        self.open_outputs = open_outputs
+        self.field_filter = field_filter
+        self.overview_path = overview_path
+        self.overview_tolerance = overview_tolerance
+        self.reprojector = reprojector
+        self.footprint_name = footprint_name
+        self.footprint_path = footprint_path
+        # 좌표 변환 컨텍스트는 메인 스레드에서 미리 가져옵니다.
+        self.transform_context = QgsProject.instance().transformContext() if footprint_name else None
+        self.timer = RunTimer()
+        if reprojector is not None:
+            # 좌표계 변환 시간도 이 작업의 단계별 시간에 기록합니다.
+            reprojector.timer = self.timer
+        self.loader = SheetLoader(
+            scanner, OgrLayerFactory(field_filter, reprojector), self.max_workers, extent_filter,
+            index_builder=ensure_index if build_indexes else None,
+            timer=self.timer,
+            skip_duplicates=skip_duplicates,
+            known=known)
+
+        # 결과 (메인 스레드에서 읽음)
+        self.matches = []
+        self.valid_matches = []
+        self.headers = {}
+        self.prj_wkts = {}
+        self.encodings = self.loader.encodings
+        self.subsets = {}
+        self.sources = {}
+        self.target_bboxes = set()
+        self.skipped = {}
+        self.layers = []
+        self.layer_patterns = []
+        self.overview_layers = []
+        self.footprint_layer = None
+        self.output_sources = []
+        self.feature_count = 0
+        self.merged_count = 0
+        self.index_built_count = 0
+        self.index_failed_count = 0
+        self.error_count = 0
+        self.error_reasons = Counter()
+        self.not_found_count = 0
+        self.outside_count = 0
+        self.duplicate_count = 0
+        self.exception = None
+
+    def class_name(self, pattern):
+        """파일 패턴(지형지물 종류)의 출력 이름을 반환합니다 (상위폴더명_파일명)."""
+        return f"{self.output_name}_{os.path.splitext(pattern)[0]}"
+
+    def group_by_class(self, matches):
+        """시트를 파일 패턴별로 나눠 [(패턴, 시트 목록)]을 패턴 입력 순서대로 반환합니다."""
+        groups = {pattern: [] for pattern in self.scanner.patterns}
+        for match in matches:
+            groups[match.pattern].append(match)
+        return [(pattern, members) for pattern, members in groups.items() if members]
+
+    def count_error(self, reason):
+        """로드 실패를 사유별로 집계합니다. 범위 밖 시트와 중복 시트는 따로 셉니다."""
+        if reason == SKIPPED_OUTSIDE:
+            self.outside_count += 1
+            return
+        if reason == SKIPPED_DUPLICATE:
+            self.duplicate_count += 1
+            return
+        self.error_count += 1
+        self.error_reasons[reason] += 1
+
+    def add_output(self, source, name, pattern):
+        """통합 출력 (원본, 이름)을 기록하고, open_outputs이면 레이어로 엽니다."""
+        self.output_sources.append((source, name))
+        if not self.open_outputs:
+            return
+        with self.timer.phase('open'):
+            layer = open_layer(source, name)
+        if layer is None:
+            self.count_error(REASON_OPEN_FAILED)
+        else:
+            self.layers.append(layer)
+            self.layer_patterns.append(pattern)
+
+    def count_indexes(self, built, failed):
+        """공간 인덱스 생성 결과를 집계합니다."""
+        self.index_built_count += built
+        self.index_failed_count += failed
+
+    def run(self):
+        """작업 스레드에서 실행됩니다. 취소되거나 실패하면 False를 반환합니다."""
+        manifest = self.scanner.manifest
+        if manifest is not None:
+            try:
+                manifest.load()
+            except sqlite3.Error:
+                # 캐시를 읽을 수 없으면 캐시 없이 스캔합니다.
+                self.scanner.manifest = manifest = None
+
+        try:
+            if self.output_mode == 'vrt':
+                result = self.run_vrt()
+            elif self.output_mode == 'gpkg':
+                result = self.run_gpkg()
+            elif self.output_mode == 'lazy':
+                result = self.run_lazy()
+            else:
+                result = self.run_layers()
+            if result and self.overview_path is not None and self.valid_matches:
+                result = self.run_overview()
+            if result and self.footprint_name is not None:
+                self.build_footprints()
+        except OSError as e:
+            self.exception = e
+            return False
+
+        if not result or self.isCanceled():
+            return False
+
+        self.not_found_count = self.scanner.missing_count(self.matches)
+        if manifest is not None:
+            try:
+                manifest.save()
+            except sqlite3.Error:
+                pass
+        return True
+
+    def run_layers(self):
+        """시트마다 레이어를 병렬로 엽니다."""
+        results = {}
+        # 스캔이 진행되는 동안 찾은 파일부터 바로 엽니다.
+        for done, result in enumerate(self.loader.stream(self.base_folder, self.isCanceled), start=1):
+            if result.indexed is not None:
+                self.count_indexes(int(result.indexed), int(not result.indexed))
+            if result.layer is not None:
+                results[result.match.path] = result
+                self.headers[result.match.path] = result.header
+            else:
+                # 먼저 연 시트가 경로가 더 앞선 같은 내용의 시트에 밀려나면 레이어를 버립니다.
+                if results.pop(result.match.path, None) is not None:
+                    del self.headers[result.match.path]
+                self.count_error(result.reason)
+                if result.reason in (SKIPPED_OUTSIDE, SKIPPED_DUPLICATE):
+                    self.skipped[result.match.path] = (result.match, result.reason, result.header)
+            self.setProgress(min(100.0, done * 100.0 / len(self.loader.matches)))
+        self.matches = self.loader.matches
+        if self.isCanceled():
+            return False
+
+        # 스캔 순서와 관계없이 경로 순으로 정렬합니다.
+        results = sorted(results.values(), key=lambda result: result.match.path)
+        self.layers = [result.layer for result in results]
+        self.valid_matches = [result.match for result in results]
+        self.layer_patterns = [match.pattern for match in self.valid_matches]
+        return True
+
+    def collect_matches(self):
+        """스캔 결과를 모두 모아 경로 순으로 정렬하고 헤더 검사를 통과한 시트만 남깁니다."""
+        with self.timer.phase('scan'):
+            self.matches = sorted(
+                self.scanner.scan(self.base_folder, self.isCanceled),
+                key=lambda match: match.path)
+
+        manifest = self.scanner.manifest
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # 감시 모드에서는 이미 로드한 시트를 다시 검사하지 않습니다.
+            pending = [match for match in self.matches if not self.loader.is_known(match)]
+            checks = executor.map(self.loader.check, pending)
+            for match, (header, reason) in zip(pending, checks):
+                if reason is not None:
+                    self.count_error(reason)
+                    continue
+                if manifest is not None:
+                    manifest.put_validity(match.path, True, None, header)
+                if not self.loader.in_extent(match, header):
+                    self.count_error(SKIPPED_OUTSIDE)
+                    self.skipped[match.path] = (match, SKIPPED_OUTSIDE, header)
+                    continue
+                self.headers[match.path] = header
+                self.valid_matches.append(match)
+
+            # 내용이 같은 시트는 경로가 가장 앞선 것만 남깁니다 (개별 레이어 방식과 같은 결과).
+            if self.loader.skip_duplicates:
+                keys = executor.map(
+                    self.loader.fingerprint, self.valid_matches,
+                    [self.headers[match.path] for match in self.valid_matches])
+                unique = []
+                for match, key in zip(self.valid_matches, keys):
+                    if self.loader.claim(match, key):
+                        unique.append(match)
+                    else:
+                        self.count_error(SKIPPED_DUPLICATE)
+                        self.skipped[match.path] = (match, SKIPPED_DUPLICATE, self.headers.pop(match.path))
+                self.valid_matches = unique
+
+            list(executor.map(self.loader.detect_encoding, self.valid_matches))
+            if self.field_filter is not None:
+                sqls = executor.map(
+                    self.field_filter.sql, self.valid_matches,
+                    [self.encodings.get(match.path) for match in self.valid_matches])
+                self.subsets = dict(zip((match.path for match in self.valid_matches), sqls))
+
+            # GeoPackage 병합은 병합하면서 변환하므로 미리 변환하지 않습니다.
+            if self.reprojector is not None and self.output_mode != 'gpkg':
+                converted = executor.map(
+                    self.reprojector.convert, self.valid_matches,
+                    [self.encodings.get(match.path) for match in self.valid_matches])
+                kept = []
+                for match, path in zip(self.valid_matches, converted):
+                    if path is None:
+                        self.count_error(REASON_OPEN_FAILED)
+                        del self.headers[match.path]
+                        continue
+                    if path != match.path:
+                        self.sources[match.path] = path
+                    kept.append(match)
+                self.valid_matches = kept
+
+                # 변환한 시트의 헤더 범위는 변환 결과의 범위(대상 좌표계)로 바꿉니다.
+                with self.timer.phase('reproject'):
+                    paths = list(self.sources)
+                    for path, extent in zip(paths, executor.map(converted_extent, self.sources.values())):
+                        if extent is not None:
+                            self.headers[path] = self.headers[path]._replace(bbox=extent)
+                            self.target_bboxes.add(path)
+
+    def source_match(self, match):
+        """좌표계를 변환한 시트이면 경로를 변환 결과로 바꾼 ShpMatch를 반환합니다."""
+        path = self.sources.get(match.path)
+        return match if path is None else match._replace(path=path)
+
+    def run_vrt(self):
+        """모든 시트를 VRT 통합 레이어 하나로 묶어 엽니다."""
+        self.collect_matches()
+        if self.isCanceled() or not self.valid_matches:
+            return not self.isCanceled()
+
+        # VRT는 원본 시트를 직접 읽으므로 시트별 공간 인덱스가 그대로 쓰입니다.
+        if self.build_indexes:
+            with self.timer.phase('index'):
+                self.count_indexes(*build_missing_indexes(self.valid_matches, self.max_workers, self.isCanceled))
+
+        groups = self.group_by_class(self.valid_matches)
+        for index, (pattern, matches) in enumerate(groups):
+            name = self.class_name(pattern)
+            with self.timer.phase('vrt'):
+                vrt_path = build_union_vrt(
+                    os.path.join(self.output_path, f"{safe_file_name(name)}.vrt"),
+                    [self.source_match(match) for match in matches], name, encodings=self.encodings,
+                    subsets={self.sources.get(path, path): sql for path, sql in self.subsets.items()})
+            self.add_output(vrt_path, name, pattern)
+            self.setProgress((index + 1) * 100.0 / len(groups))
+        return True
+
+    def run_lazy(self):
+        """자리표시자 레이어에 필요한 헤더 정보와 좌표계만 모읍니다."""
+        self.collect_matches()
+        if self.isCanceled():
+            return False
+
+        with self.timer.phase('prj'), ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            wkts = executor.map(read_prj, self.valid_matches)
+            self.prj_wkts = dict(zip((match.path for match in self.valid_matches), wkts))
+
+        # 변환한 시트의 자리표시자는 변환 결과의 범위와 대상 좌표계를 씁니다.
+        for path in self.target_bboxes:
+            self.prj_wkts[path] = self.reprojector.target_wkt()
+        self.layer_patterns = [match.pattern for match in self.valid_matches]
+        self.setProgress(100)
+        return True
+
+    def run_overview(self):
+        """검사를 통과한 시트를 단순화하여 패턴마다 개요 테이블을 만들고 엽니다."""
+        groups = self.group_by_class(self.valid_matches)
+        for index, (pattern, matches) in enumerate(groups):
+            name = f"{self.class_name(pattern)}_개요"
+            with self.timer.phase('overview'):
+                result = build_overview(
+                    self.overview_path, matches, name, self.overview_tolerance, self.max_workers,
+                    is_canceled=self.isCanceled,
+                    overwrite=index == 0,
+                    encodings=self.encodings,
+                    where=self.field_filter.where if self.field_filter is not None else None,
+                    target_srs=self.reprojector.target if self.reprojector is not None else None,
+                    assumed_srs=self.reprojector.assumed if self.reprojector is not None else None)
+            if result is None:
+                return False
+            if result.sheets:
+                layer = open_layer(f"{self.overview_path}|layername={name}", name)
+                if layer is not None:
+                    self.overview_layers.append(layer)
+        return True
+
+    def build_footprints(self):
+        """헤더 범위로 시트마다 사각형 하나를 담은 도엽 색인 레이어를 만듭니다."""
+        entries = [(match, self.headers[match.path], STATUS_LOADED) for match in self.valid_matches]
+        entries += [
+            (match, header, RESULT_LABELS.get(reason, reason))
+            for match, reason, header in sorted(self.skipped.values(), key=lambda entry: entry[0].path)
+        ]
+        if not entries:
+            return
+
+        with self.timer.phase('footprint'):
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                wkts = list(executor.map(read_prj, [match for match, _, _ in entries]))
+            # 변환 결과의 범위로 바꾼 헤더 범위는 대상 좌표계 기준입니다.
+            if self.target_bboxes:
+                target_wkt = self.reprojector.target_wkt()
+                wkts = [
+                    target_wkt if match.path in self.target_bboxes else wkt
+                    for (match, _, _), wkt in zip(entries, wkts)
+                ]
+
+            # 대상 좌표계가 없으면 가장 많은 시트의 좌표계를 씁니다.
+            if self.reprojector is not None and self.reprojector.target_wkt():
+                crs_wkt = self.reprojector.target_wkt()
+            else:
+                crs_wkt = Counter(wkt for wkt in wkts if wkt).most_common(1)
+                crs_wkt = crs_wkt[0][0] if crs_wkt else None
+            crs = QgsCoordinateReferenceSystem.fromWkt(crs_wkt) if crs_wkt else QgsCoordinateReferenceSystem()
+
+            layer = create_footprint_layer(
+                self.footprint_name,
+                [(match, header, wkt, self.encodings.get(match.path), status)
+                 for (match, header, status), wkt in zip(entries, wkts)],
+                crs, self.transform_context)
+            if self.footprint_path is not None:
+                layer = save_footprint_layer(layer, self.footprint_path, self.transform_context) or layer
+        layer.moveToThread(QCoreApplication.instance().thread())
+        self.footprint_layer = layer
+
+    def run_gpkg(self):
+        """모든 시트를 GeoPackage 테이블 하나로 병합한 뒤 엽니다."""
+        self.collect_matches()
+        if self.isCanceled() or not self.valid_matches:
+            return not self.isCanceled()
+
+        # 패턴마다 같은 GeoPackage 안에 테이블을 하나씩 만듭니다.
+        groups = self.group_by_class(self.valid_matches)
+        for index, (pattern, matches) in enumerate(groups):
+            name = self.class_name(pattern)
+            with self.timer.phase('merge'):
+                result = merge_to_gpkg(
+                    self.output_path, matches, name,
+                    progress=lambda fraction, index=index: self.setProgress(
+                        (index + fraction) * 99.0 / len(groups)),
+                    is_canceled=self.isCanceled,
+                    overwrite=index == 0,
+                    encodings=self.encodings,
+                    fields=self.field_filter.fields if self.field_filter is not None else None,
+                    where=self.field_filter.where if self.field_filter is not None else None,
+                    target_srs=self.reprojector.target if self.reprojector is not None else None,
+                    assumed_srs=self.reprojector.assumed if self.reprojector is not None else None)
+            if result is None:
+                return False
+            for _ in result.failed:
+                self.count_error(REASON_OPEN_FAILED)
+            self.feature_count += result.features
+            self.merged_count += result.sheets
+
+            if result.sheets:
+                self.add_output(f"{self.output_path}|layername={name}", name, pattern)
+        self.setProgress(100)
+        return True
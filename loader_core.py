@@ -0,0 +1,331 @@
+"""QGIS에 의존하지 않는 시트 검색·검사·레이어 생성 엔진입니다.
+
+폴더 스캔 결과를 생성기로 받아, 찾는 대로 헤더 검사, 관심 영역 확인,
+인코딩 판별, 레이어 생성을 작업 스레드에서 수행하고 결과를 끝나는 순서대로
+반환합니다. 레이어를 만드는 방법은 LayerFactory 구현으로 바꿀 수 있으므로
+QGIS 플러그인, 명령줄 도구, 벤치마크가 같은 엔진을 사용합니다.
+
+명령줄 사용법:
+    python -m gis_shp_loader.loader_core 상위폴더 "*_A0010000.shp" [--depth 2] [--zips] [--json]
+"""
+
+import argparse
+import json
+import queue
+import sys
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from .dbf_encoding import EncodingDetector
+from .run_report import RunTimer
+from .shp_header import REASON_LABELS, REASON_OPEN_FAILED, ShpHeader, fingerprint, read_header
+from .shp_scanner import ShpScanner, split_patterns
+
+# 관심 영역 밖이라 건너뛴 시트
+SKIPPED_OUTSIDE = 'outside'
+# 같은 내용의 시트가 이미 있어 건너뛴 시트
+SKIPPED_DUPLICATE = 'duplicate'
+
+# 실패 사유와 건너뛴 사유의 표시 이름
+RESULT_LABELS = dict(REASON_LABELS, **{
+    SKIPPED_OUTSIDE: "관심 영역 밖",
+    SKIPPED_DUPLICATE: "중복 시트",
+})
+
+# 시트 하나의 처리 결과
+#   match:   ShpMatch
+#   layer:   팩토리가 만든 레이어 (실패하거나 건너뛰면 None)
+#   header:  ShpHeader (헤더 검사에 실패하면 None)
+#   reason:  실패 또는 건너뛴 사유 (성공하면 None)
+#   indexed: 공간 인덱스 생성 결과 True/False (만들지 않았으면 None)
+SheetResult = namedtuple('SheetResult', ['match', 'layer', 'header', 'reason', 'indexed'])
+
+
+class LayerFactory:
+    """검사를 통과한 시트로 레이어를 만드는 팩토리의 기본 클래스입니다.
+
+    create는 작업 스레드에서 동시에 호출되므로 스레드 안전해야 합니다.
+    """
+
+    def create(self, match, header, encoding):
+        """시트 레이어를 만들어 반환합니다. 만들 수 없으면 None을 반환합니다."""
+        raise NotImplementedError
+
+
+class HeaderLayerFactory(LayerFactory):
+    """레이어를 열지 않고 헤더를 그대로 반환하는 팩토리입니다 (검색·검사만 할 때)."""
+
+    def create(self, match, header, encoding):
+        return header
+
+
+class SheetLoader:
+    """스캐너가 찾은 시트를 검사하고 팩토리로 레이어를 만듭니다.
+
+    scanner.manifest(ScanManifest)가 있으면 헤더 검사 결과를 캐시에서 가져오고
+    새 결과를 기록합니다. extent_filter는 intersects(match, header)를 제공하는
+    객체이며, index_builder는 시트를 열기 전에 호출되어 공간 인덱스 생성 결과
+    (True/False, 필요 없으면 None)를 반환하는 함수입니다.
+
+    skip_duplicates가 True이면 크기, 헤더 범위, 레코드 수, .shp 앞부분 해시가
+    같은 시트는 경로가 가장 앞선 하나만 남기고 나머지는 duplicates에 기록합니다.
+    작업이 끝나는 순서와 관계없이 남는 시트가 같습니다.
+
+    known({경로: (크기, 수정 시각)})이 주어지면 이미 로드하여 바뀌지 않은 시트는
+    matches에만 기록하고 다시 열지 않습니다 (감시 모드의 증분 로드).
+    """
+
+    def __init__(self, scanner, factory=None, max_workers=4, extent_filter=None,
+                 index_builder=None, timer=None, skip_duplicates=False, known=None):
+        self.scanner = scanner
+        self.factory = factory if factory is not None else HeaderLayerFactory()
+        self.max_workers = max(1, max_workers)
+        self.extent_filter = extent_filter
+        self.index_builder = index_builder
+        self.timer = timer if timer is not None else RunTimer()
+        self.skip_duplicates = skip_duplicates
+        self.known = known if known is not None else {}
+        self.encoding_detector = EncodingDetector()
+        self._lock = threading.Lock()
+        # 지문별로 남긴 시트 경로, 중복 시트의 지문, 남겼다가 밀려난 시트 경로
+        self._fingerprints = {}
+        self._duplicate_keys = {}
+        self._displaced = []
+
+        # 결과 (stream 호출 시 초기화되며, encodings는 작업 스레드에서 채워짐)
+        self.matches = []
+        self.encodings = {}
+
+    @property
+    def duplicates(self):
+        """[(중복 시트 경로, 남긴 시트 경로)]를 경로 순으로 반환합니다."""
+        with self._lock:
+            return sorted((path, self._fingerprints[key]) for path, key in self._duplicate_keys.items())
+
+    def is_known(self, match):
+        """이미 로드한 시트이고 그 뒤로 크기와 수정 시각이 바뀌지 않았으면 True를 반환합니다."""
+        return self.known.get(match.path) == (match.size, match.mtime_ns)
+
+    def check(self, match):
+        """OGR로 열기 전에 헤더를 검사합니다.
+
+        파일이 바뀌지 않았으면 스캔 캐시에 저장된 이전 결과를 그대로 사용합니다.
+        캐시에는 헤더를 읽어 얻은 결과만 저장하며, OGR 열기 실패는 필터 조건,
+        좌표계 변환, 네트워크 오류처럼 파일과 관계없는 원인일 수 있으므로 저장하지
+        않습니다 (이전 버전이 저장한 열기 실패는 무시하고 다시 검사합니다).
+
+        Returns:
+            tuple: (ShpHeader, None) 또는 검사에 실패하면 (None, 사유)
+        """
+        with self.timer.phase('check', match.path):
+            manifest = self.scanner.manifest
+            if manifest is not None:
+                validity = manifest.get_validity(match.path)
+                if validity is not None:
+                    valid, reason = validity
+                    if not valid and reason != REASON_OPEN_FAILED:
+                        return None, reason
+                    header = manifest.get_header(match.path)
+                    if valid and header is not None:
+                        return ShpHeader(header[0], tuple(header[1]), header[2]), None
+
+            header, reason = read_header(match)
+            if manifest is not None and reason is not None:
+                manifest.put_validity(match.path, False, reason)
+            return header, reason
+
+    def detect_encoding(self, match):
+        """시트의 .dbf 인코딩을 정해 encodings에 기록하고 반환합니다."""
+        with self.timer.phase('encoding', match.path):
+            encoding = self.encoding_detector.detect(match)
+        if encoding is not None:
+            self.encodings[match.path] = encoding
+        return encoding
+
+    def fingerprint(self, match, header):
+        """시트 내용 지문을 반환합니다. 읽을 수 없으면 None."""
+        with self.timer.phase('fingerprint', match.path):
+            return fingerprint(match, header)
+
+    def claim(self, match, key):
+        """같은 지문의 시트 중 경로가 가장 앞서면 True를 반환합니다.
+
+        경로가 더 앞선 같은 지문의 시트가 이미 있으면 이 시트를 중복으로 기록하고
+        False를 반환합니다. 이 시트가 먼저 남긴 시트보다 앞서면 그 시트를 중복으로
+        바꾸고 밀려난 시트로 기록합니다. 지문이 없으면 항상 True입니다.
+        """
+        if key is None:
+            return True
+        with self._lock:
+            original = self._fingerprints.setdefault(key, match.path)
+            if original == match.path:
+                return True
+            if original < match.path:
+                self._duplicate_keys[match.path] = key
+                return False
+            self._fingerprints[key] = match.path
+            self._duplicate_keys[original] = key
+            self._displaced.append(original)
+            return True
+
+    def is_duplicate(self, path):
+        """중복으로 기록된 시트이면 True를 반환합니다."""
+        with self._lock:
+            return path in self._duplicate_keys
+
+    def take_displaced(self):
+        """남겼다가 더 앞선 시트에 밀려난 시트 경로를 꺼내 반환합니다."""
+        with self._lock:
+            displaced, self._displaced = self._displaced, []
+            return displaced
+
+    def in_extent(self, match, header):
+        """관심 영역이 없거나 시트가 관심 영역과 겹치면 True를 반환합니다."""
+        return self.extent_filter is None or self.extent_filter.intersects(match, header)
+
+    def load(self, match):
+        """헤더를 검사하고, 필요하면 공간 인덱스를 먼저 만든 뒤 레이어를 만듭니다.
+
+        Returns:
+            SheetResult: 시트 처리 결과
+        """
+        header, reason = self.check(match)
+        if reason is not None:
+            return SheetResult(match, None, None, reason, None)
+        manifest = self.scanner.manifest
+        if manifest is not None:
+            manifest.put_validity(match.path, True, None, header)
+        if not self.in_extent(match, header):
+            return SheetResult(match, None, header, SKIPPED_OUTSIDE, None)
+        if self.skip_duplicates and not self.claim(match, self.fingerprint(match, header)):
+            return SheetResult(match, None, header, SKIPPED_DUPLICATE, None)
+
+        indexed = None
+        if self.index_builder is not None:
+            with self.timer.phase('index', match.path):
+                indexed = self.index_builder(match)
+        encoding = self.detect_encoding(match)
+        with self.timer.phase('open', match.path):
+            layer = self.factory.create(match, header, encoding)
+        reason = None if layer is not None else REASON_OPEN_FAILED
+        return SheetResult(match, layer, header, reason, indexed)
+
+    def stream(self, root, is_canceled=None):
+        """root 아래의 시트를 찾는 대로 처리하고 결과를 끝나는 순서대로 반환하는 생성기입니다.
+
+        스캔이 끝나기를 기다리지 않고 찾은 시트부터 작업 스레드에서 처리합니다.
+        찾은 시트는 찾은 순서대로 self.matches에 쌓입니다. known에 있는 바뀌지 않은
+        시트는 처리하지 않습니다. 상위 폴더를 읽을 수 없으면 OSError가 발생합니다.
+
+        중복 시트를 제외할 때, 이미 넘긴 시트가 나중에 끝난 경로가 더 앞선 같은
+        내용의 시트에 밀려나면 그 시트의 결과를 reason이 SKIPPED_DUPLICATE인
+        결과로 한 번 더 넘깁니다. 호출자는 앞서 받은 레이어를 버려야 합니다.
+        """
+        self.matches = []
+        with self._lock:
+            self._fingerprints = {}
+            self._duplicate_keys = {}
+            self._displaced = []
+        completed = queue.SimpleQueue()
+        futures = []
+        loaded = {}
+        yielded = 0
+
+        def settle(result):
+            """결과를 넘기고, 그 사이 밀려난 시트의 정정 결과를 이어서 넘깁니다."""
+            if result.reason is None and self.is_duplicate(result.match.path):
+                result = result._replace(layer=None, reason=SKIPPED_DUPLICATE, indexed=None)
+            yield result
+            if result.reason is None:
+                loaded[result.match.path] = result
+            yield from corrections()
+
+        def corrections():
+            for path in self.take_displaced():
+                result = loaded.pop(path, None)
+                if result is not None:
+                    yield result._replace(layer=None, reason=SKIPPED_DUPLICATE, indexed=None)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                scan_start = time.perf_counter()
+                for match in self.scanner.scan(root, is_canceled):
+                    self.matches.append(match)
+                    if self.is_known(match):
+                        continue
+                    future = executor.submit(self.load, match)
+                    future.add_done_callback(completed.put)
+                    futures.append(future)
+                    # 스캔하는 동안에도 끝난 결과를 바로 넘깁니다.
+                    while not completed.empty():
+                        yield from settle(completed.get().result())
+                        yielded += 1
+                self.timer.add('scan', time.perf_counter() - scan_start, start=scan_start)
+
+                while yielded < len(futures):
+                    if is_canceled is not None and is_canceled():
+                        return
+                    try:
+                        future = completed.get(timeout=0.1)
+                    except queue.Empty:
+                        continue
+                    yield from settle(future.result())
+                    yielded += 1
+                yield from corrections()
+            finally:
+                # 취소되거나 호출자가 중간에 멈추면 대기 중인 작업을 버립니다.
+                for future in futures:
+                    future.cancel()
+
+
+def main(argv=None):
+    """명령줄에서 시트를 검색·검사하고 결과를 출력합니다."""
+    parser = argparse.ArgumentParser(description="같은 이름의 Shapefile을 검색하고 헤더를 검사합니다.")
+    parser.add_argument('root', help="상위 폴더")
+    parser.add_argument('pattern', help="파일 이름 패턴 (쉼표로 여러 개, 정규식은 세미콜론)")
+    parser.add_argument('--regex', action='store_true', help="패턴을 정규식으로 해석")
+    parser.add_argument('--depth', type=int, default=1, help="검색 깊이")
+    parser.add_argument('--zips', action='store_true', help="ZIP 내부도 검색")
+    parser.add_argument('--workers', type=int, default=8, help="동시 작업 수")
+    parser.add_argument('--dedupe', action='store_true', help="같은 내용의 시트는 하나만 정상으로 처리")
+    parser.add_argument('--json', action='store_true', help="결과를 한 줄에 하나씩 JSON으로 출력")
+    args = parser.parse_args(argv)
+
+    scanner = ShpScanner(
+        split_patterns(args.pattern, args.regex), max_depth=args.depth,
+        use_regex=args.regex, max_workers=args.workers, scan_zips=args.zips)
+    loader = SheetLoader(scanner, max_workers=args.workers, skip_duplicates=args.dedupe)
+
+    # 밀려난 중복 시트는 결과가 한 번 더 오므로 시트마다 마지막 결과로 집계합니다.
+    statuses = {}
+    for result in loader.stream(args.root):
+        statuses[result.match.path] = result.reason
+        if args.json:
+            print(json.dumps({
+                'path': result.match.path,
+                'name': result.match.name,
+                'pattern': result.match.pattern,
+                'reason': result.reason,
+                'encoding': loader.encodings.get(result.match.path),
+                'header': None if result.header is None else result.header._asdict(),
+            }, ensure_ascii=False), flush=True)
+        else:
+            status = RESULT_LABELS.get(result.reason, result.reason) if result.reason else "정상"
+            print(f"{result.match.name}\t{status}\t{result.match.path}", flush=True)
+
+    reasons = Counter(statuses.values())
+    print(f"찾은 파일: {len(loader.matches)}개, 정상: {reasons[None]}개, "
+          f"찾지 못함: {scanner.missing_count(loader.matches)}개", file=sys.stderr)
+    for reason, count in reasons.items():
+        if reason is not None:
+            print(f"  {RESULT_LABELS.get(reason, reason)}: {count}개", file=sys.stderr)
+    for path, original in loader.duplicates:
+        print(f"  중복: {path} = {original}", file=sys.stderr)
+    for line in loader.timer.summary_lines():
+        print(f"  {line}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
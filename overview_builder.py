@@ -0,0 +1,232 @@
+import multiprocessing
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from osgeo import gdal, ogr, osr
+from .field_filter import where_fields
+from .gpkg_merger import open_output_gpkg, promote_geometry_type, traditional_axis_order
+from .reprojector import spatial_reference
+
+
+# 개요 생성 결과
+#   sheets:   개요에 포함된 시트 수
+#   features: 기록된 객체 수
+#   failed:   열지 못한 시트 경로 목록
+OverviewResult = namedtuple('OverviewResult', ['sheets', 'features', 'failed'])
+
+# 작업 프로세스가 이 시간(초) 안에 뜨지 않으면 스레드로 처리합니다.
+PROCESS_START_TIMEOUT = 30
+
+
+def simplify_sheet(path, tolerance, encoding=None, where=None):
+    """시트 하나의 도형을 단순화하여 (좌표계 WKT, 도형 유형, [WKB])를 반환합니다.
+
+    작업 프로세스에서 실행되므로 결과는 피클 가능한 값만 담습니다. where에 쓰인
+    필드 외의 속성 필드는 읽지 않으며, 단순화 후 비어 버린 도형은 버립니다. 열 수 없으면 None.
+    """
+    src_ds = gdal.OpenEx(
+        path, gdal.OF_VECTOR,
+        open_options=[f'ENCODING={encoding}'] if encoding else [])
+    if src_ds is None or src_ds.GetLayerCount() == 0:
+        return None
+    layer = src_ds.GetLayer(0)
+    if where and layer.SetAttributeFilter(where) != ogr.OGRERR_NONE:
+        return None
+    defn = layer.GetLayerDefn()
+    names = [defn.GetFieldDefn(i).GetName() for i in range(defn.GetFieldCount())]
+    filtered = set(where_fields(where, names))
+    layer.SetIgnoredFields([name for name in names if name not in filtered])
+
+    srs = layer.GetSpatialRef()
+    geometries = []
+    for feature in layer:
+        geometry = feature.GetGeometryRef()
+        if geometry is None:
+            continue
+        simplified = geometry.SimplifyPreserveTopology(tolerance)
+        if simplified is None or simplified.IsEmpty():
+            continue
+        geometries.append(bytes(simplified.ExportToWkb()))
+    return (srs.ExportToWkt() if srs is not None else None), layer.GetGeomType(), geometries
+
+
+def python_executable():
+    """작업 프로세스를 띄울 파이썬 실행 파일을 찾습니다. 찾지 못하면 None.
+
+    QGIS 안에서는 sys.executable이 QGIS 실행 파일(Windows의 qgis-bin.exe, macOS의
+    QGIS.app)이므로, 그대로 쓰면 파이썬 대신 QGIS가 다시 실행됩니다. 이때는 같은
+    배포판의 파이썬 실행 파일을 찾습니다.
+    """
+    if os.path.basename(sys.executable).lower().startswith('python'):
+        return sys.executable
+    if os.name == 'nt':
+        candidates = [os.path.join(sys.exec_prefix, name) for name in ('pythonw.exe', 'python.exe')]
+    else:
+        version = f"{sys.version_info.major}.{sys.version_info.minor}"
+        folders = [
+            os.path.join(sys.exec_prefix, 'bin'),
+            os.path.dirname(sys.executable),
+            os.path.join(os.path.dirname(sys.executable), 'bin'),
+        ]
+        candidates = [os.path.join(folder, name) for folder in folders for name in (f'python{version}', 'python3')]
+    for candidate in candidates:
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+def stop_pool(executor):
+    """작업 프로세스를 강제로 끝내고 풀을 닫습니다."""
+    # ProcessPoolExecutor에는 프로세스를 끝내는 공개 API가 없습니다.
+    for process in list((getattr(executor, '_processes', None) or {}).values()):
+        process.terminate()
+    executor.shutdown(wait=False)
+
+
+def process_pool(max_workers):
+    """단순화에 쓸 프로세스 풀을 만들고 작업 프로세스가 뜨는지 확인합니다.
+
+    파이썬 실행 파일을 찾지 못하거나 작업 프로세스가 PROCESS_START_TIMEOUT 안에
+    응답하지 않으면 BrokenProcessPool이 발생합니다.
+    """
+    python = python_executable()
+    if python is None:
+        raise BrokenProcessPool("작업 프로세스에 쓸 파이썬 실행 파일을 찾을 수 없습니다")
+    context = multiprocessing.get_context('spawn')
+    context.set_executable(python)
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=context)
+    try:
+        executor.submit(os.getpid).result(timeout=PROCESS_START_TIMEOUT)
+    except (FutureTimeoutError, BrokenProcessPool, OSError) as e:
+        stop_pool(executor)
+        raise BrokenProcessPool(f"작업 프로세스를 시작할 수 없습니다: {e}") from e
+    return executor
+
+
+def _run_jobs(executor, remaining, is_canceled):
+    """remaining({경로: 작업 인자})을 실행하고 끝난 작업을 remaining에서 지우며 반환합니다."""
+    futures = {executor.submit(simplify_sheet, *job): path for path, job in remaining.items()}
+    try:
+        for future in as_completed(futures):
+            if is_canceled is not None and is_canceled():
+                return
+            path = futures[future]
+            try:
+                result = future.result()
+            except (RuntimeError, OSError):
+                result = None
+            del remaining[path]
+            yield path, result
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def simplify_sheets(jobs, max_workers, is_canceled=None):
+    """시트를 작업 프로세스에서 병렬로 단순화하고 (경로, 결과)를 끝나는 순서대로 반환하는 생성기입니다.
+
+    작업 프로세스를 띄울 수 없는 환경이면 남은 시트를 스레드로 처리합니다.
+    """
+    remaining = {job[0]: job for job in jobs}
+    try:
+        with process_pool(max_workers) as executor:
+            yield from _run_jobs(executor, remaining, is_canceled)
+    except (BrokenProcessPool, OSError):
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from _run_jobs(executor, remaining, is_canceled)
+
+
+def build_overview(gpkg_path, matches, layer_name, tolerance, max_workers=4, source_field='source_sheet',
+                   progress=None, is_canceled=None, overwrite=True, encodings=None, where=None,
+                   target_srs=None, assumed_srs=None):
+    """모든 시트의 도형을 단순화하여 작은 축척용 개요 테이블 하나로 만듭니다.
+
+    단순화는 시트마다 작업 프로세스에서 병렬로 수행하고, 결과는 이 스레드에서
+    시트 하나씩 트랜잭션으로 GeoPackage에 기록합니다. 속성은 원본 시트 이름
+    (source_field)만 남깁니다. 좌표계가 다른 시트는 target_srs(없으면 처음 기록한
+    시트의 좌표계)로 변환합니다.
+
+    Args:
+        gpkg_path: 기록할 .gpkg 파일 경로
+        matches: ShpMatch 목록
+        layer_name: 생성할 테이블 이름
+        tolerance: 단순화 허용 오차 (시트 좌표계 단위)
+        max_workers: 작업 프로세스 수
+        source_field: 원본 시트 이름을 담을 필드 이름
+        progress: 진행률(0.0~1.0)을 받는 함수
+        is_canceled: 취소 여부를 반환하는 함수
+        overwrite: True이면 기존 파일을 지우고, False이면 기존 파일에 테이블을 추가합니다
+        encodings: 시트 경로별 .dbf 인코딩 {경로: 인코딩} (선택)
+        where: OGR SQL WHERE 절 (선택)
+        target_srs: 출력 좌표계 ('EPSG:5186' 같은 코드 또는 WKT, 선택)
+        assumed_srs: .prj가 없는 시트의 좌표계 (선택)
+
+    Returns:
+        OverviewResult: 생성 결과 (취소되면 None)
+    """
+    out_ds = open_output_gpkg(gpkg_path, layer_name, overwrite)
+
+    names = {match.path: match.name for match in matches}
+    jobs = [(match.path, tolerance, (encodings or {}).get(match.path), where) for match in matches]
+    out_layer = None
+    out_srs = None
+    out_type = ogr.wkbUnknown
+    transforms = {}
+    sheets = 0
+    features = 0
+    failed = []
+
+    try:
+        for done, (path, result) in enumerate(simplify_sheets(jobs, max_workers, is_canceled), start=1):
+            if progress is not None:
+                progress(done / len(matches))
+            if result is None:
+                failed.append(path)
+                continue
+            wkt, geom_type, geometries = result
+            if wkt is None:
+                wkt = assumed_srs
+
+            # 처음 기록하는 시트로 테이블 구조를 정합니다.
+            if out_layer is None:
+                out_definition = target_srs or wkt
+                out_srs = traditional_axis_order(spatial_reference(out_definition)) if out_definition else None
+                out_type = promote_geometry_type(geom_type)
+                out_layer = out_ds.CreateLayer(
+                    layer_name, out_srs, out_type,
+                    options=['SPATIAL_INDEX=YES', 'GEOMETRY_NAME=geom'])
+                out_layer.CreateField(ogr.FieldDefn(source_field, ogr.OFTString))
+
+            if wkt not in transforms:
+                src_srs = traditional_axis_order(spatial_reference(wkt)) if wkt else None
+                transforms[wkt] = None
+                if out_srs is not None and src_srs is not None and not out_srs.IsSame(src_srs):
+                    transforms[wkt] = osr.CoordinateTransformation(src_srs, out_srs)
+            transform = transforms[wkt]
+
+            out_defn = out_layer.GetLayerDefn()
+            out_ds.StartTransaction()
+            for wkb in geometries:
+                geometry = ogr.CreateGeometryFromWkb(wkb)
+                if transform is not None:
+                    geometry.Transform(transform)
+                if out_type != ogr.wkbUnknown and geometry.GetGeometryType() != out_type:
+                    geometry = ogr.ForceTo(geometry, out_type)
+                out_feature = ogr.Feature(out_defn)
+                out_feature.SetField(0, names[path])
+                out_feature.SetGeometry(geometry)
+                out_layer.CreateFeature(out_feature)
+            out_ds.CommitTransaction()
+
+            features += len(geometries)
+            sheets += 1
+
+        if is_canceled is not None and is_canceled():
+            return None
+    finally:
+        out_ds = None
+
+    return OverviewResult(sheets, features, failed)
@@ -63,8 +63,29 @@ def get_files_to_include():
 
     # 선택적 파일 (있으면 포함)
     optional_files = [
+        'aoi_filter.py',
+        'dbf_encoding.py',
+        'field_filter.py',
+        'footprint_layer.py',
         'gis_shp_loader.py',
         'gis_shp_loader_dialog.py',
+        'gpkg_merger.py',
+        'layer_registry.py',
+        'lazy_layers.py',
+        'load_task.py',
+        'loader_core.py',
+        'overview_builder.py',
+        'processing_provider.py',
+        'project_restore.py',
+        'reprojector.py',
+        'run_report.py',
+        'scan_cache.py',
+        'shared_style.py',
+        'shp_header.py',
+        'shp_scanner.py',
+        'spatial_index.py',
+        'vrt_builder.py',
+        'watch_mode.py',
         'icon.png',
         'README.md',
         'LICENSE',
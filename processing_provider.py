@@ -0,0 +1,213 @@
+import os
+from qgis.PyQt.QtGui import QIcon
+from qgis.core import (QgsApplication, QgsProcessingAlgorithm,
+                       QgsProcessingContext, QgsProcessingException,
+                       QgsProcessingOutputMultipleLayers, QgsProcessingOutputNumber,
+                       QgsProcessingParameterBoolean, QgsProcessingParameterCrs,
+                       QgsProcessingParameterEnum,
+                       QgsProcessingParameterFile, QgsProcessingParameterFolderDestination,
+                       QgsProcessingParameterNumber, QgsProcessingParameterString,
+                       QgsProcessingProvider)
+from .field_filter import FieldFilter, split_fields
+from .load_task import ShpLoadTask
+from .reprojector import Reprojector
+from .scan_cache import ScanManifest
+from .shp_header import REASON_LABELS
+from .shp_scanner import ShpScanner, split_patterns
+
+
+class MergeShapefilesAlgorithm(QgsProcessingAlgorithm):
+    """하위 폴더의 같은 이름 Shapefile을 VRT 또는 GeoPackage로 묶는 알고리즘입니다.
+
+    iface나 대화상자를 사용하지 않으므로 qgis_process와 일괄 처리(batch)
+    모드에서 실행할 수 있습니다. 스캔과 병합은 ShpLoadTask를 현재 스레드에서
+    직접 실행하며, 결과 레이어는 열지 않고 출력 경로만 반환합니다.
+    """
+
+    FOLDER = 'FOLDER'
+    PATTERN = 'PATTERN'
+    REGEX = 'REGEX'
+    MAX_DEPTH = 'MAX_DEPTH'
+    SCAN_ZIPS = 'SCAN_ZIPS'
+    USE_CACHE = 'USE_CACHE'
+    WORKERS = 'WORKERS'
+    MODE = 'MODE'
+    BUILD_INDEXES = 'BUILD_INDEXES'
+    SKIP_DUPLICATES = 'SKIP_DUPLICATES'
+    FIELDS = 'FIELDS'
+    WHERE = 'WHERE'
+    TARGET_CRS = 'TARGET_CRS'
+    OUTPUT = 'OUTPUT'
+    OUTPUT_LAYERS = 'OUTPUT_LAYERS'
+    SHEET_COUNT = 'SHEET_COUNT'
+    ERROR_COUNT = 'ERROR_COUNT'
+
+    MODES = ['vrt', 'gpkg']
+
+    def name(self):
+        return 'mergeshapefiles'
+
+    def displayName(self):
+        return "같은 이름 Shapefile 일괄 병합"
+
+    def shortHelpString(self):
+        return ("상위 폴더 아래 하위 폴더에서 같은 이름의 Shapefile을 찾아 "
+                "파일 패턴마다 VRT 통합 레이어 또는 GeoPackage 테이블 하나로 묶습니다.\n"
+                "파일 패턴은 쉼표로 여러 개를 입력할 수 있습니다 (정규식은 세미콜론).\n"
+                "GeoPackage는 출력 폴더에 {상위폴더명}.gpkg로 만들어집니다.")
+
+    def createInstance(self):
+        return MergeShapefilesAlgorithm()
+
+    def initAlgorithm(self, config=None):
+        self.addParameter(QgsProcessingParameterFile(
+            self.FOLDER, "상위 폴더", behavior=QgsProcessingParameterFile.Folder))
+        self.addParameter(QgsProcessingParameterString(
+            self.PATTERN, "파일 이름 (쉼표로 여러 개)", defaultValue='*_A0010000.shp'))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.REGEX, "정규식", defaultValue=False))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.MAX_DEPTH, "검색 깊이", QgsProcessingParameterNumber.Integer,
+            defaultValue=1, minValue=1, maxValue=10))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.SCAN_ZIPS, "ZIP 내부 검색", defaultValue=False))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.USE_CACHE, "스캔 캐시 사용", defaultValue=True))
+        self.addParameter(QgsProcessingParameterNumber(
+            self.WORKERS, "동시 작업 수", QgsProcessingParameterNumber.Integer,
+            defaultValue=4, minValue=1, maxValue=16))
+        self.addParameter(QgsProcessingParameterEnum(
+            self.MODE, "출력 방식", options=["VRT 통합 레이어", "GeoPackage 병합"],
+            defaultValue=1))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.BUILD_INDEXES, "공간 인덱스(.qix) 생성", defaultValue=False))
+        self.addParameter(QgsProcessingParameterBoolean(
+            self.SKIP_DUPLICATES, "중복 시트 제외", defaultValue=False))
+        self.addParameter(QgsProcessingParameterString(
+            self.FIELDS, "남길 필드 (쉼표로 여러 개, 비우면 모든 필드)", optional=True))
+        self.addParameter(QgsProcessingParameterString(
+            self.WHERE, "속성 조건 (OGR SQL WHERE 절)", optional=True))
+        self.addParameter(QgsProcessingParameterCrs(
+            self.TARGET_CRS, "대상 좌표계 (비우면 변환하지 않음)", optional=True))
+        self.addParameter(QgsProcessingParameterFolderDestination(
+            self.OUTPUT, "출력 폴더"))
+        self.addOutput(QgsProcessingOutputMultipleLayers(self.OUTPUT_LAYERS, "출력 레이어"))
+        self.addOutput(QgsProcessingOutputNumber(self.SHEET_COUNT, "병합한 시트 수"))
+        self.addOutput(QgsProcessingOutputNumber(self.ERROR_COUNT, "오류 수"))
+
+    def processAlgorithm(self, parameters, context, feedback):
+        base_folder = self.parameterAsFile(parameters, self.FOLDER, context)
+        if not base_folder or not os.path.isdir(base_folder):
+            raise QgsProcessingException(f"존재하지 않는 폴더입니다: {base_folder}")
+
+        use_regex = self.parameterAsBoolean(parameters, self.REGEX, context)
+        patterns = split_patterns(self.parameterAsString(parameters, self.PATTERN, context), use_regex)
+        if not patterns:
+            raise QgsProcessingException("파일 이름을 입력해주세요.")
+
+        manifest = None
+        if self.parameterAsBoolean(parameters, self.USE_CACHE, context):
+            manifest = ScanManifest(
+                os.path.join(QgsApplication.qgisSettingsDirPath(), 'gis_shp_loader', 'scan_cache.sqlite'),
+                base_folder)
+
+        workers = self.parameterAsInt(parameters, self.WORKERS, context)
+        target_crs = self.parameterAsCrs(parameters, self.TARGET_CRS, context)
+        # 좌표계 변환 캐시는 파일 크기와 수정 시각으로 찾으므로 캐시 값을 쓰지 않습니다.
+        scanner = ShpScanner(
+            patterns,
+            max_depth=self.parameterAsInt(parameters, self.MAX_DEPTH, context),
+            use_regex=use_regex,
+            max_workers=workers,
+            manifest=manifest,
+            scan_zips=self.parameterAsBoolean(parameters, self.SCAN_ZIPS, context),
+            stat_files=target_crs.isValid())
+
+        # 출력 이름 설정 (플러그인 대화상자와 같은 규칙)
+        folder_name = os.path.basename(os.path.normpath(base_folder))
+        output_folder = self.parameterAsString(parameters, self.OUTPUT, context)
+        os.makedirs(output_folder, exist_ok=True)
+        output_mode = self.MODES[self.parameterAsEnum(parameters, self.MODE, context)]
+        output_path = output_folder
+        if output_mode == 'gpkg':
+            output_path = os.path.join(output_folder, f"{folder_name}.gpkg")
+
+        field_filter = None
+        fields = split_fields(self.parameterAsString(parameters, self.FIELDS, context))
+        where = self.parameterAsString(parameters, self.WHERE, context)
+        if fields or where.strip():
+            field_filter = FieldFilter(fields, where)
+
+        # 변환 결과는 VRT가 참조하므로 출력 폴더에 둡니다.
+        reprojector = None
+        if target_crs.isValid():
+            reprojector = Reprojector(
+                target_crs.authid() or target_crs.toWkt(), os.path.join(output_folder, 'reprojected'))
+
+        task = ShpLoadTask(
+            base_folder, scanner, workers,
+            output_mode=output_mode,
+            output_path=output_path,
+            output_name=folder_name,
+            build_indexes=self.parameterAsBoolean(parameters, self.BUILD_INDEXES, context),
+            skip_duplicates=self.parameterAsBoolean(parameters, self.SKIP_DUPLICATES, context),
+            open_outputs=False,
+            field_filter=field_filter,
+            reprojector=reprojector)
+        task.progressChanged.connect(feedback.setProgress)
+        feedback.canceled.connect(task.cancel)
+        if feedback.isCanceled():
+            return {}
+
+        feedback.pushInfo(f"{base_folder} 검색 중...")
+        if not task.run():
+            if task.exception is not None:
+                raise QgsProcessingException(f"폴더를 읽을 수 없습니다: {str(task.exception)}")
+            return {}
+
+        feedback.pushInfo(f"{len(task.valid_matches)}개 시트를 출력 {len(task.output_sources)}개로 묶음")
+        for line in task.timer.summary_lines():
+            feedback.pushInfo(line)
+        for reason, count in task.error_reasons.items():
+            feedback.reportError(f"{REASON_LABELS.get(reason, reason)}: {count}개")
+        for path, original in task.loader.duplicates:
+            feedback.pushInfo(f"중복 시트 제외: {path} (같은 내용: {original})")
+        if task.not_found_count:
+            feedback.pushInfo(f"찾지 못한 파일: {task.not_found_count}개")
+        if field_filter is not None:
+            for field, count in field_filter.missing.most_common():
+                feedback.reportError(f"'{field}' 필드가 없는 시트: {count}개")
+            if field_filter.unmatched_count:
+                feedback.reportError(
+                    f"목록의 필드가 하나도 없어 모든 필드를 읽은 시트: {field_filter.unmatched_count}개")
+        for path, message in scanner.errors:
+            feedback.reportError(f"폴더를 읽을 수 없음: {path} ({message})")
+
+        sources = []
+        for source, name in task.output_sources:
+            sources.append(source)
+            context.addLayerToLoadOnCompletion(
+                source, QgsProcessingContext.LayerDetails(name, context.project(), self.OUTPUT_LAYERS))
+
+        return {
+            self.OUTPUT: output_folder,
+            self.OUTPUT_LAYERS: sources,
+            self.SHEET_COUNT: len(task.valid_matches),
+            self.ERROR_COUNT: task.error_count,
+        }
+
+
+class GisShpLoaderProvider(QgsProcessingProvider):
+    """GIS SHP Loader 알고리즘을 Processing 도구 상자에 등록합니다."""
+
+    def id(self):
+        return 'gis_shp_loader'
+
+    def name(self):
+        return "GIS SHP Loader"
+
+    def icon(self):
+        return QIcon(os.path.join(os.path.dirname(__file__), 'icon.png'))
+
+    def loadAlgorithms(self):
+        self.addAlgorithm(MergeShapefilesAlgorithm())
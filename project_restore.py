@@ -0,0 +1,138 @@
+import os
+from qgis.core import Qgis
+from .lazy_layers import PROPERTY_BBOX, PROPERTY_SOURCE
+from .shp_scanner import split_vsizip
+
+# 시트 레이어에 함께 저장하는 원본 시트 정보
+PROPERTY_ORIGIN = 'gis_shp_loader/origin'
+PROPERTY_MTIME = 'gis_shp_loader/mtime_ns'
+PROPERTY_ENCODING = 'gis_shp_loader/encoding'
+
+
+def trust_project(project):
+    """프로젝트를 열 때 저장된 범위와 객체 수를 그대로 믿도록 설정합니다.
+
+    프로젝트의 모든 레이어에 적용되는 설정이므로 사용자가 선택했을 때만 호출합니다.
+    """
+    if hasattr(Qgis, 'ProjectFlag'):
+        project.setFlag(Qgis.ProjectFlag.TrustStoredLayerStatistics, True)
+    else:
+        project.setTrustLayerMetadata(True)
+
+
+def file_mtime(path):
+    """시트 파일(ZIP 내부 시트는 ZIP 파일)의 수정 시각(나노초)을 반환합니다. 없으면 None."""
+    zip_member = split_vsizip(path)
+    try:
+        return os.stat(zip_member[0] if zip_member is not None else path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def stamp_layer(layer, match, encoding=None):
+    """시트 레이어에 원본 경로, 수정 시각, 인코딩을 기록하고 범위를 프로젝트에서 읽게 합니다.
+
+    사용자 속성은 프로젝트에 함께 저장되므로, 다시 열 때 수정 시각이 바뀐 시트만
+    골라 범위를 다시 계산할 수 있습니다. 나머지 시트는 프로젝트에 저장된 범위를
+    그대로 쓰므로 공급자가 범위를 계산하지 않습니다.
+    """
+    layer.setCustomProperty(PROPERTY_ORIGIN, match.path)
+    layer.setCustomProperty(PROPERTY_MTIME, str(match.mtime_ns))
+    if encoding:
+        layer.setCustomProperty(PROPERTY_ENCODING, encoding)
+    layer.setReadExtentFromXml(True)
+
+
+def write_sources(doc, layers):
+    """저장할 프로젝트 문서에서 지연 로드 자리표시자를 원본 OGR 레이어로 바꿔 씁니다.
+
+    지금 자리표시자(메모리 레이어)인 시트도 프로젝트에는 실제 데이터 원본으로
+    저장되므로, 플러그인 없이 열어도(QGIS Server, qgis_process 포함) 시트가 빈
+    레이어가 되지 않습니다. 현재 열려 있는 레이어는 바뀌지 않습니다.
+
+    그 대신 다시 열 때 QGIS가 이 시트들의 공급자를 모두 엽니다. 공급자 열기는
+    미루지 못하며, 플러그인은 연 뒤에 열린 레이어 수 제한만 다시 적용합니다.
+
+    Args:
+        doc: writeProject 신호로 받은 QDomDocument
+        layers: 프로젝트의 {레이어 ID: 레이어}
+
+    Returns:
+        int: 바꿔 쓴 레이어 수
+    """
+    sources = {
+        layer_id: layer.customProperty(PROPERTY_SOURCE)
+        for layer_id, layer in layers.items()
+        if layer.providerType() == 'memory' and layer.customProperty(PROPERTY_SOURCE) is not None
+    }
+    if not sources:
+        return 0
+
+    count = 0
+    elements = doc.elementsByTagName('maplayer')
+    for index in range(elements.count()):
+        element = elements.at(index).toElement()
+        uri = sources.get(element.firstChildElement('id').text())
+        if uri is None:
+            continue
+        replace_text(doc, element.firstChildElement('datasource'), uri)
+        replace_text(doc, element.firstChildElement('provider'), 'ogr')
+        count += 1
+
+    # 레이어 트리에도 공급자 정보가 저장됩니다.
+    nodes = doc.elementsByTagName('layer-tree-layer')
+    for index in range(nodes.count()):
+        element = nodes.at(index).toElement()
+        uri = sources.get(element.attribute('id'))
+        if uri is not None:
+            element.setAttribute('source', uri)
+            element.setAttribute('providerKey', 'ogr')
+    return count
+
+
+def replace_text(doc, element, text):
+    """XML 요소의 텍스트를 바꿉니다."""
+    if element.isNull():
+        return
+    while element.hasChildNodes():
+        element.removeChild(element.firstChild())
+    element.appendChild(doc.createTextNode(text))
+
+
+def restore_layers(layers):
+    """프로젝트를 연 뒤 플러그인이 로드한 시트 레이어를 확인합니다.
+
+    수정 시각이 저장된 값과 같은 시트는 프로젝트에 저장된 범위를 그대로 믿고,
+    바뀐 시트만 공급자에서 범위를 다시 계산합니다. 지연 로드로 만든 시트는 다시
+    지연 로드 관리자에 맡길 수 있도록 따로 모읍니다.
+
+    Args:
+        layers: 프로젝트의 레이어 목록
+
+    Returns:
+        tuple: (지연 로드로 관리할 레이어 목록, 바뀐 시트 경로 목록, 없어진 시트 경로 목록)
+    """
+    lazy = []
+    changed = []
+    missing = []
+    for layer in layers:
+        origin = layer.customProperty(PROPERTY_ORIGIN)
+        if origin is None:
+            continue
+
+        mtime_ns = file_mtime(origin)
+        if mtime_ns is None or not layer.isValid():
+            missing.append(origin)
+            continue
+        if str(mtime_ns) != str(layer.customProperty(PROPERTY_MTIME)):
+            changed.append(origin)
+            layer.updateExtents(True)
+            layer.setCustomProperty(PROPERTY_MTIME, str(mtime_ns))
+            if layer.customProperty(PROPERTY_BBOX) is not None:
+                extent = layer.extent()
+                bbox = (extent.xMinimum(), extent.yMinimum(), extent.xMaximum(), extent.yMaximum())
+                layer.setCustomProperty(PROPERTY_BBOX, ','.join(repr(value) for value in bbox))
+
+        if layer.customProperty(PROPERTY_SOURCE) is not None:
+            lazy.append(layer)
+    return lazy, changed, missing
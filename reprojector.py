@@ -0,0 +1,146 @@
+import hashlib
+import os
+import threading
+from collections import Counter
+from osgeo import gdal, ogr, osr
+from .shp_header import read_prj
+
+# .prj가 없는 시트의 좌표계 그룹 이름
+UNKNOWN_CRS = "(.prj 없음)"
+
+
+def spatial_reference(definition):
+    """'EPSG:5186' 같은 코드나 WKT로 좌표계를 만듭니다. 해석할 수 없으면 None."""
+    srs = osr.SpatialReference()
+    try:
+        if srs.SetFromUserInput(definition) != 0:
+            return None
+    except RuntimeError:
+        return None
+    return srs
+
+
+class Reprojector:
+    """좌표계가 다른 시트를 대상 좌표계의 GeoPackage로 미리 변환하고 캐시합니다.
+
+    시트 좌표계는 .prj로 정하고, 같은 .prj 내용은 한 번만 해석하여 좌표계별로
+    시트 수를 집계합니다(crs_counts). 이미 대상 좌표계인 시트는 변환하지 않습니다.
+    .prj가 없는 시트는 assumed가 주어졌을 때만 그 좌표계로 보고 변환합니다.
+
+    변환 결과는 cache_dir에 원본 경로, 크기, 수정 시각, 대상 좌표계로 만든 이름으로
+    저장되므로 원본이 바뀌지 않았으면 다음 로드에서 그대로 재사용합니다. convert는
+    작업 스레드에서 동시에 호출해도 안전합니다.
+    """
+
+    def __init__(self, target, cache_dir, assumed=None, timer=None):
+        """
+        Args:
+            target: 대상 좌표계 ('EPSG:5186' 같은 코드 또는 WKT)
+            cache_dir: 변환 결과를 저장할 폴더
+            assumed: .prj가 없는 시트의 좌표계 (선택)
+            timer: 변환 시간을 기록할 RunTimer (선택)
+        """
+        self.target = target
+        self.target_srs = spatial_reference(target)
+        self.cache_dir = cache_dir
+        self.assumed = assumed
+        self.timer = timer
+        self._lock = threading.Lock()
+        self._groups = {}
+        self.crs_counts = Counter()
+        self.converted_count = 0
+        self.reused_count = 0
+
+    def source_group(self, match):
+        """시트의 (좌표계 이름, 변환 필요 여부, .prj WKT)를 반환합니다."""
+        wkt = read_prj(match)
+        with self._lock:
+            if wkt not in self._groups:
+                definition = wkt if wkt is not None else self.assumed
+                srs = spatial_reference(definition) if definition else None
+                if srs is None:
+                    # 좌표계를 알 수 없으면 변환하지 않고 원본을 그대로 씁니다.
+                    group = (UNKNOWN_CRS if wkt is None else wkt[:40], False)
+                else:
+                    needs = self.target_srs is not None and not srs.IsSame(self.target_srs)
+                    group = (srs.GetName() or UNKNOWN_CRS, needs)
+                self._groups[wkt] = group
+            name, needs = self._groups[wkt]
+            self.crs_counts[name] += 1
+        return name, needs, wkt
+
+    def cache_path(self, match):
+        """원본 경로, 크기, 수정 시각과 대상 좌표계로 만든 변환 결과 경로를 반환합니다."""
+        key = f"{match.path}|{match.size}|{match.mtime_ns}|{self.target}|{self.assumed}"
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.gpkg')
+
+    def convert(self, match, encoding=None):
+        """시트를 대상 좌표계로 변환한 GeoPackage 경로를 반환합니다.
+
+        변환이 필요 없으면 원본 경로를, 변환에 실패하면 None을 반환합니다.
+        """
+        _, needs, wkt = self.source_group(match)
+        if not needs:
+            return match.path
+
+        out_path = self.cache_path(match)
+        if os.path.exists(out_path):
+            with self._lock:
+                self.reused_count += 1
+            return out_path
+
+        if self.timer is not None:
+            with self.timer.phase('reproject', match.path):
+                converted = self.translate(match, out_path, encoding, wkt is None)
+        else:
+            converted = self.translate(match, out_path, encoding, wkt is None)
+        if converted:
+            with self._lock:
+                self.converted_count += 1
+            return out_path
+        return None
+
+    def translate(self, match, out_path, encoding, assume_source):
+        """ogr2ogr(VectorTranslate)로 시트 하나를 변환합니다. 성공하면 True."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # 변환 중인 파일을 다른 로드가 재사용하지 않도록 다른 이름으로 만든 뒤 바꿉니다.
+        part_path = f"{out_path}.{threading.get_ident()}.part"
+        options = gdal.VectorTranslateOptions(
+            format='GPKG',
+            dstSRS=self.target,
+            srcSRS=self.assumed if assume_source else None,
+            reproject=True,
+            geometryType='PROMOTE_TO_MULTI',
+            layerName=os.path.splitext(os.path.basename(match.path))[0],
+            layerCreationOptions=['SPATIAL_INDEX=YES'])
+        try:
+            src_ds = gdal.OpenEx(
+                match.path, gdal.OF_VECTOR,
+                open_options=[f'ENCODING={encoding}'] if encoding else [])
+            if src_ds is None:
+                return False
+            out_ds = gdal.VectorTranslate(part_path, src_ds, options=options)
+            if out_ds is None:
+                return False
+            out_ds = None
+            src_ds = None
+            os.replace(part_path, out_path)
+            return True
+        except (RuntimeError, OSError):
+            return False
+        finally:
+            if os.path.exists(part_path):
+                os.remove(part_path)
+
+    def target_wkt(self):
+        """대상 좌표계의 WKT를 반환합니다."""
+        return self.target_srs.ExportToWkt() if self.target_srs is not None else None
+
+
+def converted_extent(path):
+    """변환된 GeoPackage 레이어의 범위를 (xmin, ymin, xmax, ymax)로 반환합니다. 읽을 수 없으면 None."""
+    data_source = ogr.Open(path)
+    if data_source is None or data_source.GetLayerCount() == 0:
+        return None
+    xmin, xmax, ymin, ymax = data_source.GetLayer(0).GetExtent()
+    return xmin, ymin, xmax, ymax
@@ -0,0 +1,118 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+# 단계 이름 → 표시 이름 (로그 출력 순서)
+PHASE_LABELS = {
+    'scan': "폴더 스캔",
+    'check': "존재/헤더 유효성 검사",
+    'encoding': "인코딩 판별",
+    'fingerprint': "중복 검사(내용 지문)",
+    'index': "공간 인덱스 생성",
+    'open': "OGR 열기",
+    'prj': "좌표계(.prj) 읽기",
+    'vrt': "VRT 생성",
+    'merge': "GeoPackage 병합",
+    'overview': "개요 레이어 생성",
+    'reproject': "좌표계 변환",
+    'footprint': "도엽 색인 생성",
+    'register': "프로젝트 등록",
+    'style': "공유 스타일 적용",
+    'render': "첫 렌더링",
+}
+
+# 보고서에 기록할 가장 느린 시트 수
+SLOWEST_COUNT = 20
+
+
+class RunTimer:
+    """로드 단계별 소요 시간을 스레드 안전하게 모읍니다.
+
+    단계마다 누적 시간(작업 스레드들의 합), 실제 경과 시간(첫 시작부터 마지막
+    종료까지), 횟수를 기록하고, 경로가 주어지면 시트별 단계 시간도 기록합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.phases = {}
+        self.sheets = {}
+
+    @contextmanager
+    def phase(self, name, path=None):
+        """with 블록의 소요 시간을 name 단계로 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, path, start)
+
+    def add(self, name, seconds, path=None, start=None):
+        """단계 시간을 직접 기록합니다. start를 주지 않으면 지금 끝난 것으로 봅니다."""
+        end = time.perf_counter()
+        if start is None:
+            start = end - seconds
+        with self._lock:
+            phase = self.phases.setdefault(name, {'seconds': 0.0, 'count': 0, 'first': start, 'last': end})
+            phase['seconds'] += seconds
+            phase['count'] += 1
+            phase['first'] = min(phase['first'], start)
+            phase['last'] = max(phase['last'], end)
+            if path is not None:
+                sheet = self.sheets.setdefault(path, {})
+                sheet[name] = sheet.get(name, 0.0) + seconds
+
+    def elapsed(self):
+        """작업 시작부터 지금까지의 시간(초)을 반환합니다."""
+        return time.perf_counter() - self.started
+
+    def summary_lines(self):
+        """단계별 시간 요약 문자열 목록을 반환합니다."""
+        lines = [f"전체: {self.elapsed():.2f}초"]
+        for name in sorted(self.phases, key=lambda name: self.phases[name]['first']):
+            phase = self.phases[name]
+            lines.append(
+                f"{PHASE_LABELS.get(name, name)}: {phase['last'] - phase['first']:.2f}초 "
+                f"(누적 {phase['seconds']:.2f}초, {phase['count']}회)")
+        return lines
+
+    def report(self, matches, **info):
+        """JSON으로 저장할 실행 보고서를 dict로 만듭니다.
+
+        Args:
+            matches: 검색된 ShpMatch 목록 (시트 크기에 사용)
+            info: 보고서에 함께 기록할 값 (상위 폴더, 출력 방식 등)
+        """
+        sizes = {match.path: match.size for match in matches}
+        sheets = [
+            {'path': path, 'seconds': sum(phases.values()), 'bytes': sizes.get(path), 'phases': phases}
+            for path, phases in self.sheets.items()
+        ]
+        sheets.sort(key=lambda sheet: sheet['path'])
+        slowest = sorted(sheets, key=lambda sheet: sheet['seconds'], reverse=True)[:SLOWEST_COUNT]
+        return dict(info, **{
+            'total_seconds': self.elapsed(),
+            'sheet_count': len(matches),
+            'bytes': sum(sizes.values()),
+            'phases': {
+                name: {
+                    'wall_seconds': phase['last'] - phase['first'],
+                    'seconds': phase['seconds'],
+                    'count': phase['count'],
+                }
+                for name, phase in self.phases.items()
+            },
+            'slowest': [{'path': sheet['path'], 'seconds': sheet['seconds']} for sheet in slowest],
+            'sheets': sheets,
+        })
+
+
+def write_report(path, report):
+    """실행 보고서를 JSON 파일로 저장하고 경로를 반환합니다."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    return path
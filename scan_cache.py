@@ -0,0 +1,174 @@
+import json
+import os
+import sqlite3
+import threading
+
+
+class ScanManifest:
+    """상위 폴더별 스캔 결과를 저장하는 SQLite 캐시입니다.
+
+    폴더의 수정 시각(mtime)이 이전 실행과 같으면 폴더 목록을 다시 읽지 않고
+    캐시에서 가져오며, 검색된 파일의 크기/수정 시각과 마지막 유효성 검사 결과도
+    함께 기록합니다. 헤더 검사를 통과한 파일은 .shp 헤더 정보도 저장합니다.
+    작업 스레드에서 사용할 수 있도록 load()로 메모리에 읽어 들인 뒤 조회하고,
+    save()로 한 번의 트랜잭션에 기록합니다.
+
+    파일 내용만 바뀌고 폴더 항목이 그대로이면 폴더 mtime이 바뀌지 않으므로,
+    그런 경우에는 캐시를 사용하지 않고 스캔해야 합니다.
+    """
+
+    SCHEMA_VERSION = 2
+
+    def __init__(self, db_path, root):
+        self.db_path = db_path
+        self.root = os.path.normpath(root)
+        self._lock = threading.Lock()
+        self._dirs = {}
+        self._files = {}
+        self._seen_dirs = set()
+        self._seen_files = set()
+        self._dirty_dirs = set()
+        self._dirty_files = set()
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def _connect(self):
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        connection = sqlite3.connect(self.db_path)
+        version = connection.execute('PRAGMA user_version').fetchone()[0]
+        if version != self.SCHEMA_VERSION:
+            # 구조가 바뀌면 캐시를 새로 만듭니다.
+            connection.executescript('''
+                DROP TABLE IF EXISTS dirs;
+                DROP TABLE IF EXISTS files;
+            ''')
+            connection.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        connection.executescript('''
+            CREATE TABLE IF NOT EXISTS dirs (
+                path TEXT PRIMARY KEY,
+                root TEXT NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                entries TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS files (
+                path TEXT PRIMARY KEY,
+                root TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                valid INTEGER,
+                reason TEXT,
+                header TEXT
+            );
+            CREATE INDEX IF NOT EXISTS dirs_root ON dirs (root);
+            CREATE INDEX IF NOT EXISTS files_root ON files (root);
+        ''')
+        return connection
+
+    def load(self):
+        """이 상위 폴더의 캐시를 메모리로 읽어 들입니다."""
+        connection = self._connect()
+        try:
+            for path, mtime_ns, entries in connection.execute(
+                    'SELECT path, mtime_ns, entries FROM dirs WHERE root = ?', (self.root,)):
+                self._dirs[path] = (mtime_ns, [tuple(entry) for entry in json.loads(entries)])
+            for path, size, mtime_ns, valid, reason, header in connection.execute(
+                    'SELECT path, size, mtime_ns, valid, reason, header FROM files WHERE root = ?',
+                    (self.root,)):
+                self._files[path] = [
+                    size, mtime_ns, None if valid is None else bool(valid), reason,
+                    None if header is None else json.loads(header)]
+        finally:
+            connection.close()
+
+    def get_listing(self, path, mtime_ns):
+        """mtime이 같으면 캐시된 폴더 항목 [(이름, 폴더 여부)]를, 아니면 None을 반환합니다.
+
+        ZIP 파일은 같은 방식으로 내부 파일 [(이름, 크기)]를 저장합니다.
+        """
+        with self._lock:
+            self._seen_dirs.add(path)
+            cached = self._dirs.get(path)
+            if cached is not None and cached[0] == mtime_ns:
+                self.hit_count += 1
+                return cached[1]
+            self.miss_count += 1
+            return None
+
+    def put_listing(self, path, mtime_ns, entries):
+        """새로 읽은 폴더 항목을 기록합니다."""
+        with self._lock:
+            self._dirs[path] = (mtime_ns, entries)
+            self._dirty_dirs.add(path)
+
+    def get_file(self, path):
+        """캐시된 파일 (크기, mtime)을 반환합니다. 없으면 None."""
+        with self._lock:
+            self._seen_files.add(path)
+            cached = self._files.get(path)
+            return None if cached is None else (cached[0], cached[1])
+
+    def put_file(self, path, size, mtime_ns):
+        """파일 크기와 mtime을 기록합니다. 바뀌었으면 유효성 결과를 지웁니다."""
+        with self._lock:
+            self._seen_files.add(path)
+            cached = self._files.get(path)
+            if cached is not None and cached[0] == size and cached[1] == mtime_ns:
+                return
+            self._files[path] = [size, mtime_ns, None, None, None]
+            self._dirty_files.add(path)
+
+    def get_validity(self, path):
+        """마지막 유효성 검사 결과 (유효 여부, 사유)를 반환합니다. 없으면 None."""
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is None or cached[2] is None:
+                return None
+            return cached[2], cached[3]
+
+    def get_header(self, path):
+        """저장된 헤더 정보(ShpHeader 필드 목록)를 반환합니다. 없으면 None."""
+        with self._lock:
+            cached = self._files.get(path)
+            return None if cached is None else cached[4]
+
+    def put_validity(self, path, valid, reason=None, header=None):
+        """유효성 검사 결과와 헤더 정보를 기록합니다."""
+        with self._lock:
+            cached = self._files.get(path)
+            if cached is None:
+                return
+            cached[2] = valid
+            cached[3] = reason
+            if header is not None:
+                cached[4] = list(header)
+            self._dirty_files.add(path)
+
+    def save(self, prune=True):
+        """변경된 항목을 한 번의 트랜잭션으로 저장합니다.
+
+        prune이 True이면 이번 스캔에서 보이지 않은 항목(삭제된 폴더 등)을 지웁니다.
+        """
+        connection = self._connect()
+        try:
+            with connection:
+                connection.executemany(
+                    'INSERT OR REPLACE INTO dirs (path, root, mtime_ns, entries) VALUES (?, ?, ?, ?)',
+                    [(path, self.root, self._dirs[path][0], json.dumps(self._dirs[path][1]))
+                     for path in self._dirty_dirs])
+                connection.executemany(
+                    'INSERT OR REPLACE INTO files (path, root, size, mtime_ns, valid, reason, header) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(path, self.root, *self._files[path][:4],
+                      None if self._files[path][4] is None else json.dumps(self._files[path][4]))
+                     for path in self._dirty_files])
+                if prune:
+                    connection.executemany(
+                        'DELETE FROM dirs WHERE path = ?',
+                        [(path,) for path in set(self._dirs) - self._seen_dirs])
+                    connection.executemany(
+                        'DELETE FROM files WHERE path = ?',
+                        [(path,) for path in set(self._files) - self._seen_files])
+        finally:
+            connection.close()
+        self._dirty_dirs.clear()
+        self._dirty_files.clear()
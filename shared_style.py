@@ -0,0 +1,102 @@
+import os
+from qgis.core import QgsVectorLayer, QgsWkbTypes
+
+
+class SharedStyle:
+    """여러 레이어에 같은 스타일을 적용하기 위한 원본 렌더러와 라벨 설정입니다.
+
+    스타일은 한 번만 읽어 두고, 레이어마다 렌더러와 라벨 설정의 복제본을
+    적용하므로 QML을 레이어마다 다시 해석하지 않습니다. 축척에 따른 표시 설정과
+    불투명도도 함께 적용합니다.
+    """
+
+    def __init__(self, renderer, labeling=None, labels_enabled=False,
+                 scale_based=False, minimum_scale=0.0, maximum_scale=0.0, opacity=1.0):
+        self.renderer = renderer
+        self.labeling = labeling
+        self.labels_enabled = labels_enabled
+        self.scale_based = scale_based
+        self.minimum_scale = minimum_scale
+        self.maximum_scale = maximum_scale
+        self.opacity = opacity
+
+    @classmethod
+    def from_layer(cls, layer):
+        """기존 레이어의 현재 스타일을 복제하여 만듭니다. 렌더러가 없으면 None."""
+        if layer.renderer() is None:
+            return None
+        labeling = layer.labeling()
+        return cls(
+            layer.renderer().clone(),
+            labeling.clone() if labeling is not None else None,
+            layer.labelsEnabled(),
+            layer.hasScaleBasedVisibility(),
+            layer.minimumScale(),
+            layer.maximumScale(),
+            layer.opacity())
+
+    def style_for(self, layer):
+        """레이어에 적용할 스타일을 반환합니다 (레이어와 관계없이 자기 자신)."""
+        return self
+
+    def apply(self, layer):
+        """레이어에 렌더러와 라벨 설정의 복제본을 적용합니다."""
+        layer.setRenderer(self.renderer.clone())
+        layer.setLabeling(self.labeling.clone() if self.labeling is not None else None)
+        layer.setLabelsEnabled(self.labels_enabled and self.labeling is not None)
+        layer.setScaleBasedVisibility(self.scale_based)
+        layer.setMinimumScale(self.minimum_scale)
+        layer.setMaximumScale(self.maximum_scale)
+        layer.setOpacity(self.opacity)
+
+
+class StyleFile:
+    """QML/SLD 스타일 파일을 도형 유형마다 한 번만 읽어 SharedStyle로 만듭니다.
+
+    SLD 심볼은 레이어 도형 유형에 따라 만들어지므로, 같은 도형 유형의 빈 메모리
+    레이어에 파일을 한 번 읽어 들여 원본으로 사용합니다. 읽지 못한 경우의 오류
+    메시지는 errors에 모읍니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.errors = []
+        self._styles = {}
+
+    def style_for(self, layer):
+        """레이어 도형 유형에 맞는 SharedStyle을 반환합니다. 읽을 수 없으면 None."""
+        wkb_type = layer.wkbType()
+        if wkb_type not in self._styles:
+            self._styles[wkb_type] = self.load(wkb_type)
+        return self._styles[wkb_type]
+
+    def load(self, wkb_type):
+        """빈 메모리 레이어에 스타일 파일을 읽어 SharedStyle을 만듭니다."""
+        if QgsWkbTypes.geometryType(wkb_type) in (QgsWkbTypes.NullGeometry, QgsWkbTypes.UnknownGeometry):
+            return None
+        template = QgsVectorLayer(QgsWkbTypes.displayString(wkb_type), "style", "memory")
+        if os.path.splitext(self.path)[1].lower() == '.sld':
+            message, ok = template.loadSldStyle(self.path)
+        else:
+            message, ok = template.loadNamedStyle(self.path)
+        if not ok:
+            self.errors.append(message)
+            return None
+        return SharedStyle.from_layer(template)
+
+
+def apply_shared_style(layers, style):
+    """레이어를 등록하기 전에 공유 스타일을 적용하고 적용한 레이어 수를 반환합니다.
+
+    Args:
+        layers: 아직 프로젝트에 등록하지 않은 레이어 목록
+        style: SharedStyle 또는 StyleFile
+    """
+    applied = 0
+    for layer in layers:
+        shared = style.style_for(layer)
+        if shared is None:
+            continue
+        shared.apply(layer)
+        applied += 1
+    return applied
@@ -0,0 +1,139 @@
+import hashlib
+import mmap
+import os
+import struct
+import zipfile
+from collections import namedtuple
+from .shp_scanner import split_vsizip
+
+
+# .shp 헤더에서 읽은 정보
+#   shape_type:   Shapefile 도형 유형 코드 (1 = Point, 3 = PolyLine, 5 = Polygon ...)
+#   bbox:         (xmin, ymin, xmax, ymax)
+#   record_count: .shx/.dbf 레코드 수
+ShpHeader = namedtuple('ShpHeader', ['shape_type', 'bbox', 'record_count'])
+
+# 검사 실패 사유
+REASON_MISSING_SIDECAR = 'missing_sidecar'
+REASON_EMPTY = 'empty'
+REASON_CORRUPT = 'corrupt'
+REASON_OPEN_FAILED = 'open_failed'
+
+REASON_LABELS = {
+    REASON_MISSING_SIDECAR: "부속 파일(.shx/.dbf) 누락",
+    REASON_EMPTY: "빈 파일",
+    REASON_CORRUPT: "손상된 파일",
+    REASON_OPEN_FAILED: "OGR 열기 실패",
+}
+
+SHP_HEADER_SIZE = 100
+FINGERPRINT_SAMPLE_SIZE = 64 * 1024
+SHX_RECORD_SIZE = 8
+DBF_HEADER_SIZE = 32
+
+
+def read_zip_head(zip_path, member, length):
+    """ZIP 내부 파일의 앞부분 length 바이트만 풀어 (바이트, 파일 크기)를 반환합니다."""
+    with zipfile.ZipFile(zip_path) as archive:
+        size = archive.getinfo(member).file_size
+        if size < length:
+            return None, size
+        with archive.open(member) as f:
+            return f.read(length), size
+
+
+def read_head(path, length):
+    """파일 앞부분 length 바이트를 mmap으로 읽어 (바이트, 파일 크기)를 반환합니다.
+
+    파일이 length보다 작으면 바이트 대신 None을 반환합니다.
+    /vsizip/ 경로는 ZIP에서 직접 읽습니다.
+    """
+    zip_member = split_vsizip(path)
+    if zip_member is not None:
+        return read_zip_head(*zip_member, length)
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < length:
+            return None, size
+        with mmap.mmap(f.fileno(), length, access=mmap.ACCESS_READ) as view:
+            return view[:length], size
+
+
+def read_bytes(path, length=-1):
+    """파일 앞부분을 최대 length 바이트(기본값은 전체) 읽습니다. /vsizip/ 경로도 읽습니다."""
+    zip_member = split_vsizip(path)
+    if zip_member is None:
+        with open(path, 'rb') as f:
+            return f.read(length)
+    with zipfile.ZipFile(zip_member[0]) as archive:
+        with archive.open(zip_member[1]) as f:
+            return f.read(length)
+
+
+def read_prj(match):
+    """시트의 .prj 파일 내용(WKT)을 반환합니다. 없거나 읽을 수 없으면 None."""
+    prj_path = match.sidecars.get('.prj')
+    if prj_path is None:
+        return None
+    try:
+        data = read_bytes(prj_path)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    return data.decode('utf-8', errors='ignore').strip() or None
+
+
+def fingerprint(match, header):
+    """크기, 헤더 범위, 레코드 수와 .shp 앞부분(헤더 포함) 해시로 시트 내용 지문을 만듭니다.
+
+    같은 시트를 다른 폴더에 두 번 받은 경우를 찾는 데 사용합니다.
+    파일을 읽을 수 없으면 None을 반환합니다.
+    """
+    try:
+        sample = read_bytes(match.path, FINGERPRINT_SAMPLE_SIZE)
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return None
+    return match.size, tuple(header.bbox), header.record_count, hashlib.sha1(sample).hexdigest()
+
+
+def read_header(match):
+    """.shp/.shx/.dbf 헤더만 읽어 OGR로 열기 전에 시트를 검사합니다.
+
+    Returns:
+        tuple: (ShpHeader, None) 또는 검사에 실패하면 (None, 사유)
+    """
+    shx_path = match.sidecars.get('.shx')
+    dbf_path = match.sidecars.get('.dbf')
+    if shx_path is None or dbf_path is None:
+        return None, REASON_MISSING_SIDECAR
+
+    try:
+        # .shp: 파일 코드, 파일 길이(16비트 워드, 빅 엔디언), 버전, 도형 유형, 범위
+        head, shp_size = read_head(match.path, SHP_HEADER_SIZE)
+        if head is None:
+            return None, REASON_CORRUPT
+        file_code, = struct.unpack('>i', head[0:4])
+        file_length, = struct.unpack('>i', head[24:28])
+        version, shape_type = struct.unpack('<ii', head[28:36])
+        bbox = struct.unpack('<4d', head[36:68])
+        if file_code != 9994 or version != 1000 or file_length * 2 > shp_size:
+            return None, REASON_CORRUPT
+
+        # .shx: 헤더 뒤에 레코드마다 8바이트
+        shx_head, shx_size = read_head(shx_path, SHP_HEADER_SIZE)
+        if shx_head is None or (shx_size - SHP_HEADER_SIZE) % SHX_RECORD_SIZE:
+            return None, REASON_CORRUPT
+        shx_count = (shx_size - SHP_HEADER_SIZE) // SHX_RECORD_SIZE
+
+        # .dbf: 레코드 수, 헤더 길이, 레코드 길이
+        dbf_head, dbf_size = read_head(dbf_path, DBF_HEADER_SIZE)
+        if dbf_head is None:
+            return None, REASON_CORRUPT
+        dbf_count, header_length, record_length = struct.unpack('<IHH', dbf_head[4:12])
+        if header_length + dbf_count * record_length > dbf_size or dbf_count != shx_count:
+            return None, REASON_CORRUPT
+    except (OSError, ValueError, KeyError, struct.error, zipfile.BadZipFile):
+        return None, REASON_CORRUPT
+
+    if shape_type == 0 or shx_count == 0:
+        return None, REASON_EMPTY
+    return ShpHeader(shape_type, bbox, shx_count), None
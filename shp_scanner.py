@@ -0,0 +1,308 @@
+import fnmatch
+import os
+import posixpath
+import re
+import zipfile
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+# 검색된 Shapefile 한 건
+#   path:    전체 경로
+#   name:    레이어 이름 ({폴더명}_{파일명})
+#   top:     최상위 하위 폴더 이름 (찾지 못함 집계에 사용)
+#   pattern: 일치한 파일 패턴
+#   sidecars: 같은 폴더에 있는 같은 이름의 파일 {확장자(소문자): 경로}
+#   size:    파일 크기 (바이트)
+#   mtime_ns: 파일 수정 시각 (나노초)
+# ZIP 내부 파일은 path가 /vsizip/ 경로이고 mtime_ns는 ZIP 파일의 수정 시각입니다.
+ShpMatch = namedtuple('ShpMatch', ['path', 'name', 'top', 'pattern', 'sidecars', 'size', 'mtime_ns'])
+
+VSIZIP_PREFIX = '/vsizip/'
+_VSIZIP_RE = re.compile(r'^/vsizip/(.+?\.zip)/(.+)$', re.IGNORECASE)
+
+
+def vsizip_path(zip_path, member):
+    """ZIP 내부 파일을 GDAL이 압축을 풀지 않고 열 수 있는 /vsizip/ 경로로 만듭니다."""
+    return f"{VSIZIP_PREFIX}{zip_path}/{member}"
+
+
+def split_vsizip(path):
+    """/vsizip/ 경로를 (ZIP 파일 경로, 내부 파일 이름)으로 나눕니다. 아니면 None."""
+    found = _VSIZIP_RE.match(path)
+    return None if found is None else (found.group(1), found.group(2))
+
+
+def split_patterns(text, use_regex=False):
+    """입력한 파일 이름 목록을 패턴 목록으로 나눕니다.
+
+    쉼표나 세미콜론으로 구분하며, 정규식에는 쉼표가 들어갈 수 있으므로
+    정규식일 때는 세미콜론으로만 구분합니다.
+    """
+    separator = r';' if use_regex else r'[,;]'
+    return [pattern.strip() for pattern in re.split(separator, text) if pattern.strip()]
+
+
+def safe_file_name(name):
+    """출력 이름을 파일 이름으로 쓸 수 있게 바꿉니다.
+
+    파일 패턴의 와일드카드나 정규식 기호(*, ?, \\ 등)처럼 파일 이름에 쓸 수 없는
+    글자는 밑줄로 바꿉니다. 레이어와 테이블 이름은 원래 이름을 그대로 씁니다.
+    """
+    name = re.sub(r'_{2,}', '_', re.sub(r'[^\w.-]+', '_', name)).strip('._')
+    return name or 'output'
+
+
+class ShpScanner:
+    """os.scandir 기반의 재귀 폴더 스캐너입니다.
+
+    하위 폴더 목록 조회를 스레드 풀에 분산하여 네트워크 드라이브의
+    왕복 지연이 순차적으로 쌓이지 않도록 합니다. 결과는 폴더 목록이
+    도착하는 대로 생성기로 반환됩니다.
+
+    manifest(ScanManifest)가 주어지면 수정 시각이 바뀌지 않은 폴더는
+    목록을 다시 읽지 않고 캐시에서 가져옵니다.
+
+    scan_zips가 True이면 .zip 파일을 하위 폴더처럼 취급하여 중앙 디렉터리만
+    읽고, 일치하는 내부 파일을 /vsizip/ 경로로 반환합니다. ZIP 안의 폴더
+    깊이는 제한하지 않습니다.
+
+    stat_files가 True이면 폴더 목록을 캐시에서 가져와도 일치한 파일의 크기와
+    수정 시각은 다시 조회합니다. 폴더 항목이 그대로인 채 제자리에서 덮어쓴
+    시트를 찾아야 할 때(감시 모드, 좌표계 변환 캐시) 사용합니다.
+    """
+
+    def __init__(self, patterns, max_depth=1, use_regex=False, max_workers=8, manifest=None,
+                 scan_zips=False, stat_files=False):
+        """
+        Args:
+            patterns: 파일 이름 패턴 목록 (glob 또는 정규식)
+            max_depth: 상위 폴더 아래로 검색할 최대 폴더 깊이 (1 = 바로 아래 하위 폴더)
+            use_regex: True이면 패턴을 정규식으로 해석합니다
+            max_workers: 폴더 목록 조회에 사용할 스레드 수
+            manifest: 스캔 캐시 (ScanManifest, 선택)
+            scan_zips: True이면 .zip 파일 내부도 검색합니다
+            stat_files: True이면 캐시를 사용해도 일치한 파일은 다시 조회합니다
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        self.patterns = [p for p in patterns if p]
+        self.max_depth = max(1, max_depth)
+        self.max_workers = max(1, max_workers)
+        self.manifest = manifest
+        self.scan_zips = scan_zips
+        self.stat_files = stat_files
+
+        # 대소문자를 구분하지 않고 비교합니다.
+        if use_regex:
+            self._matchers = [(p, re.compile(p, re.IGNORECASE).fullmatch) for p in self.patterns]
+        else:
+            self._matchers = [
+                (p, lambda name, pat=p.lower(): fnmatch.fnmatchcase(name.lower(), pat))
+                for p in self.patterns
+            ]
+
+        # 스캔 통계 (scan 호출 시 초기화)
+        self.top_folders = set()
+        self.dir_count = 0
+        self.errors = []
+
+    def match(self, file_name):
+        """파일 이름과 일치하는 첫 번째 패턴을 반환합니다. 없으면 None."""
+        for pattern, matcher in self._matchers:
+            if matcher(file_name):
+                return pattern
+        return None
+
+    def read_entries(self, path):
+        """폴더 항목 [(이름, 폴더 여부)]와 캐시 사용 여부를 반환합니다."""
+        mtime_ns = None
+        if self.manifest is not None:
+            mtime_ns = os.stat(path).st_mtime_ns
+            cached = self.manifest.get_listing(path, mtime_ns)
+            if cached is not None:
+                return cached, True
+
+        with os.scandir(path) as entries:
+            listing = [(entry.name, entry.is_dir()) for entry in entries]
+        if self.manifest is not None:
+            self.manifest.put_listing(path, mtime_ns, listing)
+        return listing, False
+
+    def stat_file(self, path, from_cache):
+        """파일 (크기, mtime)을 반환합니다. 폴더가 캐시에서 왔으면 캐시 값을 씁니다."""
+        if from_cache and not self.stat_files:
+            cached = self.manifest.get_file(path)
+            if cached is not None:
+                return cached
+        st = os.stat(path)
+        if self.manifest is not None:
+            self.manifest.put_file(path, st.st_size, st.st_mtime_ns)
+        return st.st_size, st.st_mtime_ns
+
+    def match_files(self, files, folder, top, stat):
+        """한 폴더의 파일 [(이름, 경로)] 중 패턴과 일치하는 것을 ShpMatch로 만듭니다.
+
+        stat은 경로를 받아 (크기, mtime)을 반환하는 함수입니다.
+        """
+        # 부속 파일(.shx, .dbf, .qix 등)은 같은 목록에서 찾아 추가 조회를 피합니다.
+        by_stem = {}
+        for file_name, file_path in files:
+            stem, ext = os.path.splitext(file_name)
+            by_stem.setdefault(stem.lower(), {})[ext.lower()] = file_path
+
+        matches = []
+        for file_name, file_path in files:
+            pattern = self.match(file_name)
+            if pattern is not None:
+                stem = os.path.splitext(file_name)[0]
+                # 레이어 이름 설정 (폴더명_파일명)
+                name = f"{folder}_{stem}"
+                size, mtime_ns = stat(file_path)
+                matches.append(ShpMatch(
+                    file_path, name, top, pattern, by_stem[stem.lower()], size, mtime_ns))
+        return matches
+
+    def list_dir(self, path, depth, top):
+        """폴더 하나를 조회하여 (일치 목록, 하위 폴더 목록)을 반환합니다.
+
+        하위 폴더 목록의 항목은 (경로, 깊이, 최상위 폴더, ZIP 여부)입니다.
+        """
+        subdirs = []
+        files = []
+        listing, from_cache = self.read_entries(path)
+        for entry_name, is_dir in listing:
+            entry_path = os.path.join(path, entry_name)
+            if is_dir:
+                if depth < self.max_depth:
+                    subdirs.append((entry_path, depth + 1, top or entry_name, False))
+            elif self.scan_zips and entry_name.lower().endswith('.zip'):
+                if depth < self.max_depth:
+                    subdirs.append((entry_path, depth + 1, top or os.path.splitext(entry_name)[0], True))
+            elif depth > 0:
+                files.append((entry_name, entry_path))
+
+        matches = self.match_files(
+            files, os.path.basename(path), top,
+            lambda file_path: self.stat_file(file_path, from_cache))
+        return matches, subdirs
+
+    def read_zip_entries(self, zip_path):
+        """ZIP 중앙 디렉터리에서 내부 파일 [(이름, 크기)]와 ZIP의 mtime을 반환합니다.
+
+        압축은 풀지 않으며, manifest가 있으면 ZIP mtime이 같을 때 캐시를 사용합니다.
+        """
+        mtime_ns = os.stat(zip_path).st_mtime_ns
+        if self.manifest is not None:
+            cached = self.manifest.get_listing(zip_path, mtime_ns)
+            if cached is not None:
+                return cached, mtime_ns
+
+        try:
+            with zipfile.ZipFile(zip_path) as archive:
+                listing = [(info.filename, info.file_size)
+                           for info in archive.infolist() if not info.is_dir()]
+        except zipfile.BadZipFile as e:
+            raise OSError(f"{zip_path}: {str(e)}")
+        if self.manifest is not None:
+            self.manifest.put_listing(zip_path, mtime_ns, listing)
+        return listing, mtime_ns
+
+    def list_zip(self, zip_path, depth, top):
+        """ZIP 파일 하나를 조회하여 (일치 목록, 빈 하위 폴더 목록)을 반환합니다.
+
+        레이어 이름의 폴더명은 ZIP 안의 폴더 이름이며, 최상위에 있는 파일은
+        ZIP 파일 이름을 사용합니다.
+        """
+        listing, mtime_ns = self.read_zip_entries(zip_path)
+        files_by_dir = {}
+        sizes = {}
+        for member, size in listing:
+            parent, file_name = posixpath.split(member)
+            member_path = vsizip_path(zip_path, member)
+            files_by_dir.setdefault(parent, []).append((file_name, member_path))
+            sizes[member_path] = size
+
+        def stat(member_path):
+            # 내부 파일의 유효성 결과는 ZIP이 바뀌면 다시 검사하도록 ZIP mtime으로 기록합니다.
+            if self.manifest is not None:
+                self.manifest.put_file(member_path, sizes[member_path], mtime_ns)
+            return sizes[member_path], mtime_ns
+
+        zip_stem = os.path.splitext(os.path.basename(zip_path))[0]
+        matches = []
+        for parent, files in files_by_dir.items():
+            folder = posixpath.basename(parent) or zip_stem
+            matches.extend(self.match_files(files, folder, top, stat))
+        return matches, []
+
+    def scan(self, root, is_canceled=None):
+        """root 아래의 일치하는 Shapefile을 찾는 대로 반환하는 생성기입니다.
+
+        상위 폴더 자체를 읽을 수 없으면 OSError가 발생하며,
+        하위 폴더 조회 오류는 self.errors에 기록하고 계속 진행합니다.
+        """
+        self.top_folders = set()
+        self.dir_count = 0
+        self.errors = []
+
+        # 상위 폴더는 직접 조회하여 오류를 호출자에게 전달합니다.
+        _, subdirs = self.list_dir(root, 0, '')
+        self.dir_count = 1
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {}
+
+            def submit(entries):
+                for path, depth, top, is_zip in entries:
+                    if depth == 1:
+                        self.top_folders.add(top)
+                    list_entry = self.list_zip if is_zip else self.list_dir
+                    pending[executor.submit(list_entry, path, depth, top)] = path
+
+            submit(subdirs)
+            try:
+                while pending:
+                    if is_canceled is not None and is_canceled():
+                        return
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        path = pending.pop(future)
+                        self.dir_count += 1
+                        try:
+                            matches, subdirs = future.result()
+                        except OSError as e:
+                            self.errors.append((path, str(e)))
+                            continue
+                        submit(subdirs)
+                        for match in matches:
+                            yield match
+            finally:
+                # 취소되거나 호출자가 중간에 멈추면 대기 중인 조회를 버립니다.
+                for future in pending:
+                    future.cancel()
+
+    def missing_count(self, matches):
+        """최상위 하위 폴더별로 찾지 못한 파일 패턴 수를 합하여 반환합니다."""
+        found = {(match.top, match.pattern) for match in matches}
+        return len(self.top_folders) * len(self.patterns) - len(found)
+
+
+def count_file_names(root, max_depth=1, max_folders=None, max_workers=8, scan_zips=False):
+    """하위 폴더에 있는 Shapefile 이름별 개수를 셉니다.
+
+    max_folders가 주어지면 그 수만큼의 최상위 하위 폴더를 확인한 뒤 멈춥니다.
+
+    Returns:
+        Counter: {파일 이름: 개수}
+    """
+    scanner = ShpScanner('*.shp', max_depth=max_depth, max_workers=max_workers, scan_zips=scan_zips)
+    counts = Counter()
+    tops = set()
+    for match in scanner.scan(root):
+        if max_folders is not None and match.top not in tops and len(tops) >= max_folders:
+            break
+        tops.add(match.top)
+        counts[os.path.basename(match.path)] += 1
+    return counts
@@ -0,0 +1,61 @@
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from osgeo import ogr
+from .shp_scanner import split_vsizip
+
+
+def needs_index(match):
+    """.qix 공간 인덱스가 없거나 .shp보다 오래되었으면 True를 반환합니다."""
+    if os.path.splitext(match.path)[1].lower() != '.shp':
+        return False
+    # ZIP 내부 파일에는 인덱스를 쓸 수 없습니다.
+    if split_vsizip(match.path) is not None:
+        return False
+    qix_path = match.sidecars.get('.qix')
+    if qix_path is None:
+        return True
+    try:
+        return os.stat(qix_path).st_mtime < os.stat(match.path).st_mtime
+    except OSError:
+        return True
+
+
+def build_index(path):
+    """Shapefile 하나에 .qix 공간 인덱스를 생성합니다. 성공하면 True를 반환합니다."""
+    data_source = ogr.Open(path, 1)
+    if data_source is None or data_source.GetLayerCount() == 0:
+        return False
+    layer_name = data_source.GetLayer(0).GetName()
+    data_source.ExecuteSQL(f'CREATE SPATIAL INDEX ON "{layer_name}"')
+    data_source = None
+    return os.path.exists(os.path.splitext(path)[0] + '.qix')
+
+
+def ensure_index(match):
+    """필요하면 .qix를 만들고 성공 여부를, 필요 없으면 None을 반환합니다."""
+    if not needs_index(match):
+        return None
+    return build_index(match.path)
+
+
+def build_missing_indexes(matches, max_workers=4, is_canceled=None):
+    """공간 인덱스가 필요한 시트에 .qix를 병렬로 생성합니다.
+
+    Returns:
+        tuple: (생성한 수, 실패한 수)
+    """
+    targets = [match.path for match in matches if needs_index(match)]
+    built = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [executor.submit(build_index, path) for path in targets]
+        for future in as_completed(futures):
+            if is_canceled is not None and is_canceled():
+                for pending in futures:
+                    pending.cancel()
+                break
+            if future.result():
+                built += 1
+            else:
+                failed += 1
+    return built, failed
@@ -0,0 +1,230 @@
+"""QGIS 없이 실행할 수 있는 검색·검사 엔진 테스트입니다.
+
+합성 시트는 benchmark.generate_tree로 만들고, 레이어는 HeaderLayerFactory로
+헤더만 반환합니다.
+
+    python -m pytest tests
+"""
+
+import os
+import shutil
+import sys
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import benchmark  # noqa: E402
+
+loader_core = benchmark.plugin_module('loader_core')
+shp_header = benchmark.plugin_module('shp_header')
+shp_scanner = benchmark.plugin_module('shp_scanner')
+scan_cache = benchmark.plugin_module('scan_cache')
+dbf_encoding = benchmark.plugin_module('dbf_encoding')
+field_filter = benchmark.plugin_module('field_filter')
+vrt_builder = benchmark.plugin_module('vrt_builder')
+
+PATTERN = 'N3_A0010000.shp'
+SHEET_COUNT = 6
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """시트 폴더 SHEET_COUNT개가 있는 합성 트리를 만듭니다 (절반은 .cpg 없음)."""
+    root = tmp_path / 'tree'
+    benchmark.generate_tree(str(root), SHEET_COUNT, 4, ['A0010000'])
+    return root
+
+
+def scan(root, **kwargs):
+    """트리를 스캔하여 경로 순으로 정렬한 ShpMatch 목록을 반환합니다."""
+    scanner = shp_scanner.ShpScanner([PATTERN], **kwargs)
+    return sorted(scanner.scan(str(root)), key=lambda match: match.path)
+
+
+def stream_results(loader, root):
+    """stream 결과를 시트마다 마지막 결과로 모아 {경로: 사유}를 반환합니다."""
+    return {result.match.path: result.reason for result in loader.stream(str(root))}
+
+
+def test_read_header_valid_sheet(tree):
+    match = scan(tree)[0]
+    header, reason = shp_header.read_header(match)
+    assert reason is None
+    assert header.shape_type == 5
+    assert header.record_count == 4
+    xmin, ymin, xmax, ymax = header.bbox
+    assert xmin < xmax and ymin < ymax
+
+
+def test_read_header_rejects_truncated_shx(tree):
+    match = scan(tree)[0]
+    shx_path = match.sidecars['.shx']
+    with open(shx_path, 'r+b') as f:
+        f.truncate(os.path.getsize(shx_path) - 3)
+    assert shp_header.read_header(match) == (None, shp_header.REASON_CORRUPT)
+
+
+def test_read_header_reports_missing_sidecar(tree):
+    match = scan(tree)[0]
+    os.remove(match.sidecars['.dbf'])
+    match = scan(tree)[0]
+    assert shp_header.read_header(match) == (None, shp_header.REASON_MISSING_SIDECAR)
+
+
+def test_scanner_finds_every_sheet(tree):
+    matches = scan(tree, max_workers=4)
+    assert len(matches) == SHEET_COUNT
+    assert all(match.name == f"{Path(match.path).parent.name}_N3_A0010000" for match in matches)
+    assert all({'.shx', '.dbf', '.prj'} <= set(match.sidecars) for match in matches)
+
+
+def test_scanner_regex_and_depth(tree):
+    scanner = shp_scanner.ShpScanner([r'n3_a00\d+\.shp'], use_regex=True)
+    assert len(list(scanner.scan(str(tree)))) == SHEET_COUNT
+    # 시트가 두 단계 아래에 있으면 깊이 1로는 찾지 못합니다.
+    nested = tree.parent / 'nested'
+    shutil.move(str(tree), str(nested / 'region'))
+    assert scan(nested) == []
+    assert len(scan(nested, max_depth=2)) == SHEET_COUNT
+
+
+def test_scanner_reads_sheets_inside_zip(tree):
+    folder = sorted(path for path in tree.iterdir() if path.is_dir())[0]
+    zip_path = tree / f"{folder.name}.zip"
+    with zipfile.ZipFile(zip_path, 'w') as archive:
+        for path in folder.iterdir():
+            archive.write(path, f"{folder.name}/{path.name}")
+    shutil.rmtree(folder)
+
+    assert len(scan(tree)) == SHEET_COUNT - 1
+    matches = scan(tree, scan_zips=True)
+    zipped = [match for match in matches if shp_scanner.split_vsizip(match.path) is not None]
+    assert len(matches) == SHEET_COUNT and len(zipped) == 1
+    header, reason = shp_header.read_header(zipped[0])
+    assert reason is None and header.record_count == 4
+
+
+def test_safe_file_name_replaces_pattern_symbols():
+    assert shp_scanner.safe_file_name('지형도_*_A0010000') == '지형도_A0010000'
+    assert shp_scanner.safe_file_name('지형도_n3_a00\\d+\\') == '지형도_n3_a00_d'
+    assert shp_scanner.safe_file_name('?*') == 'output'
+
+
+def test_manifest_reuses_listings_and_stat_files_sees_rewrites(tree, tmp_path):
+    db_path = str(tmp_path / 'cache' / 'scan_cache.sqlite')
+
+    def cached_scan(stat_files=False):
+        manifest = scan_cache.ScanManifest(db_path, str(tree))
+        manifest.load()
+        matches = scan(tree, manifest=manifest, stat_files=stat_files)
+        manifest.save()
+        return manifest, {match.path: match.mtime_ns for match in matches}
+
+    first, before = cached_scan()
+    assert first.hit_count == 0
+    # 폴더 항목은 그대로 두고 시트 하나만 제자리에서 덮어씁니다.
+    path = sorted(before)[0]
+    os.utime(path, ns=(time.time_ns(), before[path] + 10 ** 9))
+
+    second, cached = cached_scan()
+    assert second.hit_count > 0
+    assert cached == before
+    _, fresh = cached_scan(stat_files=True)
+    assert fresh[path] == before[path] + 10 ** 9
+
+
+class FailingFactory(loader_core.LayerFactory):
+    """필터 조건 오류나 네트워크 오류처럼 열기에 실패하는 팩토리입니다."""
+
+    def create(self, match, header, encoding):
+        return None
+
+
+def test_manifest_does_not_remember_open_failures(tree, tmp_path):
+    db_path = str(tmp_path / 'cache' / 'scan_cache.sqlite')
+
+    def cached_stream(factory):
+        manifest = scan_cache.ScanManifest(db_path, str(tree))
+        manifest.load()
+        loader = loader_core.SheetLoader(shp_scanner.ShpScanner([PATTERN], manifest=manifest), factory)
+        results = stream_results(loader, tree)
+        manifest.save()
+        return results
+
+    failed = cached_stream(FailingFactory())
+    assert set(failed.values()) == {shp_header.REASON_OPEN_FAILED}
+    assert set(cached_stream(loader_core.HeaderLayerFactory()).values()) == {None}
+
+
+def test_encoding_detector_uses_cpg_or_sniffs(tree):
+    detector = dbf_encoding.EncodingDetector()
+    matches = scan(tree)
+    assert any('.cpg' not in match.sidecars for match in matches)
+    assert {detector.detect(match) for match in matches} == {'CP949'}
+    assert dbf_encoding.sniff_dbf(matches[0]) == 'CP949'
+    assert dbf_encoding.normalize_encoding(' utf8\n') == 'UTF-8'
+    assert dbf_encoding.normalize_encoding('949') == 'CP949'
+
+
+def test_field_filter_sql(tree):
+    match = scan(tree)[0]
+    sql = field_filter.FieldFilter(['name', 'missing'], "ID > 2").sql(match, 'CP949')
+    assert sql == 'SELECT "NAME" FROM "N3_A0010000" WHERE ID > 2'
+    assert field_filter.FieldFilter().sql(match) == 'SELECT * FROM "N3_A0010000"'
+    assert field_filter.split_fields("ID, name  NAME") == ['ID', 'name']
+    names = ['ID', 'NAME', 'KIND', 'Note']
+    where = "id > 2 AND \"Note\" IS NOT NULL AND NAME <> 'kind'"
+    assert field_filter.where_fields(where, names) == ['ID', 'NAME', 'Note']
+    assert field_filter.where_fields(None, names) == []
+
+
+def test_field_filter_reports_unmatched_fields(tree):
+    match = scan(tree)[0]
+    fields = field_filter.FieldFilter(['missing'])
+    assert fields.sql(match) == 'SELECT * FROM "N3_A0010000"'
+    assert fields.missing == {'missing': 1}
+    assert fields.unmatched_count == 1
+
+
+def test_sheet_loader_skips_known_sheets(tree):
+    matches = scan(tree)
+    known = {match.path: (match.size, match.mtime_ns) for match in matches[:4]}
+    loader = loader_core.SheetLoader(shp_scanner.ShpScanner([PATTERN]), known=known)
+    results = stream_results(loader, tree)
+    assert len(loader.matches) == SHEET_COUNT
+    assert sorted(results) == [match.path for match in matches[4:]]
+
+
+def test_sheet_loader_keeps_lowest_path_per_duplicate(tree, tmp_path):
+    root = tmp_path / 'copies'
+    shutil.copytree(tree, root / 'b')
+    shutil.copytree(tree, root / 'a')
+    for _ in range(3):
+        loader = loader_core.SheetLoader(
+            shp_scanner.ShpScanner([PATTERN], max_depth=2), max_workers=8, skip_duplicates=True)
+        results = stream_results(loader, root)
+        kept = sorted(path for path, reason in results.items() if reason is None)
+        assert len(kept) == SHEET_COUNT
+        assert all(Path(path).relative_to(root).parts[0] == 'a' for path in kept)
+        assert [Path(path).relative_to(root).parts[0] for path, _ in loader.duplicates] == ['b'] * SHEET_COUNT
+
+
+def test_build_union_vrt(tree, tmp_path):
+    matches = scan(tree)
+    vrt_path = vrt_builder.build_union_vrt(
+        str(tmp_path / 'vrt' / 'union.vrt'), matches, 'union',
+        encodings={matches[0].path: 'CP949'},
+        subsets={matches[1].path: 'SELECT * FROM "N3_A0010000"'})
+
+    union = ET.parse(vrt_path).getroot().find('OGRVRTUnionLayer')
+    assert union.get('name') == 'union'
+    assert union.findtext('SourceLayerFieldName') == 'source_sheet'
+    layers = union.findall('OGRVRTLayer')
+    assert [layer.findtext('SrcDataSource') for layer in layers] == [match.path for match in matches]
+    assert layers[0].find('OpenOptions/OOI').text == 'CP949'
+    assert layers[1].findtext('SrcSQL') == 'SELECT * FROM "N3_A0010000"'
+    assert layers[2].findtext('SrcLayer') == 'N3_A0010000'
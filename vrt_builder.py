@@ -0,0 +1,45 @@
+import os
+import xml.etree.ElementTree as ET
+
+
+def build_union_vrt(vrt_path, matches, layer_name, source_field='source_sheet', encodings=None,
+                    subsets=None):
+    """검색된 Shapefile을 모두 참조하는 OGR VRT 통합 레이어 파일을 만듭니다.
+
+    데이터를 복사하지 않고 <OGRVRTUnionLayer> 하나로 묶으며,
+    각 객체의 원본 시트 이름은 source_field 필드에 기록됩니다.
+
+    Args:
+        vrt_path: 생성할 .vrt 파일 경로
+        matches: ShpMatch 목록
+        layer_name: 통합 레이어 이름
+        source_field: 원본 시트 이름을 담을 필드 이름
+        encodings: 시트 경로별 .dbf 인코딩 {경로: 인코딩} (선택)
+        subsets: 시트 경로별 OGR SQL SELECT 문 {경로: SQL} (선택, 필드·속성 필터)
+
+    Returns:
+        str: 생성된 .vrt 파일 경로
+    """
+    root = ET.Element('OGRVRTDataSource')
+    union = ET.SubElement(root, 'OGRVRTUnionLayer', name=layer_name)
+    ET.SubElement(union, 'SourceLayerFieldName').text = source_field
+
+    for match in matches:
+        # 시트 레이어 이름이 source_field 값이 됩니다.
+        sheet = ET.SubElement(union, 'OGRVRTLayer', name=match.name)
+        source = ET.SubElement(sheet, 'SrcDataSource', relativeToVRT='0')
+        source.text = match.path
+        subset = (subsets or {}).get(match.path)
+        if subset:
+            # 필드 선택과 속성 조건은 OGR이 원본 시트를 읽을 때 적용합니다.
+            ET.SubElement(sheet, 'SrcSQL', dialect='OGRSQL').text = subset
+        else:
+            ET.SubElement(sheet, 'SrcLayer').text = os.path.splitext(os.path.basename(match.path))[0]
+        encoding = (encodings or {}).get(match.path)
+        if encoding:
+            options = ET.SubElement(sheet, 'OpenOptions')
+            ET.SubElement(options, 'OOI', key='ENCODING').text = encoding
+
+    os.makedirs(os.path.dirname(vrt_path), exist_ok=True)
+    ET.ElementTree(root).write(vrt_path, encoding='utf-8', xml_declaration=True)
+    return vrt_path
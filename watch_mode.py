@@ -0,0 +1,107 @@
+import os
+import threading
+from qgis.PyQt.QtCore import QFileSystemWatcher, QObject, QTimer, pyqtSignal
+
+# QFileSystemWatcher로 감시할 최대 폴더 수 (나머지는 주기적 확인에 맡김)
+MAX_WATCHED_FOLDERS = 1000
+
+
+class SheetWatcher(QObject):
+    """상위 폴더에 새 시트가 들어오는지 감시하여 changed 신호를 보냅니다.
+
+    QFileSystemWatcher로 상위 폴더와 검색 깊이 안의 하위 폴더 변경 알림을 받고,
+    알림이 오지 않는 네트워크 드라이브를 위해 poll_interval마다 다시 확인합니다.
+    내려받기처럼 변경이 연속으로 일어나면 마지막 변경 후 debounce 밀리초가
+    지났을 때 한 번만 신호를 보냅니다. 감시할 하위 폴더 목록은 네트워크
+    드라이브에서 오래 걸릴 수 있으므로 작업 스레드에서 읽습니다.
+    """
+
+    changed = pyqtSignal()
+    # 작업 스레드에서 읽은 폴더 목록을 메인 스레드로 넘깁니다.
+    folders_found = pyqtSignal(list)
+
+    def __init__(self, root, max_depth=1, poll_interval=60000, debounce=5000, parent=None):
+        super(SheetWatcher, self).__init__(parent)
+        self.root = root
+        self.max_depth = max(1, max_depth)
+
+        self._listing = False
+        self._stopped = False
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.folders_found.connect(self.add_folders)
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.setInterval(debounce)
+        self.debounce_timer.timeout.connect(self.on_settled)
+
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(poll_interval)
+        self.poll_timer.timeout.connect(self.debounce_timer.start)
+
+        self.refresh_folders()
+        self.poll_timer.start()
+
+    def folders(self):
+        """감시할 폴더 목록 (상위 폴더와 검색 깊이 안의 하위 폴더)을 반환합니다."""
+        folders = [self.root]
+        level = [self.root]
+        for _ in range(self.max_depth):
+            next_level = []
+            for folder in level:
+                try:
+                    with os.scandir(folder) as entries:
+                        next_level.extend(entry.path for entry in entries if entry.is_dir())
+                except OSError:
+                    continue
+            folders.extend(next_level)
+            if len(folders) >= MAX_WATCHED_FOLDERS:
+                break
+            level = next_level
+        return folders[:MAX_WATCHED_FOLDERS]
+
+    def refresh_folders(self):
+        """감시할 폴더 목록을 작업 스레드에서 다시 읽습니다. 이미 읽는 중이면 무시합니다."""
+        if self._listing or self._stopped:
+            return
+        self._listing = True
+        threading.Thread(target=self.list_folders, daemon=True).start()
+
+    def list_folders(self):
+        """작업 스레드에서 실행됩니다. 읽은 폴더 목록을 folders_found로 보냅니다."""
+        folders = self.folders()
+        try:
+            self.folders_found.emit(folders)
+        except RuntimeError:
+            # 읽는 동안 감시 객체가 삭제되었습니다.
+            pass
+
+    def add_folders(self, folders):
+        """새로 생긴 하위 폴더를 감시 대상에 추가합니다."""
+        self._listing = False
+        if self._stopped:
+            return
+        watched = set(self.watcher.directories())
+        new_folders = [folder for folder in folders if folder not in watched]
+        if new_folders:
+            self.watcher.addPaths(new_folders)
+
+    def on_directory_changed(self, path):
+        """폴더 변경 알림을 받으면 대기 시간을 다시 시작합니다."""
+        self.debounce_timer.start()
+
+    def on_settled(self):
+        """변경이 멈추면 changed 신호를 보내고 감시할 폴더 목록을 다시 읽습니다."""
+        self.refresh_folders()
+        self.changed.emit()
+
+    def stop(self):
+        """감시를 멈춥니다."""
+        self._stopped = True
+        self.poll_timer.stop()
+        self.debounce_timer.stop()
+        directories = self.watcher.directories()
+        if directories:
+            self.watcher.removePaths(directories)